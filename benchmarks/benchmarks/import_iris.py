@@ -6,6 +6,8 @@
 """Import iris benchmarking."""
 
 from importlib import import_module, reload
+import subprocess
+import sys
 
 ################
 # Prepare info for reset_colormaps:
@@ -276,3 +278,49 @@ class Iris:
 
     def time_third_party_scipy(self):
         self._import("scipy")
+
+
+class IrisColdImport:
+    """Import costs *including* dependencies, each in a fresh interpreter.
+
+    Complements :class:`Iris`, which only times the body of each module, since
+    the (already imported) dependencies are not re-imported by reload().  This
+    catches changes which make a module import more, or heavier, dependencies,
+    e.g. a lost lazy import.
+    """
+
+    params = [
+        "iris",
+        "iris.cube",
+        "iris.fileformats",
+        "iris.fileformats.netcdf",
+        "iris.fileformats.pp",
+        "iris.mesh",
+    ]
+    param_names = ["module"]
+
+    @staticmethod
+    def _run(code):
+        return subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+
+    def track_import_time(self, module_name):
+        # The cumulative time of the final (top-level) import, in microseconds.
+        result = self._run(f"import {module_name}")
+        last_line = result.stderr.strip().splitlines()[-1]
+        return int(last_line.split("|")[1])
+
+    track_import_time.unit = "microseconds"  # type: ignore[attr-defined]
+
+    def track_n_modules_imported(self, module_name):
+        code = (
+            "import sys; n_start = len(sys.modules); "
+            f"import {module_name}; print(len(sys.modules) - n_start)"
+        )
+        return int(self._run(code).stdout)
+
+    track_n_modules_imported.unit = "modules"  # type: ignore[attr-defined]
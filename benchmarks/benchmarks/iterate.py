@@ -24,3 +24,33 @@ class IZip:
 
     def time_izip(self):
         iterate.izip(self.cube, coords=self.coord_names)
+
+
+class Slices:
+    params = [[True, False]]
+    param_names = ["Copy slices"]
+
+    def setup(self, copy):
+        n_slices = 1000
+        data_3d = np.zeros((n_slices, 10, 20))
+        local_cube = cube.Cube(data_3d, long_name="x")
+        for dim, length in enumerate(data_3d.shape):
+            dim_coord = coords.DimCoord(np.arange(length), long_name=f"dim_{dim}")
+            local_cube.add_dim_coord(dim_coord, dim)
+        aux_coord = coords.AuxCoord(np.arange(n_slices), long_name="aux")
+        local_cube.add_aux_coord(aux_coord, 0)
+        surface_coord = coords.AuxCoord(data_3d[0], long_name="surface")
+        local_cube.add_aux_coord(surface_coord, (1, 2))
+        self.cube = local_cube
+
+    def time_slices(self, copy):
+        for _ in self.cube.slices(["dim_1", "dim_2"], copy=copy):
+            pass
+
+    def time_slices_transposed(self, copy):
+        for _ in self.cube.slices(["dim_2", "dim_1"], copy=copy):
+            pass
+
+    def time_slices_over(self, copy):
+        for _ in self.cube.slices_over("dim_0", copy=copy):
+            pass
@@ -132,6 +132,59 @@ class ManyVars:
         _ = load(str(self.FILE_PATH))
 
 
+class ChunkAccess:
+    """Compare realise times of sub-regions, for each chunk access pattern."""
+
+    FILE_PATH = BENCHMARK_DATA / "chunk_access_file.nc"
+    params = (["timeseries", "spatial", "balanced"], ["timeseries", "spatial"])
+    param_names = ["chunk_access", "region"]
+
+    @staticmethod
+    def _create_file(save_path: str) -> None:
+        """Run externally - everything must be self-contained."""
+        import numpy as np
+
+        from iris import save
+        from iris.coords import DimCoord
+        from iris.cube import Cube
+
+        shape = (200, 200, 200)
+        data = np.arange(np.prod(shape), dtype=np.float32).reshape(shape)
+        cube = Cube(data, long_name="data", units="1")
+        for dim, name in enumerate(["time", "grid_latitude", "grid_longitude"]):
+            coord = DimCoord(np.arange(shape[dim]), long_name=name, units="1")
+            cube.add_dim_coord(coord, dim)
+        save(cube, save_path)
+
+    def setup_cache(self) -> None:
+        if not REUSE_DATA or not self.FILE_PATH.is_file():
+            # See :mod:`benchmarks.generate_data` docstring for full explanation.
+            _ = run_function_elsewhere(
+                self._create_file,
+                str(self.FILE_PATH),
+            )
+
+    def setup(self, chunk_access: str, region: str) -> None:
+        import dask.config
+
+        from iris.fileformats.netcdf.loader import CHUNK_CONTROL
+
+        # A chunk limit smaller than the data, so that chunking matters.
+        self.dask_config = dask.config.set({"array.chunk-size": "4MiB"})
+        with CHUNK_CONTROL.access(chunk_access):
+            cube = load_cube(str(self.FILE_PATH))
+        if region == "timeseries":
+            self.region = cube[:, 100, 100]
+        else:
+            self.region = cube[100]
+
+    def teardown(self, _, __) -> None:
+        self.dask_config.__exit__(None, None, None)
+
+    def time_realise(self, _, __) -> None:
+        self.region.core_data().compute()
+
+
 class StructuredFF:
     """Test structured loading of a large-ish fieldsfile.
 
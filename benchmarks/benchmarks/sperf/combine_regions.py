@@ -29,7 +29,7 @@ class Mixin:
     def _parametrised_cache_filename(self, n_cubesphere, content_name):
         return BENCHMARK_DATA / f"cube_C{n_cubesphere}_{content_name}.nc"
 
-    def _make_region_cubes(self, full_mesh_cube):
+    def _make_region_cubes(self, full_mesh_cube, n_regions=7):
         """Make a fixed number of region cubes from a full meshcube."""
         # Divide the cube into regions.
         n_faces = full_mesh_cube.shape[-1]
@@ -47,15 +47,14 @@ class Mixin:
         i_faces = i_faces[:n_faces] % n_faces
 
         # Divide into regions -- always slightly uneven, since 7 doesn't divide
-        n_regions = 7
         n_facesperregion = n_faces // n_regions
         i_face_regions = (i_faces // n_facesperregion) % n_regions
         region_inds = [
             np.where(i_face_regions == i_region)[0] for i_region in range(n_regions)
         ]
-        # NOTE: this produces 7 regions, with near-adjacent value ranges but
+        # NOTE: this produces N regions, with near-adjacent value ranges but
         # with some points "moved" to an adjacent region.
-        # Also, region-0 is bigger (because of not dividing by 7).
+        # Also, region-0 is bigger (because of not dividing exactly).
 
         # Finally, make region cubes with these indices.
         region_cubes = [full_mesh_cube[..., inds] for inds in region_inds]
@@ -232,3 +231,57 @@ class FileStreamedCalc(Mixin):
 
     def tracemalloc_stream_file2file(self, n_cubesphere):
         self.save_recombined_cube()
+
+
+@on_demand_benchmark
+class ManyRegions(Mixin):
+    """Time+memory costs of combining many regions into a fixed-size mesh.
+
+    Scaling with the number of regions, as for combining the outputs of many
+    parallel model partitions.
+
+    """
+
+    n_cubesphere = 300
+    params = [7, 100, 300, 1000]
+    param_names = ["n_regions"]
+
+    def _parametrised_cache_filename(self, n_regions, content_name):
+        return (
+            BENCHMARK_DATA / f"cube_C{self.n_cubesphere}_R{n_regions}_{content_name}.nc"
+        )
+
+    def setup_cache(self):
+        """Cache all the necessary source data on disk."""
+        self.fix_dask_settings()
+
+        mesh_cube = make_cube_like_2d_cubesphere(
+            n_cube=self.n_cubesphere, with_mesh=True
+        )
+        for n_regions in self.params:
+            save(
+                mesh_cube,
+                self._parametrised_cache_filename(n_regions, "meshcube"),
+            )
+            region_cubes = self._make_region_cubes(mesh_cube, n_regions)
+            save(
+                region_cubes,
+                self._parametrised_cache_filename(n_regions, "regioncubes"),
+            )
+
+    def time_create_combined_cube(self, n_regions):
+        self.recombine()
+
+    def tracemalloc_create_combined_cube(self, n_regions):
+        self.recombine()
+
+    def time_compute_data(self, n_regions):
+        _ = self.recombined_cube.data
+
+    def tracemalloc_compute_data(self, n_regions):
+        _ = self.recombined_cube.data
+
+    def track_n_graph_tasks(self, n_regions):
+        return len(self.recombined_cube.lazy_data().__dask_graph__())
+
+    track_n_graph_tasks.unit = "tasks"
@@ -4,6 +4,8 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Small-scope metadata manager factory benchmark tests."""
 
+import numpy as np
+
 from iris.common import (
     AncillaryVariableMetadata,
     BaseMetadata,
@@ -13,6 +15,7 @@ from iris.common import (
     DimCoordMetadata,
     metadata_manager_factory,
 )
+from iris.cube import CubeAttrsDict
 
 
 class MetadataManagerFactory__create:
@@ -81,3 +84,35 @@ class MetadataManagerFactory:
 
     def time_DimCoordMetadata_values(self):
         self.dim.values
+
+
+class MetadataCompare:
+    params = [None, False, True]
+    param_names = ["lenient"]
+
+    def setup(self, lenient):
+        def cube(attributes):
+            return CubeMetadata("air_temperature", None, "tas", "K", attributes, ())
+
+        def dim(circular):
+            return DimCoordMetadata(
+                "latitude", None, "lat", "degrees", {}, None, False, circular
+            )
+
+        attributes = CubeAttrsDict(
+            globals=dict(Conventions="CF-1.7", source="model"),
+            locals=dict(history="created", levels=np.arange(100)),
+        )
+        self.cube = cube(attributes)
+        self.cube_other = cube(attributes.copy())
+        self.dim = dim(False)
+        self.dim_other = dim(True)
+
+    def time_CubeMetadata_equal(self, lenient):
+        self.cube.equal(self.cube_other, lenient=lenient)
+
+    def time_CubeMetadata_equal_self(self, lenient):
+        self.cube.equal(self.cube, lenient=lenient)
+
+    def time_DimCoordMetadata_equal(self, lenient):
+        self.dim.equal(self.dim_other, lenient=lenient)
@@ -96,7 +96,6 @@ import os.path
 import threading
 from typing import Callable, Literal
 
-import iris._constraints
 import iris.config
 import iris.io
 
@@ -133,9 +132,41 @@ __all__ = [
 ]
 
 
-Constraint = iris._constraints.Constraint
-AttributeConstraint = iris._constraints.AttributeConstraint
-NameConstraint = iris._constraints.NameConstraint
+# Names which are imported from submodules only when first accessed, so that
+# "import iris" does not import numpy or other heavy dependencies.
+_LAZY_NAMES = {
+    "AttributeConstraint": "iris._constraints",
+    "Constraint": "iris._constraints",
+    "NameConstraint": "iris._constraints",
+}
+
+# The submodules which are always available as attributes after "import iris",
+# though they may only be imported when first accessed.
+_LAZY_SUBMODULES = ("_constraints", "config", "exceptions", "io", "warnings")
+
+
+def __getattr__(name):
+    """Lazily import the constraint classes, and their submodule.
+
+    See :pep:`562`.  This means that, for example, ``iris.Constraint`` is
+    available after only ``import iris``, but :mod:`iris._constraints`, and
+    so numpy, is not imported unless it is used.  Other submodules are only
+    available once they have been imported, as usual.
+
+    """
+    if name in _LAZY_NAMES:
+        result = getattr(importlib.import_module(_LAZY_NAMES[name]), name)
+    elif name in _LAZY_SUBMODULES:
+        # N.B. importing a submodule also sets it as an attribute of iris.
+        result = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = result
+    return result
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES) | set(_LAZY_SUBMODULES))
 
 
 class Future(threading.local):
@@ -351,7 +382,9 @@ def load_cube(uris, constraint=None, callback=None):
     :class:`iris.cube.Cube`
 
     """
-    constraints = iris._constraints.list_of_constraints(constraint)
+    from iris._constraints import list_of_constraints
+
+    constraints = list_of_constraints(constraint)
     if len(constraints) != 1:
         raise ValueError("only a single constraint is allowed")
 
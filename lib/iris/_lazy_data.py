@@ -206,6 +206,10 @@ def _optimum_chunksize_internals(
     return result
 
 
+#: The supported values of the 'access' argument of :func:`as_lazy_data`.
+_CHUNK_ACCESS_PATTERNS = ("timeseries", "spatial", "balanced")
+
+
 @wraps(_optimum_chunksize_internals)
 def _optimum_chunksize(
     chunks,
@@ -213,21 +217,61 @@ def _optimum_chunksize(
     limit=None,
     dtype=np.dtype("f4"),
     dims_fixed=None,
+    access=None,
 ):
+    chunks = tuple(chunks)
+    shape = tuple(shape)
+    if dims_fixed is not None and len(dims_fixed) != len(shape):
+        # N.B. the netcdf loader passes "(None,)" for no fixed dims.
+        dims_fixed = None
+    if access not in (None,) + _CHUNK_ACCESS_PATTERNS:
+        msg = (
+            f"Unknown chunk access pattern {access!r}, expected one of "
+            f"{_CHUNK_ACCESS_PATTERNS}."
+        )
+        raise ValueError(msg)
+
+    if access == "balanced":
+        # Scale all the free dims together, in multiples of the given chunks.
+        if limit is None:
+            limit = dask.utils.parse_bytes(dask.config.get("array.chunk-size"))
+        if dims_fixed is None:
+            dims_fixed = (False,) * len(shape)
+        auto_chunks = tuple(
+            chunk if fixed else "auto" for chunk, fixed in zip(chunks, dims_fixed)
+        )
+        result = da.core.normalize_chunks(
+            auto_chunks, shape, limit=limit, dtype=dtype, previous_chunks=chunks
+        )
+        return tuple(dim_chunks[0] for dim_chunks in result)
+
+    if access == "timeseries":
+        # Apply the usual method to the reversed dims, so that the outer dims
+        # are expanded first and the inner ones are reduced first.
+        chunks = chunks[::-1]
+        shape = shape[::-1]
+        if dims_fixed is not None:
+            dims_fixed = tuple(dims_fixed)[::-1]
+
     # By providing dask_array_chunksize as an argument, we make it so that the
     # output of _optimum_chunksize_internals depends only on its arguments (and
     # thus we can use lru_cache)
-    return _optimum_chunksize_internals(
-        tuple(chunks),
-        tuple(shape),
+    result = _optimum_chunksize_internals(
+        chunks,
+        shape,
         limit=limit,
         dtype=dtype,
         dims_fixed=dims_fixed,
         dask_array_chunksize=dask.config.get("array.chunk-size"),
     )
+    if access == "timeseries":
+        result = tuple(result)[::-1]
+    return result
 
 
-def as_lazy_data(data, chunks=None, asarray=False, meta=None, dims_fixed=None):
+def as_lazy_data(
+    data, chunks=None, asarray=False, meta=None, dims_fixed=None, access=None
+):
     """Convert the input array `data` to a :class:`dask.array.Array`.
 
     Parameters
@@ -249,6 +293,20 @@ def as_lazy_data(data, chunks=None, asarray=False, meta=None, dims_fixed=None):
         If set, a list of values equal in length to 'chunks' or data.ndim.
         'True' values indicate a dimension which can not be changed, i.e. the
         result for that index must equal the value in 'chunks' or data.shape.
+    access : str, optional
+        The expected access pattern of the data, which the chunking favours.
+        One of:
+
+        * ``"spatial"`` : expand the inner dimensions first, and reduce the
+          outer ones first.  This is also the behaviour when `access` is
+          ``None``, and suits accessing whole horizontal fields.
+        * ``"timeseries"`` : expand the outer dimensions first, and reduce the
+          inner ones first.  This suits accessing long series of values at
+          each point, when the outer dimension is time.
+        * ``"balanced"`` : scale all the dimensions together.
+
+        In all cases, the result is based on multiples of 'chunks', which
+        are typically those of the file variable.
 
     Returns
     -------
@@ -289,6 +347,7 @@ def as_lazy_data(data, chunks=None, asarray=False, meta=None, dims_fixed=None):
                 shape=data.shape,
                 dtype=data.dtype,
                 dims_fixed=dims_fixed,
+                access=access,
             )
 
     if not is_lazy_data(data):
@@ -470,7 +529,59 @@ def multidim_lazy_stack(arr):
     return result
 
 
-def co_realise_cubes(*cubes):
+def _co_realise_data_managers(data_managers, max_bytes=None):
+    """Realise the lazy arrays of multiple data managers, in shared calculations.
+
+    Arrays which are the same (i.e. have the same dask name) are computed
+    only once.  Each data manager still receives its own result array.
+
+    Parameters
+    ----------
+    data_managers : iterable of :class:`iris._data_manager.DataManager`
+        The data managers to realise.  Any with real data are ignored.
+    max_bytes : int, optional
+        If set, the arrays are computed in batches, each of which has a total
+        result size of at most this many bytes, except where a single array
+        exceeds it.  Calculations are only shared within each batch.
+        By default, everything is computed in one pass.
+
+    """
+    # Group the managers by their (unique) lazy arrays.
+    managers_by_name = {}
+    arrays = []
+    seen = set()
+    for data_manager in data_managers:
+        if id(data_manager) in seen or not data_manager.has_lazy_data():
+            continue
+        seen.add(id(data_manager))
+        array = data_manager.core_data()
+        if array.name not in managers_by_name:
+            managers_by_name[array.name] = []
+            arrays.append(array)
+        managers_by_name[array.name].append(data_manager)
+
+    # Divide the arrays into batches, keeping the original order.
+    batches = [[]]
+    batch_bytes = 0
+    for array in arrays:
+        nbytes = array.nbytes
+        if max_bytes is not None and batches[-1] and batch_bytes + nbytes > max_bytes:
+            batches.append([])
+            batch_bytes = 0
+        batches[-1].append(array)
+        batch_bytes += nbytes
+
+    for batch in batches:
+        results = _co_realise_lazy_arrays(batch)
+        for array, result in zip(batch, results):
+            first, *others = managers_by_name[array.name]
+            first.data = result
+            for data_manager in others:
+                # Don't share the same result array between objects.
+                data_manager.data = result.copy()
+
+
+def co_realise_cubes(*cubes, metadata=False, max_bytes=None):
     """Fetch 'real' data for multiple cubes, in a shared calculation.
 
     This computes any lazy data, equivalent to accessing each `cube.data`.
@@ -481,6 +592,14 @@ def co_realise_cubes(*cubes):
     ----------
     cubes : list of :class:`~iris.cube.Cube`
         Arguments, each of which is a cube to be realised.
+    metadata : bool, default=False
+        If True, also realise any lazy points and bounds of the cube
+        coordinates, and any lazy cell measures and ancillary variables,
+        in the same calculation.
+    max_bytes : int, optional
+        If set, limit the total size of the results of each calculation,
+        by computing the lazy arrays in batches.  An array larger than this
+        is computed by itself.  By default, all arrays are computed together.
 
     Examples
     --------
@@ -501,10 +620,29 @@ def co_realise_cubes(*cubes):
 
             Cubes with non-lazy data may also be passed, with no ill effect.
 
+        .. note::
+
+            Derived coordinates, such as those of a
+            :class:`~iris.aux_factory.HybridHeightFactory`, are not stored on
+            the cube, so are not realised.  But with ``metadata=True``, the
+            coordinates they are derived from are realised.
+
     """
-    results = _co_realise_lazy_arrays([cube.core_data() for cube in cubes])
-    for cube, result in zip(cubes, results):
-        cube.data = result
+    data_managers = []
+    for cube in cubes:
+        data_managers.append(cube._data_manager)
+        if metadata:
+            components = (
+                cube.dim_coords
+                + cube.aux_coords
+                + tuple(cube.cell_measures())
+                + tuple(cube.ancillary_variables())
+            )
+            for component in components:
+                data_managers.append(component._values_dm)
+                if component._bounds_dm is not None:
+                    data_managers.append(component._bounds_dm)
+    _co_realise_data_managers(data_managers, max_bytes=max_bytes)
 
 
 def lazy_elementwise(lazy_array, elementwise_op):
@@ -55,6 +55,7 @@ import iris._lazy_data
 from iris.analysis._area_weighted import AreaWeightedRegridder
 from iris.analysis._interpolation import EXTRAPOLATION_MODES, RectilinearInterpolator
 from iris.analysis._regrid import CurvilinearRegridder, RectilinearRegridder
+import iris.analysis._rolling as _rolling
 import iris.coords
 from iris.coords import AuxCoord, DimCoord, _DimensionalMetadata
 from iris.exceptions import LazyAggregatorError
@@ -444,7 +445,13 @@ class _Aggregator:
     """Base class provides common aggregation functionality."""
 
     def __init__(
-        self, cell_method, call_func, units_func=None, lazy_func=None, **kwargs
+        self,
+        cell_method,
+        call_func,
+        units_func=None,
+        lazy_func=None,
+        rolling_func=None,
+        **kwargs,
     ):
         r"""Create an aggregator for the given :data:`call_func`.
 
@@ -482,9 +489,15 @@ class _Aggregator:
             An alternative to :data:`call_func` implementing a lazy
             aggregation. Note that, it need not support all features of the
             main operation, but should raise an error in unhandled cases.
+        rolling_func : callable or None, optional
+            Call signature: ``(data, window, axis=-1, mdtol=None, **kwargs)``.
+            An efficient alternative to aggregating the windows of
+            :meth:`~iris.cube.Cube.rolling_window`, for real and lazy data.
+            Returns the aggregation of every window of length 'window' along
+            the 'axis' dimension.  Not used for weighted aggregation.
         **kwargs : dict, optional
-            Passed through to :data:`call_func`, :data:`lazy_func`, and
-            :data:`units_func`.
+            Passed through to :data:`call_func`, :data:`lazy_func`,
+            :data:`rolling_func` and :data:`units_func`.
         """
         #: Cube cell method string.
         self.cell_method = cell_method
@@ -495,6 +508,10 @@ class _Aggregator:
         #: Lazy aggregation function, may be None to indicate that a lazy
         #: operation is not available.
         self.lazy_func = lazy_func
+        #: Rolling window aggregation function, may be None to indicate that
+        #: the windows are aggregated with :data:`call_func` or
+        #: :data:`lazy_func`.
+        self.rolling_func = rolling_func
 
         self._kwargs = kwargs
 
@@ -537,6 +554,38 @@ class _Aggregator:
 
         return self.lazy_func(data, axis=axis, **kwargs)
 
+    def rolling_aggregate(self, data, window, axis, **kwargs):
+        """Perform aggregation over every window of the data along an axis.
+
+        The result is equivalent to the 'aggregate' or 'lazy_aggregate'
+        result for the rolling window view of the data, as made by
+        :func:`iris.util.rolling_window`, but without making that view.
+
+        Parameters
+        ----------
+        data : array
+            Data array, which may be lazy.
+        window : int
+            Length of the windows.
+        axis : int
+            Axis to aggregate the windows along.
+        **kwargs : dict, optional
+            All keyword arguments are passed through to the rolling window
+            aggregation function.
+
+        Returns
+        -------
+        The aggregated data, which is lazy if the data is lazy.
+
+        """
+        if self.rolling_func is None:
+            msg = "{} aggregator does not support rolling window aggregation."
+            raise ValueError(msg.format(self.name()))
+
+        kwargs = dict(list(self._kwargs.items()) + list(kwargs.items()))
+
+        return self.rolling_func(data, window, axis=axis, **kwargs)
+
     def aggregate(self, data, axis, **kwargs):
         """Perform the aggregation function given the data.
 
@@ -1038,7 +1087,13 @@ class WeightedAggregator(Aggregator):
     """Convenience class that supports common weighted aggregation functionality."""
 
     def __init__(
-        self, cell_method, call_func, units_func=None, lazy_func=None, **kwargs
+        self,
+        cell_method,
+        call_func,
+        units_func=None,
+        lazy_func=None,
+        rolling_func=None,
+        **kwargs,
     ):
         r"""Create a weighted aggregator for the given :data:`call_func`.
 
@@ -1072,9 +1127,14 @@ class WeightedAggregator(Aggregator):
             An alternative to :data:`call_func` implementing a lazy
             aggregation. Note that, it need not support all features of the
             main operation, but should raise an error in unhandled cases.
+        rolling_func : callable, optional
+            An efficient alternative to aggregating the windows of
+            :meth:`~iris.cube.Cube.rolling_window`, for real and lazy data,
+            which is only used without weighting.  See
+            :class:`~iris.analysis.Aggregator`.
         **kwargs : dict, optional
-            Passed through to :data:`call_func`, :data:`lazy_func`, and
-            :data:`units_func`.
+            Passed through to :data:`call_func`, :data:`lazy_func`,
+            :data:`rolling_func` and :data:`units_func`.
 
         """
         Aggregator.__init__(
@@ -1083,6 +1143,7 @@ class WeightedAggregator(Aggregator):
             call_func,
             units_func=units_func,
             lazy_func=lazy_func,
+            rolling_func=rolling_func,
             **kwargs,
         )
 
@@ -1788,6 +1849,7 @@ COUNT = Aggregator(
     _count,
     units_func=lambda units, **kwargs: 1,
     lazy_func=_build_dask_mdtol_function(_count),
+    rolling_func=_rolling.rolling_count,
 )
 """
 An :class:`~iris.analysis.Aggregator` instance that counts the number
@@ -1891,7 +1953,10 @@ This aggregator handles masked data, but NOT lazy data.
 
 
 MEAN = WeightedAggregator(
-    "mean", ma.average, lazy_func=_build_dask_mdtol_function(da.ma.average)
+    "mean",
+    ma.average,
+    lazy_func=_build_dask_mdtol_function(da.ma.average),
+    rolling_func=_rolling.rolling_mean,
 )
 """
 An :class:`~iris.analysis.Aggregator` instance that calculates
@@ -1958,7 +2023,12 @@ please try :obj:`~.PERCENTILE`.
 """
 
 
-MIN = Aggregator("minimum", ma.min, lazy_func=_build_dask_mdtol_function(da.min))
+MIN = Aggregator(
+    "minimum",
+    ma.min,
+    lazy_func=_build_dask_mdtol_function(da.min),
+    rolling_func=_rolling.rolling_min,
+)
 """
 An :class:`~iris.analysis.Aggregator` instance that calculates
 the minimum over a :class:`~iris.cube.Cube`, as computed by
@@ -1975,7 +2045,12 @@ This aggregator handles masked data and lazy data.
 """
 
 
-MAX = Aggregator("maximum", ma.max, lazy_func=_build_dask_mdtol_function(da.max))
+MAX = Aggregator(
+    "maximum",
+    ma.max,
+    lazy_func=_build_dask_mdtol_function(da.max),
+    rolling_func=_rolling.rolling_max,
+)
 """
 An :class:`~iris.analysis.Aggregator` instance that calculates
 the maximum over a :class:`~iris.cube.Cube`, as computed by
@@ -2166,6 +2241,7 @@ SUM = WeightedAggregator(
     _sum,
     units_func=_sum_units_func,
     lazy_func=_build_dask_mdtol_function(_sum),
+    rolling_func=_rolling.rolling_sum,
 )
 """
 An :class:`~iris.analysis.Aggregator` instance that calculates
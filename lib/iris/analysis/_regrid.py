@@ -3,18 +3,20 @@
 # This file is part of Iris and is released under the BSD license.
 # See LICENSE in the root of the repository for full licensing details.
 
+from collections import namedtuple
 import copy
 import functools
 import warnings
 
 import numpy as np
 import numpy.ma as ma
-from scipy.sparse import csc_matrix
+from scipy.sparse import csc_matrix, csr_matrix
 
 from iris._lazy_data import map_complete_blocks
 from iris.analysis._interpolation import (
     EXTRAPOLATION_MODES,
-    extend_circular_coord_and_data,
+    extend_circular_coord,
+    extend_circular_data,
     get_xy_dim_coords,
     snapshot_grid,
 )
@@ -22,6 +24,19 @@ from iris.analysis._scipy_interpolate import _RegularGridInterpolator
 from iris.util import _meshgrid, guess_coord_axis
 from iris.warnings import IrisImpossibleUpdateWarning
 
+#: The approximate size of the blocks of data which are interpolated together
+#: by :meth:`RectilinearRegridder._regrid`.
+_INTERPOLATION_BLOCK_BYTES = 2**18
+
+#: The weights calculated by :meth:`RectilinearRegridder._regrid__prepare`.
+_RegridInfo = namedtuple(
+    "_RegridInfo",
+    "reverse_x reverse_y circular y_first weights out_of_bounds",
+)
+
+#: Statistics of the weights cache of a :class:`RectilinearRegridder`.
+RegridderCacheInfo = namedtuple("RegridderCacheInfo", "hits misses currsize")
+
 
 def _transform_xy_arrays(crs_from, x, y, crs_to):
     """Transform 2d points between cartopy coordinate reference systems.
@@ -547,6 +562,14 @@ class RectilinearRegridder:
             msg = "Invalid extrapolation mode {!r}"
             raise ValueError(msg.format(extrapolation_mode))
         self._extrapolation_mode = extrapolation_mode
+        # The regridding weights, which only depend on the order of the
+        # source grid dimensions, as the source and target grids are fixed.
+        self._weights_cache = {}
+        # The target grid points in the source coordinate system, as a pair
+        # of (source coordinate system, sample grid), or None.
+        self._sample_grid_cache = None
+        self._cache_hits = 0
+        self._cache_misses = 0
 
     @property
     def method(self):
@@ -556,6 +579,64 @@ class RectilinearRegridder:
     def extrapolation_mode(self):
         return self._extrapolation_mode
 
+    def cache_info(self):
+        """Report the statistics of the regridding weights cache.
+
+        The regridding weights are calculated when first needed, and re-used
+        by all subsequent regrids with the same order of source grid
+        dimensions.
+
+        Returns
+        -------
+        :class:`RegridderCacheInfo`
+            A named tuple of the number of ``hits`` and ``misses`` of the
+            cache, and its current size, ``currsize``.
+
+        """
+        return RegridderCacheInfo(
+            self._cache_hits, self._cache_misses, len(self._weights_cache)
+        )
+
+    def cache_clear(self):
+        """Clear the regridding weights cache, and its statistics."""
+        self._weights_cache.clear()
+        self._sample_grid_cache = None
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    def _regrid_info(self, src_x_coord, src_y_coord, sample_grid, y_first):
+        # Fetch or calculate the regridding weights.
+        # N.B. the source coordinates are those of the source grid, and the
+        # sample grid is calculated from the target grid.
+        regrid_info = self._weights_cache.get(y_first)
+        if regrid_info is None:
+            self._cache_misses += 1
+            regrid_info = self._regrid__prepare(
+                src_x_coord,
+                src_y_coord,
+                *sample_grid,
+                method=self._method,
+                y_first=y_first,
+            )
+            self._weights_cache[y_first] = regrid_info
+        else:
+            self._cache_hits += 1
+        return regrid_info
+
+    def _cached_sample_grid(self, src_coord_system):
+        # Fetch or calculate the target grid in the source coordinate system.
+        # N.B. this may involve a costly projection of every target point.
+        cached = self._sample_grid_cache
+        if cached is not None and cached[0] == src_coord_system:
+            sample_grid = cached[1]
+        else:
+            grid_x_coord, grid_y_coord = self._tgt_grid
+            sample_grid = self._sample_grid(
+                src_coord_system, grid_x_coord, grid_y_coord
+            )
+            self._sample_grid_cache = (src_coord_system, sample_grid)
+        return sample_grid
+
     @staticmethod
     def _sample_grid(src_coord_system, grid_x_coord, grid_y_coord):
         """Convert the rectilinear grid to a curvilinear grid.
@@ -607,6 +688,7 @@ class RectilinearRegridder:
         sample_grid_y,
         method="linear",
         extrapolation_mode="nanmask",
+        regrid_info=None,
     ):
         """Regrid the given data from the src grid to the sample grid.
 
@@ -656,6 +738,10 @@ class RectilinearRegridder:
               set to NaN.
 
             The default mode of extrapolation is 'nanmask'.
+        regrid_info : optional
+            The result of :meth:`_regrid__prepare`, for the same source and
+            sample grids, method and dimension order.  If not given, it is
+            calculated.
 
         Returns
         -------
@@ -669,10 +755,10 @@ class RectilinearRegridder:
         # XXX: At the moment requires to be a static method as used by
         # experimental regrid_area_weighted_rectilinear_src_and_grid
         #
-        if sample_grid_x.shape != sample_grid_y.shape:
-            raise ValueError("Inconsistent sample grid shapes.")
-        if sample_grid_x.ndim != 2:
-            raise ValueError("Sample grid must be 2-dimensional.")
+        try:
+            mode = EXTRAPOLATION_MODES[extrapolation_mode]
+        except KeyError:
+            raise ValueError("Invalid extrapolation mode.")
 
         # Prepare the result data array
         shape = list(src_data.shape)
@@ -694,6 +780,25 @@ class RectilinearRegridder:
             y_dim = len(shape) - 1
             src_data = np.expand_dims(src_data, -1)
 
+        y_first = y_dim < x_dim
+        if regrid_info is None:
+            regrid_info = RectilinearRegridder._regrid__prepare(
+                src_x_coord,
+                src_y_coord,
+                sample_grid_x,
+                sample_grid_y,
+                method=method,
+                y_first=y_first,
+            )
+        elif regrid_info.y_first != y_first:
+            emsg = (
+                "The given 'regrid_info' is for a different order of the "
+                "source grid dimensions."
+            )
+            raise ValueError(emsg)
+        if mode.bounds_error and np.any(regrid_info.out_of_bounds):
+            raise ValueError("One of the requested xi is out of bounds.")
+
         dtype = src_data.dtype
         if method == "linear":
             # If we're given integer values, convert them to the smallest
@@ -701,14 +806,125 @@ class RectilinearRegridder:
             if dtype.kind == "i":
                 dtype = np.promote_types(dtype, np.float16)
 
-        if ma.isMaskedArray(src_data):
-            data = ma.empty(shape, dtype=dtype)
-            data.mask = np.zeros(data.shape, dtype=np.bool_)
-        else:
-            data = np.empty(shape, dtype=dtype)
+        # Flip and extend the data to match the source points of the weights.
+        flip_index = [slice(None)] * src_data.ndim
+        if regrid_info.reverse_x:
+            flip_index[x_dim] = slice(None, None, -1)
+        if regrid_info.reverse_y:
+            flip_index[y_dim] = slice(None, None, -1)
+        src_data = src_data[tuple(flip_index)]
+        if regrid_info.circular:
+            src_data = extend_circular_data(src_data, x_dim)
+
+        # Fold the data into 2D, with each 2D slice as one row, and with the
+        # x and y dimensions in their original order (so commonly, where the
+        # x and y dimensions are last, this is just a view).
+        grid_dims = [y_dim, x_dim] if y_first else [x_dim, y_dim]
+        other_dims = [dim for dim in range(len(shape)) if dim not in grid_dims]
+        other_shape = tuple(shape[dim] for dim in other_dims)
+        src_data = src_data.transpose(other_dims + grid_dims)
+        src_data = src_data.reshape((int(np.prod(other_shape)), -1))
+
+        weights = regrid_info.weights
+
+        def interpolate(values, fill_value):
+            # Interpolate all the slices of a 2D array at once.
+            if not np.issubdtype(values.dtype, np.inexact):
+                values = values.astype(float)
+            if method == "linear":
+                result = np.empty(
+                    (values.shape[0], weights.shape[0]),
+                    dtype=np.promote_types(weights.dtype, values.dtype),
+                )
+                # Multiply the weights by blocks of slices, so that each
+                # block of source data (transposed to suit the sparse matrix
+                # product) remains in cache.
+                block_size = max(
+                    1,
+                    _INTERPOLATION_BLOCK_BYTES
+                    // (result.itemsize * max(weights.shape)),
+                )
+                for start in range(0, values.shape[0], block_size):
+                    block = slice(start, start + block_size)
+                    result[block] = (weights @ values[block].T).T
+            else:
+                result = values[:, weights]
+            if not mode.bounds_error and fill_value is not None:
+                result[:, regrid_info.out_of_bounds] = fill_value
+            return result
+
+        def restore_dims(result):
+            # Restore the shape and dimension order of the source data, from
+            # the interpolated slices.
+            result = result.reshape(other_shape + sample_grid_x.shape)
+            return np.moveaxis(result, range(len(shape)), other_dims + [y_dim, x_dim])
+
+        data = interpolate(ma.getdata(src_data), mode.fill_value)
+        data = np.ascontiguousarray(restore_dims(data), dtype=dtype)
+
+        if ma.isMaskedArray(src_data) or mode.force_mask:
+            # NB. np.ma.getmaskarray returns an array of `False` if
+            # `src_data` is not a masked array.
+            src_mask = ma.getmaskarray(src_data)
+            # The mask is commonly the same for every slice, in which case
+            # only one slice needs interpolating.
+            if src_mask.shape[0] > 1 and np.all(src_mask == src_mask[:1]):
+                mask_fraction = interpolate(src_mask[:1], mode.mask_fill_value)
+                mask_fraction = np.broadcast_to(
+                    mask_fraction, (src_mask.shape[0], mask_fraction.shape[1])
+                )
+            else:
+                mask_fraction = interpolate(src_mask, mode.mask_fill_value)
+            new_mask = np.ascontiguousarray(restore_dims(mask_fraction > 0))
+
+            if ma.isMaskedArray(src_data) or np.any(new_mask):
+                # N.B. the result always has an expanded mask array.
+                data = ma.MaskedArray(data, mask=new_mask)
+
+        data = data.reshape(final_shape)
+        return data
+
+    @staticmethod
+    def _regrid__prepare(
+        src_x_coord,
+        src_y_coord,
+        sample_grid_x,
+        sample_grid_y,
+        method="linear",
+        y_first=True,
+    ):
+        """Calculate the weights to regrid from the src grid to the sample grid.
+
+        The result can be re-used by :meth:`_regrid`, for any data on the same
+        source grid, with the same order of X and Y dimensions.
+
+        Parameters
+        ----------
+        src_x_coord : :class:`iris.coords.DimCoord`
+            The X :class:`iris.coords.DimCoord`.
+        src_y_coord : :class:`iris.coords.DimCoord`
+            The Y :class:`iris.coords.DimCoord`.
+        sample_grid_x :
+            A 2-dimensional array of sample X values.
+        sample_grid_y :
+            A 2-dimensional array of sample Y values.
+        method : str, default="linear"
+            Either 'linear' or 'nearest'. The default method is 'linear'.
+        y_first : bool, default=True
+            Whether the Y dimension of the data precedes the X dimension.
+
+        Returns
+        -------
+        :class:`_RegridInfo`
+
+        """
+        if sample_grid_x.shape != sample_grid_y.shape:
+            raise ValueError("Inconsistent sample grid shapes.")
+        if sample_grid_x.ndim != 2:
+            raise ValueError("Sample grid must be 2-dimensional.")
 
         # The interpolation class requires monotonically increasing
-        # coordinates, so flip the coordinate(s) and data if they aren't.
+        # coordinates, so flip the coordinate(s) (and the data) if they aren't.
         reverse_x = (
             src_x_coord.points[0] > src_x_coord.points[1]
             if src_x_coord.points.size > 1
@@ -719,51 +935,29 @@ class RectilinearRegridder:
             if src_y_coord.points.size > 1
             else False
         )
-        flip_index = [slice(None)] * src_data.ndim
         if reverse_x:
             src_x_coord = src_x_coord[::-1]
-            flip_index[x_dim] = slice(None, None, -1)
         if reverse_y:
             src_y_coord = src_y_coord[::-1]
-            flip_index[y_dim] = slice(None, None, -1)
-        src_data = src_data[tuple(flip_index)]
 
         if src_x_coord.circular:
-            x_points, src_data = extend_circular_coord_and_data(
-                src_x_coord, src_data, x_dim
-            )
+            x_points = extend_circular_coord(src_x_coord, src_x_coord.points)
         else:
             x_points = src_x_coord.points
 
-        # Slice out the first full 2D piece of data for construction of the
-        # interpolator.
-        index = [0] * len(shape)
-        index[x_dim] = index[y_dim] = slice(None)
-        initial_data = src_data[tuple(index)]
-        if y_dim < x_dim:
-            initial_data = initial_data.T
-
-        # Construct the interpolator, we will fill in any values out of bounds
-        # manually.
+        # Construct the interpolator, which is only used to calculate the
+        # weights, so its values are a placeholder.
+        # N.B. out of bounds points are handled by :meth:`_regrid`.
+        n_x, n_y = len(x_points), len(src_y_coord.points)
         interpolator = _RegularGridInterpolator(
             [x_points, src_y_coord.points],
-            initial_data,
+            np.empty((n_x, n_y)),
             method=method,
             bounds_error=False,
             fill_value=None,
         )
-        # The constructor of the _RegularGridInterpolator class does
-        # some unnecessary checks on these values, so we set them
-        # afterwards instead. Sneaky. ;-)
-        try:
-            mode = EXTRAPOLATION_MODES[extrapolation_mode]
-        except KeyError:
-            raise ValueError("Invalid extrapolation mode.")
-        interpolator.bounds_error = mode.bounds_error
-        interpolator.fill_value = mode.fill_value
 
-        # Construct the target coordinate points array, suitable for passing to
-        # the interpolator multiple times.
+        # Construct the target coordinate points array.
         interp_coords = [
             sample_grid_x.astype(np.float64)[..., np.newaxis],
             sample_grid_y.astype(np.float64)[..., np.newaxis],
@@ -781,51 +975,38 @@ class RectilinearRegridder:
 
         interp_coords = np.dstack(interp_coords)
 
-        weights = interpolator.compute_interp_weights(interp_coords)
-
-        def interpolate(data):
-            # Update the interpolator for this data slice.
-            data = data.astype(interpolator.values.dtype)
-            if y_dim < x_dim:
-                data = data.T
-            interpolator.values = data
-            data = interpolator.interp_using_pre_computed_weights(weights)
-            if y_dim > x_dim:
-                data = data.T
-            return data
-
-        # Build up a shape suitable for passing to ndindex, inside the loop we
-        # will insert slice(None) on the data indices.
-        iter_shape = list(shape)
-        iter_shape[x_dim] = iter_shape[y_dim] = 1
-
-        # Iterate through each 2d slice of the data, updating the interpolator
-        # with the new data as we go.
-        for index in np.ndindex(tuple(iter_shape)):
-            index = list(index)
-            index[x_dim] = index[y_dim] = slice(None)
-
-            src_subset = src_data[tuple(index)]
-            interpolator.fill_value = mode.fill_value
-            data[tuple(index)] = interpolate(src_subset)
-
-            if ma.isMaskedArray(data) or mode.force_mask:
-                # NB. np.ma.getmaskarray returns an array of `False` if
-                # `src_subset` is not a masked array.
-                src_mask = ma.getmaskarray(src_subset)
-                interpolator.fill_value = mode.mask_fill_value
-                mask_fraction = interpolate(src_mask)
-                new_mask = mask_fraction > 0
-
-                if ma.isMaskedArray(data):
-                    data.mask[tuple(index)] = new_mask
-                elif np.any(new_mask):
-                    # Set mask=False to ensure we have an expanded mask array.
-                    data = ma.MaskedArray(data, mask=False)
-                    data.mask[tuple(index)] = new_mask
+        _, _, indices, norm_distances, out_of_bounds = (
+            interpolator.compute_interp_weights(interp_coords)
+        )
 
-        data = data.reshape(final_shape)
-        return data
+        # Express the weights in terms of the source points of each slice,
+        # which are ordered as (y, x) or (x, y), like the data.
+        # N.B. the interpolator source points are always ordered as (x, y).
+        if method == "linear":
+            # A sparse matrix of shape (n_target_points, n_source_points).
+            weights = indices
+            if y_first:
+                i_x, i_y = np.divmod(weights.indices, n_y)
+                weights = csr_matrix(
+                    (weights.data, i_y * n_x + i_x, weights.indptr),
+                    shape=weights.shape,
+                )
+        else:
+            # The source point index of each target point.
+            i_x, i_y = [
+                np.where(distance <= 0.5, index, index + 1)
+                for index, distance in zip(indices, norm_distances)
+            ]
+            weights = i_y * n_x + i_x if y_first else i_x * n_y + i_y
+
+        return _RegridInfo(
+            reverse_x=reverse_x,
+            reverse_y=reverse_y,
+            circular=bool(src_x_coord.circular),
+            y_first=y_first,
+            weights=weights,
+            out_of_bounds=out_of_bounds,
+        )
 
     def _check_units(self, coord):
         from iris.coord_systems import GeogCS, RotatedGeogCS
@@ -928,12 +1109,15 @@ class RectilinearRegridder:
             self._check_units(coord)
 
         # Convert the grid to a 2D sample grid in the src CRS.
-        sample_grid = self._sample_grid(src_cs, grid_x_coord, grid_y_coord)
+        sample_grid = self._cached_sample_grid(src_cs)
         sample_grid_x, sample_grid_y = sample_grid
 
         # Compute the interpolated data values.
         x_dim = src.coord_dims(src_x_coord)[0]
         y_dim = src.coord_dims(src_y_coord)[0]
+        regrid_info = self._regrid_info(
+            src_x_coord, src_y_coord, sample_grid, y_dim < x_dim
+        )
 
         data = map_complete_blocks(
             src,
@@ -948,6 +1132,7 @@ class RectilinearRegridder:
             sample_grid_y=sample_grid_y,
             method=self._method,
             extrapolation_mode=self._extrapolation_mode,
+            regrid_info=regrid_info,
         )
 
         # Wrap up the data as a Cube.
@@ -963,6 +1148,13 @@ class RectilinearRegridder:
 
         def regrid_callback(*args, **kwargs):
             _data, dims = args
+            if None not in dims:
+                # Re-use the weights for coordinates spanning both of the
+                # grid dimensions.
+                x_dim, y_dim = dims
+                kwargs["regrid_info"] = self._regrid_info(
+                    src_x_coord, src_y_coord, sample_grid, y_dim < x_dim
+                )
             return _regrid_callback(_data, *dims, **kwargs)
 
         result = _create_cube(
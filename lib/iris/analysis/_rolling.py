@@ -0,0 +1,235 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Running (rolling window) statistics, for :meth:`iris.cube.Cube.rolling_window`.
+
+Each statistic is calculated over every window along an axis in O(n) time,
+independent of the window length, with the block-wise prefix and suffix scans
+of the van Herk/Gil-Werman algorithm.  Unlike differences of a cumulative sum,
+this never subtracts partial results, so it has no cancellation error and
+propagates non-finite values only into the windows which contain them.
+
+"""
+
+from functools import wraps
+import warnings
+
+import dask.array as da
+import numpy as np
+import numpy.ma as ma
+
+from iris._lazy_data import is_lazy_data
+
+
+def _running(ufunc, data, window, pad):
+    """Apply an associative binary ufunc over every window along the last axis.
+
+    'pad' is a value, broadcastable against a single trailing point, which
+    does not change the result when combined with the last value of 'data'.
+
+    """
+    n_points = data.shape[-1]
+    n_blocks = -(-n_points // window)
+    n_pad = n_blocks * window - n_points
+    if n_pad:
+        pad = np.broadcast_to(pad, data.shape[:-1] + (n_pad,)).astype(data.dtype)
+        data = np.concatenate([data, pad], axis=-1)
+    blocks = data.reshape(data.shape[:-1] + (n_blocks, window))
+    # The accumulation from the start of each block, and to the end of it.
+    prefix = ufunc.accumulate(blocks, axis=-1).reshape(data.shape)
+    suffix = ufunc.accumulate(blocks[..., ::-1], axis=-1)[..., ::-1]
+    suffix = suffix.reshape(data.shape)
+
+    # Each window combines the end of one block with the start of the next,
+    # except for the windows which are exactly a block.
+    n_windows = n_points - window + 1
+    result = ufunc(suffix[..., :n_windows], prefix[..., window - 1 : n_points])
+    aligned = slice(0, n_windows, window)
+    result[..., aligned] = suffix[..., aligned]
+    return result
+
+
+def _sum_dtype(dtype):
+    # The dtype of a numpy sum.
+    return np.zeros(1, dtype=dtype).sum().dtype
+
+
+def _lazy_rolling(func, data, window, axis, **kwargs):
+    """Calculate a running statistic of a lazy array, one chunk at a time.
+
+    Each chunk is extended with the first 'window - 1' points of the next, so
+    that it produces the windows which start within it.
+
+    """
+    # Merge any chunks along the axis that are shorter than the window.
+    chunks = []
+    size = 0
+    for chunk in data.chunks[axis]:
+        size += chunk
+        if size >= window:
+            chunks.append(size)
+            size = 0
+    chunks[-1] += size
+    data = data.rechunk({axis: tuple(chunks)})
+
+    result_chunks = list(data.chunks)
+    result_chunks[axis] = tuple(chunks[:-1]) + (chunks[-1] - window + 1,)
+    meta = da.utils.meta_from_array(data, ndim=1)
+    meta = func(
+        np.zeros(window, dtype=meta.dtype)
+        if not ma.isMaskedArray(meta)
+        else ma.zeros(window, dtype=meta.dtype),
+        window,
+        **kwargs,
+    )
+    return da.map_overlap(
+        func,
+        data,
+        depth={axis: (0, window - 1)},
+        boundary="none",
+        trim=False,
+        allow_rechunk=False,
+        chunks=tuple(result_chunks),
+        meta=da.utils.meta_from_array(meta, ndim=data.ndim),
+        window=window,
+        axis=axis,
+        **kwargs,
+    )
+
+
+def _rolling_function(statistic, masked_result=False, mask_invalid=False):
+    """Make a rolling window function from a running statistic.
+
+    The 'statistic' function has the call signature
+    ``(data, window, valid=None, n_valid=None, **kwargs)``.  It calculates the
+    statistic of every window along the last axis of a real, unmasked array.
+    For masked data, 'valid' is the inverse of the mask, and 'n_valid' the
+    number of valid points in each window.
+
+    The returned function has the call signature
+    ``(data, window, axis=-1, mdtol=None, **kwargs)``, and handles real,
+    masked and lazy data.  If 'masked_result' is set, the result for real data
+    is always a masked array, matching the :mod:`numpy.ma` aggregation of the
+    windows.  If 'mask_invalid' is set, any non-finite results for masked data
+    are also masked, as by :mod:`numpy.ma` division.
+
+    """
+
+    def real_rolling_function(data, window, axis=-1, mdtol=None, **kwargs):
+        data = np.moveaxis(data, axis, -1)
+        if ma.isMaskedArray(data):
+            valid = ~ma.getmaskarray(data)
+            n_valid = _running(np.add, valid.astype(int), window, 0)
+            result = statistic(
+                ma.getdata(data), window, valid=valid, n_valid=n_valid, **kwargs
+            )
+            # As for the aggregation of each window, a window is masked if it
+            # has no valid points, or too few to satisfy 'mdtol'.
+            mask = n_valid == 0
+            if mdtol is not None:
+                mask |= (1 - mdtol) > (n_valid / window)
+            if mask_invalid:
+                mask |= ~np.isfinite(result)
+            result = ma.masked_array(result, mask=mask)
+        else:
+            result = statistic(data, window, **kwargs)
+        return np.moveaxis(result, -1, axis)
+
+    @wraps(statistic)
+    def rolling_function(data, window, axis=-1, mdtol=None, **kwargs):
+        axis = axis % data.ndim
+        if window < 1:
+            raise ValueError("`window` must be at least 1.")
+        if window > data.shape[axis]:
+            raise ValueError("`window` is too long.")
+        if is_lazy_data(data):
+            result = _lazy_rolling(
+                real_rolling_function, data, window, axis, mdtol=mdtol, **kwargs
+            )
+        else:
+            result = real_rolling_function(
+                data, window, axis=axis, mdtol=mdtol, **kwargs
+            )
+            if masked_result:
+                result = ma.asarray(result)
+        return result
+
+    return rolling_function
+
+
+def _fill_invalid(data, valid, fill_value):
+    # Replace the invalid (i.e. masked) points of the data.
+    if valid is not None:
+        data = np.where(valid, data, np.array(fill_value, dtype=data.dtype))
+    return data
+
+
+def _running_sum(data, window, valid=None, n_valid=None):
+    """Calculate the sum of every window, ignoring invalid points."""
+    dtype = _sum_dtype(data.dtype)
+    # Accumulate floating point values in at least double precision.
+    work_dtype = np.promote_types(dtype, np.float64) if dtype.kind in "fc" else dtype
+    data = _fill_invalid(data.astype(work_dtype), valid, 0)
+    return _running(np.add, data, window, 0).astype(dtype, copy=False)
+
+
+def _running_mean(data, window, valid=None, n_valid=None):
+    """Calculate the mean of every window, ignoring invalid points."""
+    dtype = data.dtype if data.dtype.kind in "fc" else np.dtype(np.float64)
+    work_dtype = np.promote_types(dtype, np.float64)
+    data = _fill_invalid(data.astype(work_dtype), valid, 0)
+    total = _running(np.add, data, window, 0)
+    count = window if n_valid is None else np.maximum(n_valid, 1)
+    return (total / count).astype(dtype, copy=False)
+
+
+def _running_extreme(ufunc, reduce, data, window, valid=None):
+    # Any valid value which is not exceeded by the others does not change the
+    # result for any window containing a valid point, so it can replace the
+    # invalid points.
+    if valid is not None and np.any(valid):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            fill_value = reduce(data[valid])
+        data = _fill_invalid(data, valid, fill_value)
+    return _running(ufunc, data, window, data[..., -1:])
+
+
+def _running_max(data, window, valid=None, n_valid=None):
+    """Calculate the maximum of every window, ignoring invalid points."""
+    reduce = np.nanmin if data.dtype.kind in "fc" else np.min
+    return _running_extreme(np.maximum, reduce, data, window, valid=valid)
+
+
+def _running_min(data, window, valid=None, n_valid=None):
+    """Calculate the minimum of every window, ignoring invalid points."""
+    reduce = np.nanmax if data.dtype.kind in "fc" else np.max
+    return _running_extreme(np.minimum, reduce, data, window, valid=valid)
+
+
+def _running_count(data, window, valid=None, n_valid=None, function=None):
+    """Count the valid points of every window which satisfy a condition."""
+    if not callable(function):
+        emsg = "function must be a callable. Got {}."
+        raise TypeError(emsg.format(type(function)))
+    counts = _fill_invalid(np.asarray(function(data), dtype=bool), valid, False)
+    counts = counts.astype(_sum_dtype(bool))
+    return _running(np.add, counts, window, 0)
+
+
+#: The sum of every window, as for :data:`iris.analysis.SUM`.
+rolling_sum = _rolling_function(_running_sum)
+
+#: The mean of every window, as for :data:`iris.analysis.MEAN`.
+rolling_mean = _rolling_function(_running_mean, masked_result=True, mask_invalid=True)
+
+#: The maximum of every window, as for :data:`iris.analysis.MAX`.
+rolling_max = _rolling_function(_running_max, masked_result=True)
+
+#: The minimum of every window, as for :data:`iris.analysis.MIN`.
+rolling_min = _rolling_function(_running_min, masked_result=True)
+
+#: The count of the points of every window which satisfy a condition, as for
+#: :data:`iris.analysis.COUNT`.
+rolling_count = _rolling_function(_running_count)
@@ -4,6 +4,7 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Basic mathematical and statistical operations."""
 
+import ast
 from functools import lru_cache
 import inspect
 import math
@@ -17,8 +18,9 @@ from numpy import ma
 
 from iris._deprecation import warn_deprecated
 import iris.analysis
-from iris.common import SERVICES, Resolve
+from iris.common import SERVICES
 from iris.common.lenient import _lenient_client
+from iris.common.resolve import _resolve
 from iris.config import get_logger
 import iris.coords
 import iris.exceptions
@@ -798,6 +800,143 @@ def apply_ufunc(ufunc, cube, other=None, new_unit=None, new_name=None, in_place=
     return new_cube
 
 
+# The operators and functions which may be used by :func:`evaluate`.
+_EVALUATE_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Pow: operator.pow,
+    ast.USub: operator.neg,
+    ast.UAdd: lambda operand: operand,
+}
+_EVALUATE_FUNCTIONS = {
+    "abs": abs,
+    "exp": exp,
+    "log": log,
+    "log2": log2,
+    "log10": log10,
+}
+
+
+def evaluate(expression, **operands):
+    """Evaluate an arithmetic expression of cubes, computing the data only once.
+
+    The expression is evaluated as for the same arithmetic with the cube
+    operators, e.g. ``(a - b) * c``, giving the same result metadata, but
+    without calculating the data of each intermediate result.  Instead, the
+    whole expression is calculated lazily, as a single fused dask
+    computation, which is then realised once at the end, unless any of the
+    operands are lazy.
+
+    The metadata is still resolved, and an intermediate cube created, for
+    each operation in the expression, as cube arithmetic resolves operands
+    pairwise.  So the saving is only in the data calculation, plus the
+    metadata resolution of repeated evaluations with operands of the same
+    structure, e.g. for successive time-steps, which re-use the cached
+    outcomes of the first.
+
+    Parameters
+    ----------
+    expression : str
+        An arithmetic expression, e.g. ``"(a - b) * c / d + e"``.  This may
+        use the operators ``+``, ``-``, ``*``, ``/`` and ``**``, numbers,
+        the names of the operands, and the functions ``abs``, ``exp``,
+        ``log``, ``log2`` and ``log10`` (see :func:`abs`, :func:`exp`,
+        etc.).
+    **operands : dict
+        The value of each named operand.  These are cubes, or anything else
+        which cube arithmetic accepts, e.g. numbers or arrays.
+
+    Returns
+    -------
+    :class:`iris.cube.Cube`
+
+    Notes
+    -----
+    This function maintains laziness when called; it does not realise data
+    of lazy operands.  See more at :doc:`/userguide/real_and_lazy_data`.
+
+    Examples
+    --------
+    ::
+
+        anomaly = evaluate("(t - t_clim) / t_std", t=t, t_clim=t_clim, t_std=t_std)
+
+    """
+    from iris.cube import Cube
+
+    try:
+        tree = ast.parse(expression, mode="eval")
+    except SyntaxError as err:
+        emsg = f"Invalid expression {expression!r}: {err.msg}."
+        raise ValueError(emsg) from None
+
+    # Use lazy versions of any real operands, which share the real arrays.
+    lazy = False
+    lazy_operands = {}
+    for name, operand in operands.items():
+        if isinstance(operand, Cube):
+            if operand.has_lazy_data():
+                lazy = True
+            else:
+                view = operand.view()
+                view.data = iris._lazy_data.as_lazy_data(view.data)
+                operand = view
+        elif iris._lazy_data.is_lazy_data(operand):
+            lazy = True
+        elif isinstance(operand, np.ndarray):
+            operand = iris._lazy_data.as_lazy_data(operand)
+        lazy_operands[name] = operand
+
+    def evaluate_node(node):
+        if isinstance(node, ast.BinOp) and type(node.op) in _EVALUATE_OPERATORS:
+            operation = _EVALUATE_OPERATORS[type(node.op)]
+            result = operation(evaluate_node(node.left), evaluate_node(node.right))
+        elif isinstance(node, ast.UnaryOp) and type(node.op) in _EVALUATE_OPERATORS:
+            operation = _EVALUATE_OPERATORS[type(node.op)]
+            result = operation(evaluate_node(node.operand))
+        elif (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id in _EVALUATE_FUNCTIONS
+            and len(node.args) == 1
+            and not node.keywords
+        ):
+            function = _EVALUATE_FUNCTIONS[node.func.id]
+            result = function(evaluate_node(node.args[0]))
+        elif isinstance(node, ast.Name):
+            if node.id not in lazy_operands:
+                emsg = f"No operand given for {node.id!r} in {expression!r}."
+                raise ValueError(emsg)
+            result = lazy_operands[node.id]
+        elif isinstance(node, ast.Constant) and type(node.value) in (
+            int,
+            float,
+            complex,
+        ):
+            result = node.value
+        else:
+            emsg = f"Unsupported expression {ast.unparse(node)!r} in {expression!r}."
+            raise ValueError(emsg)
+        return result
+
+    result = evaluate_node(tree.body)
+    if not isinstance(result, Cube):
+        emsg = f"The result of {expression!r} is not a cube."
+        raise ValueError(emsg)
+
+    names = [name for name, operand in lazy_operands.items() if operand is result]
+    if names:
+        # Don't return one of the operands themselves.
+        result = operands[names[0]].copy()
+    elif not lazy:
+        # Calculate all the data in one go.
+        result.data = iris._lazy_data.as_concrete_data(result.core_data())
+
+    return result
+
+
 def _binary_op_common(
     operation_function,
     operation_name,
@@ -849,7 +988,7 @@ def _binary_op_common(
     elif isinstance(other, Cube):
         # Prepare to resolve the cube operands and associated coordinate
         # metadata into the resultant cube.
-        resolver = Resolve(cube, other)
+        resolver = _resolve(cube, other)
 
         # Get the broadcast, auto-transposed safe versions of the cube operands.
         cube = resolver.lhs_cube_resolved
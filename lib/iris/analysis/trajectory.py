@@ -4,12 +4,58 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Defines a Trajectory class, and a routine to extract a sub-cube along a trajectory."""
 
+from collections import OrderedDict
 import math
+import threading
 
 import numpy as np
 from scipy.spatial import cKDTree
 
+from iris._lazy_data import map_complete_blocks
+from iris.common.metadata import CoordMetadata, hexdigest
 import iris.coords
+from iris.util import broadcast_to_shape
+
+# The number of kdtrees of extract_points which are cached.
+_KDTREE_CACHE_SIZE = 4
+
+
+class _KDTreeCache:
+    """The most recently used kdtrees, by the coordinates they were built from.
+
+    This is safe to share between threads.  As for a dictionary, trees are
+    fetched with :meth:`get` and stored by key assignment.
+
+    """
+
+    def __init__(self):
+        self._trees = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._trees)
+
+    def get(self, key, default=None):
+        with self._lock:
+            tree = self._trees.get(key, default)
+            if key in self._trees:
+                # Record it as the most recently used.
+                self._trees.move_to_end(key)
+        return tree
+
+    def __setitem__(self, key, tree):
+        with self._lock:
+            self._trees[key] = tree
+            self._trees.move_to_end(key)
+            while len(self._trees) > _KDTREE_CACHE_SIZE:
+                self._trees.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._trees.clear()
+
+
+_KDTREE_CACHE = _KDTreeCache()
 
 
 class _Segment:
@@ -470,6 +516,183 @@ def interpolate(cube, sample_points, method=None):
     return new_cube
 
 
+def extract_points(cube, sample_points):
+    """Extract the nearest neighbour data to each of many sample points.
+
+    Typically used to extract time series at observation sites, the nearest
+    source points of all the sample points are found in one operation, and
+    the data is then selected from them in one operation.
+
+    Parameters
+    ----------
+    cube : :class:`~iris.cube.Cube`
+        The source cube.
+    sample_points :
+        A sequence of (coordinate, values) pairs, each giving the values of a
+        coordinate at every sample point, e.g. ``[("latitude", site_lats),
+        ("longitude", site_lons)]``.
+        The coordinates must be dimension or auxiliary coordinates of the cube.
+
+    Returns
+    -------
+    :class:`~iris.cube.Cube`
+        A cube of the nearest neighbour data to the sample points.  The cube
+        dimensions spanned by the sample coordinates are replaced with a
+        single, last, dimension over the sample points.  Coordinates, cell
+        measures and ancillary variables which span the replaced dimensions
+        are given their values at the nearest source points.
+
+    Notes
+    -----
+    If the sample coordinates are all one-dimensional, mapped to different
+    cube dimensions, the nearest source point is found independently in each
+    dimension, as by :meth:`iris.coords.Coord.nearest_neighbour_indices`.
+    Otherwise, as for the "nearest" method of :func:`interpolate`, the nearest
+    source points are found with a kdtree, which is cached for reuse.  If the
+    sample points are longitudes/latitudes, these are handled correctly as
+    points on the sphere, but the values must be in 'degrees'.
+
+    This function maintains laziness.  The chunking of the dimensions not
+    spanned by the sample coordinates is retained.
+    See more at :doc:`/userguide/real_and_lazy_data`.
+
+    Examples
+    --------
+    ::
+
+        sample_points = [("latitude", [50.7, 51.5, 55.9]),
+                         ("longitude", [-3.5, -0.1, -3.2])]
+        sites_cube = extract_points(cube, sample_points)
+
+    """
+    if not sample_points:
+        raise ValueError("No sample points were given.")
+
+    # Convert any coordinate names to coords.
+    ok_coord_ids = set(map(id, cube.dim_coords + cube.aux_coords))
+    coords = []
+    values = []
+    for coord, coord_values in sample_points:
+        coord = cube.coord(coord)
+        if id(coord) not in ok_coord_ids:
+            msg = (
+                "Invalid sample coordinate {!r}: derived coordinates are"
+                " not allowed.".format(coord.name())
+            )
+            raise ValueError(msg)
+        coords.append(coord)
+        values.append(np.array(coord_values, ndmin=1))
+    n_points = len(values[0])
+    if any(len(coord_values) != n_points for coord_values in values):
+        msg = "All coordinates must have the same number of sample points."
+        raise ValueError(msg)
+
+    # Which dims are we sampling?
+    coords_dims = [cube.coord_dims(coord) for coord in coords]
+    sample_dims = sorted(set(sum(coords_dims, ())))
+
+    # Find the index of the nearest source point, in each sample dimension.
+    if all(len(dims) == 1 for dims in coords_dims) and len(sample_dims) == len(coords):
+        dim_indices = {
+            dims[0]: coord.nearest_neighbour_indices(coord_values)
+            for coord, dims, coord_values in zip(coords, coords_dims, values)
+        }
+    else:
+        column_indices = np.array(
+            _nearest_neighbour_indices_ndcoords(
+                cube, list(zip(coords, values)), cache=_KDTREE_CACHE
+            ),
+            dtype=object,
+        )
+        dim_indices = {dim: column_indices[:, dim].astype(int) for dim in sample_dims}
+
+    def gather(array, dims):
+        # Select the sample points from an array mapped to the given cube
+        # dimensions, returning the array with any sampled dimensions replaced
+        # by a dimension over the sample points, and the new cube dims.
+        # Any extra trailing array dimensions, i.e. of bounds, remain last.
+        dims = list(dims)
+        gather_dims = [dim for dim in dims if dim in dim_indices]
+        other_dims = [dim for dim in dims if dim not in dim_indices]
+        new_dims = [dims_map[dim] for dim in other_dims]
+        if gather_dims:
+            # Move the sampled dimensions to the end.
+            extra = list(range(len(dims), array.ndim))
+            order = [dims.index(dim) for dim in other_dims]
+            order += extra + [dims.index(dim) for dim in gather_dims]
+            array = array.transpose(order)
+            indices = np.ravel_multi_index(
+                [dim_indices[dim] for dim in gather_dims],
+                [cube.shape[dim] for dim in gather_dims],
+            )
+            # Gather the points from complete sample spaces, which keeps lazy
+            # data lazy and retains the chunking of all the other dimensions.
+            n_keep = len(other_dims) + len(extra)
+            n_gather_dims = len(gather_dims)
+            array = map_complete_blocks(
+                array,
+                _gather_grid_points,
+                dims=tuple(range(n_keep, array.ndim)),
+                out_sizes=(1,) * (n_gather_dims - 1) + (n_points,),
+                indices=indices,
+                n_grid_dims=n_gather_dims,
+            )
+            array = array.reshape(array.shape[:n_keep] + (n_points,))
+            if extra:
+                # Move the sample points dimension before the extra ones.
+                n_other = len(other_dims)
+                order = list(range(n_other)) + [n_keep]
+                order += list(range(n_other, n_keep))
+                array = array.transpose(order)
+            new_dims.append(points_dim)
+        return array, new_dims
+
+    other_dims = [dim for dim in range(cube.ndim) if dim not in dim_indices]
+    dims_map = {dim: i_dim for i_dim, dim in enumerate(other_dims)}
+    points_dim = len(other_dims)
+
+    data, _ = gather(cube.core_data(), range(cube.ndim))
+    result = iris.cube.Cube(data)
+    result.metadata = cube.metadata
+
+    # Record a mapping from old coordinate IDs to new coordinates,
+    # for subsequent use in creating updated aux_factories.
+    coord_mapping = {}
+    dim_coord_ids = set(map(id, cube.dim_coords))
+    for coord in cube.dim_coords + cube.aux_coords:
+        dims = cube.coord_dims(coord)
+        if set(dims).isdisjoint(dim_indices):
+            new_coord = coord.copy()
+            new_dims = [dims_map[dim] for dim in dims]
+            if id(coord) in dim_coord_ids:
+                result.add_dim_coord(new_coord, new_dims)
+            else:
+                result.add_aux_coord(new_coord, new_dims)
+        else:
+            # The sampled coordinates are no longer monotonic, or on a mesh.
+            points, new_dims = gather(coord.core_points(), dims)
+            bounds = None
+            if coord.has_bounds():
+                bounds, _ = gather(coord.core_bounds(), dims)
+            metadata = CoordMetadata.from_metadata(coord.metadata)
+            new_coord = iris.coords.AuxCoord(
+                points, bounds=bounds, **metadata._asdict()
+            )
+            result.add_aux_coord(new_coord, new_dims)
+        coord_mapping[id(coord)] = new_coord
+    for factory in cube.aux_factories:
+        result.add_aux_factory(factory.updated(coord_mapping))
+
+    for cm in cube.cell_measures():
+        values, new_dims = gather(cm.core_data(), cube.cell_measure_dims(cm))
+        result.add_cell_measure(cm.copy(values), new_dims)
+    for av in cube.ancillary_variables():
+        values, new_dims = gather(av.core_data(), cube.ancillary_variable_dims(av))
+        result.add_ancillary_variable(av.copy(values), new_dims)
+
+    return result
+
+
 def _ll_to_cart(lon, lat):
     # Based on cartopy.img_transform.ll_to_cart().
     x = np.sin(np.deg2rad(90 - lat)) * np.cos(np.deg2rad(lon))
@@ -623,24 +846,32 @@ def _nearest_neighbour_indices_ndcoords(cube, sample_points, cache=None):
         (coord, sample_space_cube.coord_dims(coord)) for coord in sample_space_coords
     ]
 
-    if cache is not None and cube in cache:
-        kdtree = cache[cube]
-    else:
+    kdtree = None
+    if cache is not None:
+        # Identify the kdtree by the values of the sample space coordinates.
+        cache_key = tuple(
+            (coord.name(), coord_dims, coord.shape, hexdigest(coord.points))
+            for coord, coord_dims in sample_space_coords_and_dims
+        )
+        kdtree = cache.get(cache_key)
+
+    if kdtree is None:
         # Create a "sample space position" for each
         # `datum.sample_space_data_positions[coord_index][datum_index]`.
         sample_space_data_positions = np.empty(
-            (len(sample_space_coords_and_dims), sample_space_cube.data.size),
+            (len(sample_space_coords_and_dims), np.prod(sample_space_cube.shape)),
             dtype=float,
         )
-        for d, ndi in enumerate(np.ndindex(sample_space_cube.data.shape)):
-            for c, (coord, coord_dims) in enumerate(sample_space_coords_and_dims):
-                # Index of this datum along this coordinate (could be n-D).
-                if coord_dims:
-                    keys = tuple(ndi[ind] for ind in coord_dims)
-                else:
-                    keys = slice(None, None)
-                # Position of this datum along this coordinate.
-                sample_space_data_positions[c][d] = coord.points[keys]
+        for c, (coord, coord_dims) in enumerate(sample_space_coords_and_dims):
+            # Position of every datum along this coordinate (could be n-D),
+            # flattened in the same (C) order as the sample space data.
+            if coord_dims:
+                positions = broadcast_to_shape(
+                    coord.points, sample_space_cube.shape, coord_dims
+                )
+            else:
+                positions = coord.points
+            sample_space_data_positions[c] = positions.ravel()
 
         # Convert to cartesian coordinates. Flatten for kdtree compatibility.
         cartesian_space_data_coords = _cartesian_sample_points(
@@ -654,7 +885,7 @@ def _nearest_neighbour_indices_ndcoords(cube, sample_points, cache=None):
 
     # Update cache.
     if cache is not None:
-        cache[cube] = kdtree
+        cache[cache_key] = kdtree
 
     # Convert the sample points to cartesian (3d) coords.
     # If there is no latlon within the coordinate there will be no change.
@@ -668,7 +899,7 @@ def _nearest_neighbour_indices_ndcoords(cube, sample_points, cache=None):
 
     # Convert flat indices back into multidimensional sample-space indices.
     sample_space_dimension_indices = np.unravel_index(
-        datum_index_lists, sample_space_cube.data.shape
+        datum_index_lists, sample_space_cube.shape
     )
     # Convert this from "pointwise list of index arrays for each dimension",
     # to "list of cube indices for each point".
@@ -709,8 +940,6 @@ class UnstructuredNearestNeigbourRegridder:
 
     """
 
-    # TODO: cache the necessary bits of the operation so reuse can actually
-    # be more efficient.
     def __init__(self, src_cube, target_grid_cube):
         """Nearest-neighbour regridder.
 
@@ -757,6 +986,11 @@ class UnstructuredNearestNeigbourRegridder:
             must be.  Otherwise, the corresponding X and Y coordinates must
             have the same units in the source and grid cubes.
 
+        The nearest-neighbour source points are calculated only once, when the
+        regridder is created.  Applying the regridder maintains laziness; it
+        does not realise data.
+        See more at :doc:`/userguide/real_and_lazy_data`.
+
         """
         from iris.analysis._interpolation import snapshot_grid
         from iris.util import _meshgrid
@@ -841,11 +1075,23 @@ class UnstructuredNearestNeigbourRegridder:
             (tgt_y_coord.name(), y_2d.flatten()),
         )
 
+        # Calculate the nearest source point for every target point, once
+        # only, and record it as a "gather" index into the source grid
+        # dimensions (flattened, in the order of the source X coord dims).
+        src_grid_dims = src_cube.coord_dims(src_x_coord)
+        column_indices = np.array(
+            _nearest_neighbour_indices_ndcoords(src_cube, self.trajectory),
+            dtype=object,
+        )
+        self.src_gather_indices = np.ravel_multi_index(
+            [column_indices[:, dim].astype(int) for dim in src_grid_dims],
+            [src_cube.shape[dim] for dim in src_grid_dims],
+        )
+
     def __call__(self, src_cube):
         # Check the source cube X and Y coords match the original.
-        # Note: for now, this is sufficient to ensure a valid trajectory
-        # interpolation, but if in future we save and reuse the cache context
-        # for the 'interpolate' call, we may need more checks here.
+        # Note: this is sufficient to ensure that the pre-calculated gather
+        # indices are valid for the given cube.
 
         # Check the given cube against the original.
         x_cos = src_cube.coords(axis="x")
@@ -862,43 +1108,63 @@ class UnstructuredNearestNeigbourRegridder:
             )
             raise ValueError(msg)
 
-        # Convert source XY coordinates to degrees if required.
-        if self.grid_is_latlon:
-            src_cube = src_cube.copy()
-            src_cube.coord(axis="x").convert_units("degrees")
-            src_cube.coord(axis="y").convert_units("degrees")
-
-        # Get the basic interpolated results.
-        result_trajectory_cube = interpolate(
-            src_cube, self.trajectory, method="nearest"
+        # Move the source grid dimensions to the end, in the same order as
+        # was used to calculate the gather indices.
+        src_grid_dims = src_cube.coord_dims(x_cos[0])
+        other_dims = [dim for dim in range(src_cube.ndim) if dim not in src_grid_dims]
+        data = src_cube.core_data().transpose(other_dims + list(src_grid_dims))
+
+        # Gather the result points from complete source grids, which keeps
+        # lazy data lazy and retains the chunking of all the other dimensions.
+        n_grid_dims = len(src_grid_dims)
+        n_other_dims = len(other_dims)
+        out_sizes = (1,) * (n_grid_dims - 1) + (len(self.src_gather_indices),)
+        data = map_complete_blocks(
+            data,
+            _gather_grid_points,
+            dims=tuple(range(n_other_dims, data.ndim)),
+            out_sizes=out_sizes,
+            indices=self.src_gather_indices,
+            n_grid_dims=n_grid_dims,
         )
+        # Reshape the (trailing) target points into the target grid.
+        data = data.reshape(data.shape[:n_other_dims] + self.tgt_grid_shape)
 
-        # Reconstruct this as a cube "like" the source data.
-        # TODO: handle all aux-coords, cell measures ??
-
-        # The shape is that of the basic result, minus the trajectory (last)
-        # dimension, plus the target grid dimensions.
-        target_shape = result_trajectory_cube.shape[:-1] + self.tgt_grid_shape
-        data_2d_x_and_y = result_trajectory_cube.data.reshape(target_shape)
-
-        # Make a new result cube with the reshaped data.
-        result_cube = iris.cube.Cube(data_2d_x_and_y)
+        # Make a new result cube with the regridded data.
+        result_cube = iris.cube.Cube(data)
         result_cube.metadata = src_cube.metadata
 
-        # Copy all the coords from the trajectory result.
-        i_trajectory_dim = result_trajectory_cube.ndim - 1
-        for coord in result_trajectory_cube.dim_coords:
-            dims = result_trajectory_cube.coord_dims(coord)
-            if i_trajectory_dim not in dims:
-                result_cube.add_dim_coord(coord.copy(), dims)
-        for coord in result_trajectory_cube.aux_coords:
-            dims = result_trajectory_cube.coord_dims(coord)
-            if i_trajectory_dim not in dims:
-                result_cube.add_aux_coord(coord.copy(), dims)
+        # Copy all the coords which do not map to the source grid dimensions.
+        # TODO: handle all aux-coords, cell measures ??
+        dims_map = {dim: i_dim for i_dim, dim in enumerate(other_dims)}
+        for coord in src_cube.dim_coords:
+            dims = src_cube.coord_dims(coord)
+            if not set(dims) & set(src_grid_dims):
+                result_cube.add_dim_coord(coord.copy(), [dims_map[dim] for dim in dims])
+        for coord in src_cube.aux_coords:
+            dims = src_cube.coord_dims(coord)
+            if not set(dims) & set(src_grid_dims):
+                result_cube.add_aux_coord(coord.copy(), [dims_map[dim] for dim in dims])
 
         # Add the X+Y grid coords from the grid cube, mapped to the new Y and X
         # dimensions, i.e. the last 2.
         for i_dim, coord in enumerate(self.tgt_grid_coords):
-            result_cube.add_dim_coord(coord.copy(), i_dim + i_trajectory_dim)
+            result_cube.add_dim_coord(coord.copy(), i_dim + n_other_dims)
 
         return result_cube
+
+
+def _gather_grid_points(data, indices, n_grid_dims):
+    """Select points from the trailing (source grid) dimensions of an array.
+
+    The trailing ``n_grid_dims`` dimensions of ``data`` are indexed as a
+    single flattened dimension, by ``indices``.  The result has the same
+    number of dimensions as ``data``, with all the selected points in the
+    last dimension, preceded by ``n_grid_dims - 1`` length-one dimensions.
+
+    """
+    leading_shape = data.shape[: data.ndim - n_grid_dims]
+    n_grid_points = int(np.prod(data.shape[data.ndim - n_grid_dims :]))
+    data = data.reshape(leading_shape + (n_grid_points,))
+    result = data[..., indices]
+    return result.reshape(leading_shape + (1,) * (n_grid_dims - 1) + (len(indices),))
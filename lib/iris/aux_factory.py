@@ -5,6 +5,7 @@
 """Definitions of derived coordinates."""
 
 from abc import ABCMeta, abstractmethod
+import inspect
 import warnings
 
 import cf_units
@@ -77,7 +78,7 @@ class AuxCoordFactory(CFVariableMixin, metaclass=ABCMeta):
         """
 
     @abstractmethod
-    def make_coord(self, coord_dims_func):
+    def make_coord(self, coord_dims_func, chunks=None):
         """Return a new :class:`iris.coords.AuxCoord` as defined by this factory.
 
         Parameters
@@ -87,9 +88,55 @@ class AuxCoordFactory(CFVariableMixin, metaclass=ABCMeta):
             to a given coordinate.
 
             See :meth:`iris.cube.Cube.coord_dims()`.
+        chunks : tuple of tuple of int, optional
+            The chunks of the parent cube data, as for
+            :attr:`dask.array.Array.chunks`.  If given, the lazy dependency
+            values are rechunked to match, in each cube dimension which they
+            span, so the derived values are calculated block-by-block.
 
         """
 
+    def _make_coord_chunked(self, coord_dims_func, chunks):
+        """Return a new derived coordinate, chunked to match a parent cube.
+
+        As :meth:`make_coord`, passing the ``chunks`` if they are given and
+        the factory supports them.  Factories whose :meth:`make_coord` has no
+        ``chunks`` argument, e.g. those defined outside Iris, make their
+        coordinates as usual.
+
+        Parameters
+        ----------
+        coord_dims_func :
+            As for :meth:`make_coord`.
+        chunks : tuple of tuple of int, optional
+            The chunks of the parent cube data, as for
+            :attr:`dask.array.Array.chunks`.
+
+        """
+        if chunks is not None and (
+            "chunks" in inspect.signature(self.make_coord).parameters
+        ):
+            result = self.make_coord(coord_dims_func, chunks=chunks)
+        else:
+            result = self.make_coord(coord_dims_func)
+        return result
+
+    @staticmethod
+    def _chunk_like_cube(nd_values, derived_dims, chunks):
+        # Rechunk a remapped dependency array to match any parent cube chunks.
+        # The leading dims of 'nd_values' are the cube 'derived_dims'.  Any
+        # length-1 (i.e. broadcast) dims, and any bounds dim, are unaffected.
+        if chunks is None or not derived_dims:
+            return nd_values
+        new_chunks = {}
+        for axis, dim in enumerate(derived_dims):
+            size = nd_values.shape[axis]
+            if size > 1 and size == sum(chunks[dim]):
+                new_chunks[axis] = chunks[dim]
+        if new_chunks:
+            nd_values = nd_values.rechunk(new_chunks)
+        return nd_values
+
     def update(self, old_coord, new_coord=None):
         """Notify the factory of the removal/replacement of a coordinate.
 
@@ -270,7 +317,7 @@ class AuxCoordFactory(CFVariableMixin, metaclass=ABCMeta):
             points = points[keys]
         return points
 
-    def _remap(self, dependency_dims, derived_dims):
+    def _remap(self, dependency_dims, derived_dims, chunks=None):
         """Return a mapping from dependency names to coordinate points arrays.
 
         For dependencies that are present, the values are all expanded and
@@ -299,6 +346,7 @@ class AuxCoordFactory(CFVariableMixin, metaclass=ABCMeta):
                         slice(None) if dim in derived_dims else 0 for dim in range(ndim)
                     )
                     nd_points = nd_points[keys]
+                nd_points = self._chunk_like_cube(nd_points, derived_dims, chunks)
             else:
                 # If no coord, treat value as zero.
                 # Use a float16 to provide `shape` attribute and avoid
@@ -308,7 +356,7 @@ class AuxCoordFactory(CFVariableMixin, metaclass=ABCMeta):
             nd_points_by_key[key] = nd_points
         return nd_points_by_key
 
-    def _remap_with_bounds(self, dependency_dims, derived_dims):
+    def _remap_with_bounds(self, dependency_dims, derived_dims, chunks=None):
         """Return a mapping from dependency names to coordinate bounds arrays.
 
         For dependencies that are present, the values are all expanded and
@@ -355,6 +403,7 @@ class AuxCoordFactory(CFVariableMixin, metaclass=ABCMeta):
                     # we just add an extra 1.
                     shape.append(1)
                 nd_values = nd_values.reshape(shape)
+                nd_values = self._chunk_like_cube(nd_values, derived_dims, chunks)
             else:
                 # If no coord, treat value as zero.
                 # Use a float16 to provide `shape` attribute and avoid
@@ -468,7 +517,7 @@ class AtmosphereSigmaFactory(AuxCoordFactory):
         """Derive coordinate."""
         return pressure_at_top + sigma * (surface_air_pressure - pressure_at_top)
 
-    def make_coord(self, coord_dims_func):
+    def make_coord(self, coord_dims_func, chunks=None):
         """Return a new :class:`iris.coords.AuxCoord` as defined by this factory.
 
         Parameters
@@ -478,6 +527,11 @@ class AtmosphereSigmaFactory(AuxCoordFactory):
             to a given coordinate.
 
             See :meth:`iris.cube.Cube.coord_dims()`.
+        chunks : tuple of tuple of int, optional
+            The chunks of the parent cube data, as for
+            :attr:`dask.array.Array.chunks`.  If given, the lazy dependency
+            values are rechunked to match, in each cube dimension which they
+            span, so the derived values are calculated block-by-block.
 
         """
         # Which dimensions are relevant?
@@ -485,7 +539,7 @@ class AtmosphereSigmaFactory(AuxCoordFactory):
         dependency_dims = self._dependency_dims(coord_dims_func)
 
         # Build the points array
-        nd_points_by_key = self._remap(dependency_dims, derived_dims)
+        nd_points_by_key = self._remap(dependency_dims, derived_dims, chunks)
         points = self._derive(
             nd_points_by_key["pressure_at_top"],
             nd_points_by_key["sigma"],
@@ -495,7 +549,9 @@ class AtmosphereSigmaFactory(AuxCoordFactory):
         # Bounds
         bounds = None
         if self.sigma.nbounds:
-            nd_values_by_key = self._remap_with_bounds(dependency_dims, derived_dims)
+            nd_values_by_key = self._remap_with_bounds(
+                dependency_dims, derived_dims, chunks
+            )
             pressure_at_top = nd_values_by_key["pressure_at_top"]
             sigma = nd_values_by_key["sigma"]
             surface_air_pressure = nd_values_by_key["surface_air_pressure"]
@@ -612,7 +668,7 @@ class HybridHeightFactory(AuxCoordFactory):
     def _derive(self, delta, sigma, orography):
         return delta + sigma * orography
 
-    def make_coord(self, coord_dims_func):
+    def make_coord(self, coord_dims_func, chunks=None):
         """Return a new :class:`iris.coords.AuxCoord` as defined by this factory.
 
         Parameters
@@ -622,6 +678,11 @@ class HybridHeightFactory(AuxCoordFactory):
             to a given coordinate.
 
             See :meth:`iris.cube.Cube.coord_dims()`.
+        chunks : tuple of tuple of int, optional
+            The chunks of the parent cube data, as for
+            :attr:`dask.array.Array.chunks`.  If given, the lazy dependency
+            values are rechunked to match, in each cube dimension which they
+            span, so the derived values are calculated block-by-block.
 
         """
         # Which dimensions are relevant?
@@ -629,7 +690,7 @@ class HybridHeightFactory(AuxCoordFactory):
         dependency_dims = self._dependency_dims(coord_dims_func)
 
         # Build the points array.
-        nd_points_by_key = self._remap(dependency_dims, derived_dims)
+        nd_points_by_key = self._remap(dependency_dims, derived_dims, chunks)
         points = self._derive(
             nd_points_by_key["delta"],
             nd_points_by_key["sigma"],
@@ -639,7 +700,9 @@ class HybridHeightFactory(AuxCoordFactory):
         bounds = None
         if (self.delta and self.delta.nbounds) or (self.sigma and self.sigma.nbounds):
             # Build the bounds array.
-            nd_values_by_key = self._remap_with_bounds(dependency_dims, derived_dims)
+            nd_values_by_key = self._remap_with_bounds(
+                dependency_dims, derived_dims, chunks
+            )
             delta = nd_values_by_key["delta"]
             sigma = nd_values_by_key["sigma"]
             orography = nd_values_by_key["orography"]
@@ -818,7 +881,7 @@ class HybridPressureFactory(AuxCoordFactory):
     def _derive(self, delta, sigma, surface_air_pressure):
         return delta + sigma * surface_air_pressure
 
-    def make_coord(self, coord_dims_func):
+    def make_coord(self, coord_dims_func, chunks=None):
         """Return a new :class:`iris.coords.AuxCoord` as defined by this factory.
 
         Parameters
@@ -828,6 +891,11 @@ class HybridPressureFactory(AuxCoordFactory):
             to a given coordinate.
 
             See :meth:`iris.cube.Cube.coord_dims()`.
+        chunks : tuple of tuple of int, optional
+            The chunks of the parent cube data, as for
+            :attr:`dask.array.Array.chunks`.  If given, the lazy dependency
+            values are rechunked to match, in each cube dimension which they
+            span, so the derived values are calculated block-by-block.
 
         """
         # Which dimensions are relevant?
@@ -835,7 +903,7 @@ class HybridPressureFactory(AuxCoordFactory):
         dependency_dims = self._dependency_dims(coord_dims_func)
 
         # Build the points array.
-        nd_points_by_key = self._remap(dependency_dims, derived_dims)
+        nd_points_by_key = self._remap(dependency_dims, derived_dims, chunks)
         points = self._derive(
             nd_points_by_key["delta"],
             nd_points_by_key["sigma"],
@@ -845,7 +913,9 @@ class HybridPressureFactory(AuxCoordFactory):
         bounds = None
         if (self.delta and self.delta.nbounds) or (self.sigma and self.sigma.nbounds):
             # Build the bounds array.
-            nd_values_by_key = self._remap_with_bounds(dependency_dims, derived_dims)
+            nd_values_by_key = self._remap_with_bounds(
+                dependency_dims, derived_dims, chunks
+            )
             delta = nd_values_by_key["delta"]
             sigma = nd_values_by_key["sigma"]
             surface_air_pressure = nd_values_by_key["surface_air_pressure"]
@@ -1080,7 +1150,7 @@ class OceanSigmaZFactory(AuxCoordFactory):
         result = concatenate([result_nsigma_levs, result_rest_levs], axis=z_dim)
         return result
 
-    def make_coord(self, coord_dims_func):
+    def make_coord(self, coord_dims_func, chunks=None):
         """Return a new :class:`iris.coords.AuxCoord` as defined by this factory.
 
         Parameters
@@ -1088,6 +1158,11 @@ class OceanSigmaZFactory(AuxCoordFactory):
         coord_dims_func :
             A callable which can return the list of dimensions relevant
             to a given coordinate. See :meth:`iris.cube.Cube.coord_dims()`.
+        chunks : tuple of tuple of int, optional
+            The chunks of the parent cube data, as for
+            :attr:`dask.array.Array.chunks`.  If given, the lazy dependency
+            values are rechunked to match, in each cube dimension which they
+            span, so the derived values are calculated block-by-block.
 
         """
         # Determine the relevant dimensions.
@@ -1095,7 +1170,7 @@ class OceanSigmaZFactory(AuxCoordFactory):
         dependency_dims = self._dependency_dims(coord_dims_func)
 
         # Build the points array.
-        nd_points_by_key = self._remap(dependency_dims, derived_dims)
+        nd_points_by_key = self._remap(dependency_dims, derived_dims, chunks)
 
         [nsigma] = nd_points_by_key["nsigma"]
         points = self._derive(
@@ -1111,7 +1186,9 @@ class OceanSigmaZFactory(AuxCoordFactory):
         bounds = None
         if self.zlev.nbounds or (self.sigma and self.sigma.nbounds):
             # Build the bounds array.
-            nd_values_by_key = self._remap_with_bounds(dependency_dims, derived_dims)
+            nd_values_by_key = self._remap_with_bounds(
+                dependency_dims, derived_dims, chunks
+            )
             valid_shapes = [(), (1,), (2,)]
             for key in ("sigma", "zlev"):
                 if nd_values_by_key[key].shape[-1:] not in valid_shapes:
@@ -1242,7 +1319,7 @@ class OceanSigmaFactory(AuxCoordFactory):
     def _derive(self, sigma, eta, depth):
         return eta + sigma * (depth + eta)
 
-    def make_coord(self, coord_dims_func):
+    def make_coord(self, coord_dims_func, chunks=None):
         """Return a new :class:`iris.coords.AuxCoord` as defined by this factory.
 
         Parameters
@@ -1250,6 +1327,11 @@ class OceanSigmaFactory(AuxCoordFactory):
         coord_dims_func :
             A callable which can return the list of dimensions relevant
             to a given coordinate. See :meth:`iris.cube.Cube.coord_dims()`.
+        chunks : tuple of tuple of int, optional
+            The chunks of the parent cube data, as for
+            :attr:`dask.array.Array.chunks`.  If given, the lazy dependency
+            values are rechunked to match, in each cube dimension which they
+            span, so the derived values are calculated block-by-block.
 
         """
         # Determine the relevant dimensions.
@@ -1257,7 +1339,7 @@ class OceanSigmaFactory(AuxCoordFactory):
         dependency_dims = self._dependency_dims(coord_dims_func)
 
         # Build the points array.
-        nd_points_by_key = self._remap(dependency_dims, derived_dims)
+        nd_points_by_key = self._remap(dependency_dims, derived_dims, chunks)
         points = self._derive(
             nd_points_by_key["sigma"],
             nd_points_by_key["eta"],
@@ -1267,7 +1349,9 @@ class OceanSigmaFactory(AuxCoordFactory):
         bounds = None
         if self.sigma and self.sigma.nbounds:
             # Build the bounds array.
-            nd_values_by_key = self._remap_with_bounds(dependency_dims, derived_dims)
+            nd_values_by_key = self._remap_with_bounds(
+                dependency_dims, derived_dims, chunks
+            )
             valid_shapes = [(), (1,), (2,)]
             key = "sigma"
             if nd_values_by_key[key].shape[-1:] not in valid_shapes:
@@ -1425,7 +1509,7 @@ class OceanSg1Factory(AuxCoordFactory):
         S = depth_c * s + (depth - depth_c) * c
         return S + eta * (1 + S / depth)
 
-    def make_coord(self, coord_dims_func):
+    def make_coord(self, coord_dims_func, chunks=None):
         """Return a new :class:`iris.coords.AuxCoord` as defined by this factory.
 
         Parameters
@@ -1433,6 +1517,11 @@ class OceanSg1Factory(AuxCoordFactory):
         coord_dims_func :
             A callable which can return the list of dimensions relevant
             to a given coordinate. See :meth:`iris.cube.Cube.coord_dims()`.
+        chunks : tuple of tuple of int, optional
+            The chunks of the parent cube data, as for
+            :attr:`dask.array.Array.chunks`.  If given, the lazy dependency
+            values are rechunked to match, in each cube dimension which they
+            span, so the derived values are calculated block-by-block.
 
         """
         # Determine the relevant dimensions.
@@ -1440,7 +1529,7 @@ class OceanSg1Factory(AuxCoordFactory):
         dependency_dims = self._dependency_dims(coord_dims_func)
 
         # Build the points array.
-        nd_points_by_key = self._remap(dependency_dims, derived_dims)
+        nd_points_by_key = self._remap(dependency_dims, derived_dims, chunks)
         points = self._derive(
             nd_points_by_key["s"],
             nd_points_by_key["c"],
@@ -1452,7 +1541,9 @@ class OceanSg1Factory(AuxCoordFactory):
         bounds = None
         if self.s.nbounds or (self.c and self.c.nbounds):
             # Build the bounds array.
-            nd_values_by_key = self._remap_with_bounds(dependency_dims, derived_dims)
+            nd_values_by_key = self._remap_with_bounds(
+                dependency_dims, derived_dims, chunks
+            )
             valid_shapes = [(), (1,), (2,)]
             key = "s"
             if nd_values_by_key[key].shape[-1:] not in valid_shapes:
@@ -1616,7 +1707,7 @@ class OceanSFactory(AuxCoordFactory):
         )
         return eta * (1 + s) + depth_c * s + (depth - depth_c) * c
 
-    def make_coord(self, coord_dims_func):
+    def make_coord(self, coord_dims_func, chunks=None):
         """Return a new :class:`iris.coords.AuxCoord` as defined by this factory.
 
         Parameters
@@ -1624,6 +1715,11 @@ class OceanSFactory(AuxCoordFactory):
         coord_dims_func :
             A callable which can return the list of dimensions relevant
             to a given coordinate. See :meth:`iris.cube.Cube.coord_dims()`.
+        chunks : tuple of tuple of int, optional
+            The chunks of the parent cube data, as for
+            :attr:`dask.array.Array.chunks`.  If given, the lazy dependency
+            values are rechunked to match, in each cube dimension which they
+            span, so the derived values are calculated block-by-block.
 
         """
         # Determine the relevant dimensions.
@@ -1631,7 +1727,7 @@ class OceanSFactory(AuxCoordFactory):
         dependency_dims = self._dependency_dims(coord_dims_func)
 
         # Build the points array.
-        nd_points_by_key = self._remap(dependency_dims, derived_dims)
+        nd_points_by_key = self._remap(dependency_dims, derived_dims, chunks)
         points = self._derive(
             nd_points_by_key["s"],
             nd_points_by_key["eta"],
@@ -1644,7 +1740,9 @@ class OceanSFactory(AuxCoordFactory):
         bounds = None
         if self.s.nbounds:
             # Build the bounds array.
-            nd_values_by_key = self._remap_with_bounds(dependency_dims, derived_dims)
+            nd_values_by_key = self._remap_with_bounds(
+                dependency_dims, derived_dims, chunks
+            )
             valid_shapes = [(), (1,), (2,)]
             key = "s"
             if nd_values_by_key[key].shape[-1:] not in valid_shapes:
@@ -1806,7 +1904,7 @@ class OceanSg2Factory(AuxCoordFactory):
         S = (depth_c * s + depth * c) / (depth_c + depth)
         return eta + (eta + depth) * S
 
-    def make_coord(self, coord_dims_func):
+    def make_coord(self, coord_dims_func, chunks=None):
         """Return a new :class:`iris.coords.AuxCoord` as defined by this factory.
 
         Parameters
@@ -1814,6 +1912,11 @@ class OceanSg2Factory(AuxCoordFactory):
         coord_dims_func :
             A callable which can return the list of dimensions relevant
             to a given coordinate. See :meth:`iris.cube.Cube.coord_dims()`.
+        chunks : tuple of tuple of int, optional
+            The chunks of the parent cube data, as for
+            :attr:`dask.array.Array.chunks`.  If given, the lazy dependency
+            values are rechunked to match, in each cube dimension which they
+            span, so the derived values are calculated block-by-block.
 
         """
         # Determine the relevant dimensions.
@@ -1821,7 +1924,7 @@ class OceanSg2Factory(AuxCoordFactory):
         dependency_dims = self._dependency_dims(coord_dims_func)
 
         # Build the points array.
-        nd_points_by_key = self._remap(dependency_dims, derived_dims)
+        nd_points_by_key = self._remap(dependency_dims, derived_dims, chunks)
         points = self._derive(
             nd_points_by_key["s"],
             nd_points_by_key["c"],
@@ -1833,7 +1936,9 @@ class OceanSg2Factory(AuxCoordFactory):
         bounds = None
         if self.s.nbounds or (self.c and self.c.nbounds):
             # Build the bounds array.
-            nd_values_by_key = self._remap_with_bounds(dependency_dims, derived_dims)
+            nd_values_by_key = self._remap_with_bounds(
+                dependency_dims, derived_dims, chunks
+            )
             valid_shapes = [(), (1,), (2,)]
             key = "s"
             if nd_values_by_key[key].shape[-1:] not in valid_shapes:
@@ -381,15 +381,15 @@ class _Lenient(threading.local):
 
         """
         result = False
-        if self.__dict__["enable"]:
+        active = self.__dict__["active"]
+        # Avoid resolving the service name when there is no active client.
+        if self.__dict__["enable"] and active is not None:
             service = _qualname(func)
-            if service in self and self.__dict__[service]:
-                active = self.__dict__["active"]
-                if active is not None and active in self:
-                    services = self.__dict__[active]
-                    if isinstance(services, str) or not isinstance(services, Iterable):
-                        services = (services,)
-                    result = service in services
+            if service in self and self.__dict__[service] and active in self:
+                services = self.__dict__[active]
+                if isinstance(services, str) or not isinstance(services, Iterable):
+                    services = (services,)
+                result = service in services
         return result
 
     def __contains__(self, name):
@@ -474,8 +474,9 @@ class _Lenient(threading.local):
 
             self.__dict__[client] = tuple(set(existing_services + services))
 
-        # Save the original state.
-        original_state = deepcopy(self.__dict__)
+        # Save the original state. All option values are immutable, and are
+        # only ever replaced, so a shallow copy is sufficient.
+        original_state = self.__dict__.copy()
 
         # Temporarily update the state with the kwargs first.
         for name, value in kwargs.items():
@@ -100,6 +100,23 @@ def hexdigest(item):
     return result
 
 
+def _hexdigest_equal(left, right):
+    """Determine whether two items have the same :func:`hexdigest`.
+
+    The hexdigests are only calculated when the items are not the same
+    object, nor both simple strings or integers.
+
+    """
+    if left is right:
+        result = True
+    elif type(left) is type(right) and type(left) in (str, int, bool):
+        result = left == right
+    else:
+        result = hexdigest(left) == hexdigest(right)
+
+    return result
+
+
 class _NamedTupleMeta(ABCMeta):
     """Meta-class convenience for creating a namedtuple.
 
@@ -165,6 +182,18 @@ class BaseMetadata(metaclass=_NamedTupleMeta):
     units: cf_units.Unit
     attributes: Any
 
+    # TODO: refactor so that 'non-participants' can be held in their specific subclasses.
+    # Certain members never participate in strict equivalence.
+    _NON_PARTICIPANTS = frozenset(
+        (
+            "circular",
+            "location_axis",
+            "node_dimension",
+            "edge_dimension",
+            "face_dimension",
+        )
+    )
+
     @lenient_service
     def __eq__(self, other):
         """Determine whether the associated metadata members are equivalent.
@@ -182,7 +211,10 @@ class BaseMetadata(metaclass=_NamedTupleMeta):
         result = NotImplemented
         # Only perform equivalence with similar class instances.
         if hasattr(other, "__class__") and other.__class__ is self.__class__:
-            if _LENIENT(self.__eq__) or _LENIENT(self.equal):
+            if other is self:
+                # Metadata is always equivalent to itself, whether lenient or strict.
+                result = True
+            elif _LENIENT(self.__eq__) or _LENIENT(self.equal):
                 # Perform "lenient" equality.
                 logger.debug("lenient", extra=dict(cls=self.__class__.__name__))
                 result = self._compare_lenient(other)
@@ -190,31 +222,22 @@ class BaseMetadata(metaclass=_NamedTupleMeta):
                 # Perform "strict" equality.
                 logger.debug("strict", extra=dict(cls=self.__class__.__name__))
 
-                def func(field):
+                result = True
+                # Note that, for strict we use "_fields" not "_members".
+                for field in self._fields:
+                    if field in self._NON_PARTICIPANTS:
+                        continue
                     left = getattr(self, field)
                     right = getattr(other, field)
+                    if left is right:
+                        continue
                     if self._is_attributes(field, left, right):
                         result = self._compare_strict_attributes(left, right)
                     else:
-                        result = left == right
-                    return result
-
-                # Note that, for strict we use "_fields" not "_members".
-                # TODO: refactor so that 'non-participants' can be held in their specific subclasses.
-                # Certain members never participate in strict equivalence, so
-                # are filtered out.
-                fields = filter(
-                    lambda field: field
-                    not in (
-                        "circular",
-                        "location_axis",
-                        "node_dimension",
-                        "edge_dimension",
-                        "face_dimension",
-                    ),
-                    self._fields,
-                )
-                result = all([func(field) for field in fields])
+                        result = bool(left == right)
+                    if not result:
+                        # Stop at the first member that differs.
+                        break
 
         return result
 
@@ -280,7 +303,9 @@ class BaseMetadata(metaclass=_NamedTupleMeta):
             emsg = "Cannot {} {!r} with {!r}."
             raise TypeError(emsg.format(action, self.__class__.__name__, type(other)))
 
-        if lenient is None:
+        if lenient is None or (not lenient and _LENIENT.active is None):
+            # Without an active lenient client, disabling the service
+            # makes no difference, so avoid the cost of the context.
             result = func_operation(other)
         else:
             if lenient:
@@ -445,30 +470,24 @@ class BaseMetadata(metaclass=_NamedTupleMeta):
     @staticmethod
     def _compare_lenient_attributes(left, right):
         """Perform lenient compare between the dictionary members."""
+        # Only the common item keys participate, and their values must match.
         # Use xxhash to perform an extremely fast non-cryptographic hash of
-        # each dictionary key rvalue, thus ensuring that the dictionary is
-        # completely hashable, as required by a set.
-        sleft = {(k, hexdigest(v)) for k, v in left.items()}
-        sright = {(k, hexdigest(v)) for k, v in right.items()}
-        # Items in sleft different from sright.
-        dsleft = dict(sleft - sright)
-        # Items in sright different from sleft.
-        dsright = dict(sright - sleft)
-        # Intersection of common item keys with different values.
-        keys = set(dsleft.keys()) & set(dsright.keys())
+        # any key rvalues that cannot be compared more cheaply.
+        keys = left.keys() & right.keys()
 
-        return not bool(keys)
+        return all(_hexdigest_equal(left[key], right[key]) for key in keys)
 
     @staticmethod
     def _compare_strict_attributes(left, right):
         """Perform strict compare between the dictionary members."""
-        # Use xxhash to perform an extremely fast non-cryptographic hash of
-        # each dictionary key rvalue, thus ensuring that the dictionary is
-        # completely hashable, as required by a set.
-        sleft = {(k, hexdigest(v)) for k, v in left.items()}
-        sright = {(k, hexdigest(v)) for k, v in right.items()}
+        # The item keys must match, then use xxhash to perform an extremely
+        # fast non-cryptographic hash of any key rvalues that cannot be
+        # compared more cheaply.
+        result = left.keys() == right.keys()
+        if result:
+            result = all(_hexdigest_equal(left[key], right[key]) for key in left)
 
-        return sleft == sright
+        return result
 
     def _difference(self, other):
         """Perform associated metadata member difference."""
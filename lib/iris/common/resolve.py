@@ -11,10 +11,12 @@ auto-transposed, and with the appropriate broadcast shape.
 
 """
 
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 from collections.abc import Iterable
-from dataclasses import dataclass
+from copy import copy
+from dataclasses import dataclass, field, replace
 import logging
+import threading
 from typing import Any
 
 from dask.array.core import broadcast_shapes
@@ -22,6 +24,7 @@ import numpy as np
 
 from ..config import get_logger
 from . import LENIENT
+from .lenient import _LENIENT
 
 __all__ = ["Resolve"]
 
@@ -69,6 +72,8 @@ class _PreparedItem:
     mesh: Any = None
     location: Any = None
     axis: Any = None
+    # The coordinate which the points and bounds are a copy of, if any.
+    source: Any = field(default=None, compare=False, repr=False)
 
     def create_coord(self, metadata):
         from iris.mesh import MeshCoord
@@ -743,6 +748,7 @@ class Resolve:
 
         from iris.mesh import MeshCoord
 
+        source = None
         if issubclass(container, MeshCoord):
             # Build a prepared-item to make a MeshCoord.
             # This case does *NOT* use points + bounds, so alternatives to the
@@ -765,6 +771,7 @@ class Resolve:
             if points is None:
                 points = coord.points
                 bounds = coord.bounds
+                source = coord
             # 'ELSE' points was passed: both points+bounds come from the args
 
             # Always *copy* points+bounds, to avoid any possible direct (shared)
@@ -782,6 +789,7 @@ class Resolve:
             location=location,
             axis=axis,
             container=container,
+            source=source,
         )
         return result
 
@@ -2599,3 +2607,225 @@ class Resolve:
 
         """  # noqa: D214, D406, D407, D410, D411
         return self._broadcast_shape
+
+
+# The maximum number of resolved operand signatures held by the cache.
+_RESOLVE_CACHE_SIZE = 16
+
+# Resolved operands, keyed by the structure of their coordinates, see _resolve.
+_RESOLVE_CACHE = OrderedDict()
+_RESOLVE_CACHE_LOCK = threading.Lock()
+
+
+def _resolve_signature(cube):
+    """Determine the coordinate signature of a cube operand.
+
+    Returns a hashable structure, of the shape of the cube and the type and
+    dimensions of each of its coordinates and aux factories, along with a
+    list of those coordinates and factories.  Together with the metadata and
+    values of the coordinates, these determine how the cube is resolved.
+    Returns ``None`` if the cube is not suitable for caching.
+
+    """
+    structure = [cube.shape]
+    members = []
+    indices = {}
+    for coords_and_dims in (cube._dim_coords_and_dims, cube._aux_coords_and_dims):
+        for coord, dims in coords_and_dims:
+            if (
+                hasattr(coord, "mesh")
+                or coord.has_lazy_points()
+                or coord.has_lazy_bounds()
+            ):
+                return None
+            indices[id(coord)] = len(members)
+            structure.append((type(coord), dims, coord.shape, coord.has_bounds()))
+            members.append(coord)
+    for factory in cube.aux_factories:
+        dependencies = tuple(
+            (name, None if coord is None else indices[id(coord)])
+            for name, coord in sorted(factory.dependencies.items())
+        )
+        structure.append((type(factory), dependencies))
+        members.append(factory)
+    return tuple(structure), members
+
+
+def _resolve_digest(coord):
+    """Calculate a digest of the points and bounds of a coordinate."""
+    from .metadata import hexdigest
+
+    def digest(values):
+        if values is None:
+            result = None
+        else:
+            if not values.flags.c_contiguous:
+                values = values.copy()
+            result = (values.dtype.str, hexdigest(values))
+        return result
+
+    return digest(coord.core_points()), digest(coord.core_bounds())
+
+
+def _resolve_cached(entry, members):
+    """Make a resolver from a cache entry, if it applies to the operand members.
+
+    Returns ``None`` if the metadata of any of the members differs from the
+    entry, or the digest of the values of any of the members which are not
+    simply copied to the resolved cube.
+
+    """
+    metadata, digests, sources, cached = entry
+
+    def identical(member_metadata, other):
+        # Compare every metadata member, whatever the lenient behaviour.
+        if member_metadata.__class__ is not other.__class__:
+            return False
+        return all(
+            member_metadata._compare_strict_attributes(left, right)
+            if member_metadata._is_attributes(name, left, right)
+            else left == right
+            for name, left, right in zip(
+                member_metadata._fields, member_metadata, other
+            )
+        )
+
+    if not all(
+        identical(member.metadata, member_metadata)
+        for member, member_metadata in zip(members, metadata)
+    ):
+        return None
+
+    for index, digest in digests.items():
+        if _resolve_digest(members[index]) != digest:
+            return None
+
+    def prepare(item, index):
+        # Give the resolved cube coordinates their own points and bounds,
+        # taking them from the operands for the coordinates that are copied.
+        if index is None:
+            points, bounds = item.points, item.bounds
+        else:
+            coord = members[index]
+            points, bounds = coord.core_points(), coord.core_bounds()
+        points = points.copy()
+        if bounds is not None:
+            bounds = bounds.copy()
+        return replace(
+            item,
+            points=points,
+            bounds=bounds,
+            source=None if index is None else members[index],
+        )
+
+    resolver = copy(cached)
+    resolver.prepared_category = _CategoryItems(
+        *[
+            [prepare(item, index) for item, index in zip(items, indices)]
+            for items, indices in zip(cached.prepared_category, sources)
+        ]
+    )
+    return resolver
+
+
+def _resolve(lhs, rhs):
+    """Resolve the cube operands, as :class:`Resolve`, using a cache.
+
+    Resolving the metadata of the operands can take much longer than the
+    arithmetic itself, e.g. when subtracting a climatology from many cubes in
+    turn.  So the outcome is cached, keyed by the structure of the
+    coordinates of both operands, and reused for later operands with the same
+    coordinate metadata, and the same coordinate values except for those
+    which are simply copied to the resolved cube (e.g. a scalar time
+    coordinate).  For such operands, the outcome must be the same.
+
+    The cache holds no coordinates or cubes, so a resolver taken from it has
+    no categorised items or coverages, only what is needed to make the
+    resolved cube.
+
+    """
+    lhs_signature = _resolve_signature(lhs)
+    rhs_signature = _resolve_signature(rhs)
+    if lhs_signature is None or rhs_signature is None:
+        return Resolve(lhs, rhs)
+
+    # How the operands resolve also depends on the lenient behaviour.
+    lenient = (_LENIENT.enable, _LENIENT.active, LENIENT["maths"])
+    key = (lenient, lhs_signature[0], rhs_signature[0])
+    members = lhs_signature[1] + rhs_signature[1]
+
+    with _RESOLVE_CACHE_LOCK:
+        entry = _RESOLVE_CACHE.get(key)
+        if entry is not None:
+            _RESOLVE_CACHE.move_to_end(key)
+
+    resolver = None
+    if entry is not None:
+        resolver = _resolve_cached(entry, members)
+
+    if resolver is None:
+        resolver = Resolve(lhs, rhs)
+
+        # Find the operand coordinates which are copied to the resolved cube.
+        indices = {id(member): index for index, member in enumerate(members)}
+        sources = [
+            [indices.get(id(item.source)) for item in items]
+            for items in resolver.prepared_category
+        ]
+        copied = {index for items in sources for index in items}
+
+        # Cache a copy of the resolver without the operands or any of their
+        # coordinates, nor the values of the copied coordinates, along with
+        # the metadata and digests of values that it was resolved with.
+        cached = copy(resolver)
+        for name in (
+            "lhs_cube",
+            "rhs_cube",
+            "lhs_cube_resolved",
+            "rhs_cube_resolved",
+            "lhs_cube_category",
+            "rhs_cube_category",
+            "lhs_cube_category_local",
+            "rhs_cube_category_local",
+            "category_common",
+            "lhs_cube_dim_coverage",
+            "lhs_cube_aux_coverage",
+            "rhs_cube_dim_coverage",
+            "rhs_cube_aux_coverage",
+        ):
+            setattr(cached, name, None)
+
+        def strip(item, index):
+            # The points and bounds of the resolved cube coordinates which
+            # are not copied from the operands, which must be our own.
+            if index is None:
+                points, bounds = item.points.copy(), item.bounds
+                if bounds is not None:
+                    bounds = bounds.copy()
+            else:
+                points = bounds = None
+            return replace(item, points=points, bounds=bounds, source=None)
+
+        cached.prepared_category = _CategoryItems(
+            *[
+                [strip(item, index) for item, index in zip(items, indices)]
+                for items, indices in zip(resolver.prepared_category, sources)
+            ]
+        )
+        metadata = [member.metadata for member in members]
+        digests = {
+            index: _resolve_digest(member)
+            for index, member in enumerate(members)
+            if index not in copied and not hasattr(member, "dependencies")
+        }
+        with _RESOLVE_CACHE_LOCK:
+            _RESOLVE_CACHE[key] = (metadata, digests, sources, cached)
+            _RESOLVE_CACHE.move_to_end(key)
+            while len(_RESOLVE_CACHE) > _RESOLVE_CACHE_SIZE:
+                _RESOLVE_CACHE.popitem(last=False)
+    else:
+        resolver.lhs_cube = lhs
+        resolver.rhs_cube = rhs
+        resolver._as_compatible_cubes()
+
+    return resolver
@@ -156,6 +156,28 @@ class _DimensionalMetadata(CFVariableMixin, metaclass=ABCMeta):
 
         return new_metadata
 
+    def _view(self, keys=None):
+        """Return a copy of this dimensional metadata which shares its arrays.
+
+        The values (and bounds) of the copy are read-only views of those of
+        this object, optionally indexed with the given keys, as for
+        :meth:`__getitem__`.  Unlike :meth:`__getitem__` and :meth:`copy`, no
+        arrays are copied.
+
+        """
+        # Deep-copy everything but the data managers, which are replaced via
+        # the memo with new ones managing the views.
+        memo = {}
+        for name, ndmin in (("_values_dm", 1), ("_bounds_dm", 2)):
+            dm = getattr(self, name)
+            if dm is not None:
+                array = dm.core_data()
+                if keys is not None:
+                    _, array = iris.util._slice_data_with_keys(array, keys)
+                view = iris.util._read_only_view(array, ndmin=ndmin)
+                memo[id(dm)] = DataManager(view)
+        return copy.deepcopy(self, memo)
+
     def copy(self, values=None):
         """Return a copy of this dimensional metadata object.
 
@@ -1427,6 +1449,147 @@ class Cell(namedtuple("Cell", ["point", "bound"])):
         return np.min(self.bound) <= point <= np.max(self.bound)
 
 
+class _NearestNeighbourPlan:
+    """One-dimensional coordinate values prepared for nearest-neighbour searches.
+
+    The algorithm:  given a value (V),
+      if coord has bounds,
+        make bounds cells complete and non-overlapping
+        return first cell containing V
+      else (no bounds),
+        find the point which is closest to V
+        or if two are equally close, return the lowest index
+
+    Where the prepared values allow, many values are searched for at once with
+    :func:`numpy.searchsorted`.  Otherwise, each value is searched for in turn.
+
+    """
+
+    def __init__(self, coord, dtype=None, wrap_modulus=None):
+        if coord.has_bounds():
+            self._init_bounds(coord.bounds, dtype)
+        else:
+            self._init_points(coord.points, wrap_modulus)
+
+    def _init_bounds(self, bounds, dtype):
+        # make bounds ranges complete+separate, so point is in at least one
+        increasing = bounds[0, 1] > bounds[0, 0]
+        bounds = bounds.astype(dtype)
+        # sort the bounds cells by their centre values
+        sort_inds = np.argsort(np.mean(bounds, axis=1))
+        bounds = bounds[sort_inds]
+        # replace all adjacent bounds with their averages
+        if increasing:
+            mid_bounds = 0.5 * (bounds[:-1, 1] + bounds[1:, 0])
+            bounds[:-1, 1] = mid_bounds
+            bounds[1:, 0] = mid_bounds
+            lower, upper = bounds[:, 0], bounds[:, 1]
+        else:
+            mid_bounds = 0.5 * (bounds[:-1, 0] + bounds[1:, 1])
+            bounds[:-1, 0] = mid_bounds
+            bounds[1:, 1] = mid_bounds
+            lower, upper = bounds[:, 1], bounds[:, 0]
+        self.bounds = bounds
+        self.sort_inds = sort_inds
+
+        # If all the cells are now the right way round, they are contiguous with
+        # ascending edges, and the first cell containing a value is the first
+        # whose upper edge is not below it.
+        self.edges = None
+        if bounds.shape[1] == 2 and np.all(lower <= upper):
+            self.edges = upper[:-1]
+
+    def _init_points(self, points, wrap_modulus):
+        self.size = points.shape[0]
+        self.index_offset = 0
+        if wrap_modulus is not None:
+            # add an extra, wrapped max point (simpler than bounds case)
+            # NOTE: circular implies a DimCoord, so *must* be monotonic
+            if points[-1] >= points[0]:
+                # ascending value order : add wrapped lowest value to end
+                points = np.hstack((points, points[0] + wrap_modulus))
+            else:
+                # descending order : add wrapped lowest value at start
+                self.index_offset = 1
+                points = np.hstack((points[-1] + wrap_modulus, points))
+        self.points = points
+        # The sorted points, and their indices, for each dtype of search value.
+        self._sorted = {}
+
+    @staticmethod
+    def _searchable(values):
+        # Whether the values can be searched for all at once.
+        result = True
+        if values.dtype.kind in "fc":
+            result = np.all(np.isfinite(values))
+        return result
+
+    def cell_indices(self, values):
+        """Return the index of the first cell containing each of the values."""
+        if self.edges is not None and self._searchable(values):
+            result = np.searchsorted(self.edges, values, side="left")
+            result = self.sort_inds[result]
+        else:
+            result = np.array(
+                [self._cell_index(value) for value in values], dtype=np.intp
+            )
+        return result
+
+    def _cell_index(self, value):
+        bounds = self.bounds.copy()
+        # if point lies beyond either end, fix the end cell to include it
+        bounds[0, 0] = min(value, bounds[0, 0])
+        bounds[-1, 1] = max(value, bounds[-1, 1])
+        # get index of first-occurring cell that contains the point
+        inside_cells = np.logical_and(
+            value >= np.min(bounds, axis=1),
+            value <= np.max(bounds, axis=1),
+        )
+        result_index = np.where(inside_cells)[0][0]
+        # return the original index of the cell (before the bounds sort)
+        return self.sort_inds[result_index]
+
+    def point_indices(self, values):
+        """Return the index of the first-occurring nearest point to each of the values."""
+        dtype = values.dtype
+        points = self.points.astype(dtype, copy=False)
+        if dtype not in self._sorted:
+            order = np.argsort(points, kind="stable")
+            self._sorted[dtype] = (points[order], order)
+        sorted_points, order = self._sorted[dtype]
+
+        if self._searchable(points) and self._searchable(values):
+            # The nearest points are either side of where each value would be
+            # inserted.  Of each run of equal points, the first sorted is the
+            # first-occurring.
+            n_points = sorted_points.size
+            above = np.searchsorted(sorted_points, values, side="left")
+            below = np.maximum(above - 1, 0)
+            below = np.searchsorted(sorted_points, sorted_points[below], side="left")
+            above = np.minimum(above, n_points - 1)
+            distance_below = np.abs(sorted_points[below] - values)
+            distance_above = np.abs(sorted_points[above] - values)
+            below, above = order[below], order[above]
+            result = np.where(
+                distance_below == distance_above,
+                np.minimum(below, above),
+                np.where(distance_below < distance_above, below, above),
+            )
+        else:
+            result = np.array(
+                [self._point_index(points, value) for value in values],
+                dtype=np.intp,
+            )
+        # convert index back from circular-adjusted points
+        return (result - self.index_offset) % self.size
+
+    @staticmethod
+    def _point_index(points, value):
+        # return index of first-occurring nearest point
+        distances = np.abs(points - value)
+        return np.where(distances == np.min(distances))[0][0]
+
+
 class Coord(_DimensionalMetadata):
     """Abstract base class for coordinates."""
 
@@ -2441,81 +2604,113 @@ class Coord(_DimensionalMetadata):
         .. note:: For circular coordinates, the 'nearest' point can wrap around
             to the other end of the values.
 
+        .. seealso:: :meth:`nearest_neighbour_indices` to find the indices
+            of many points at once.
+
         """
-        points = self.points
-        bounds = self.bounds if self.has_bounds() else np.array([])
+        return self._nearest_neighbour_indices(point)[0]
+
+    def nearest_neighbour_indices(self, points):
+        """Return the indices of the cells nearest to each of the given points.
+
+        Equivalent to calling :meth:`nearest_neighbour_index` for each point,
+        but the coordinate values are only prepared once, and all the points
+        are searched for together.
+
+        Only works for one-dimensional coordinates.
+
+        Parameters
+        ----------
+        points : array-like
+            The values to find the nearest cells to.
+
+        Returns
+        -------
+        :class:`numpy.ndarray` of int
+            The index of the nearest cell to each point, with the same shape
+            as ``points``.
+
+        For example:
+
+        >>> coord = iris.coords.DimCoord([0, 90, 180, 270], units="degrees")
+        >>> coord.nearest_neighbour_indices([10, 100, 260])
+        array([0, 1, 3])
+
+        .. note:: The preparation of the coordinate values is cached, and
+            reused for as long as the coordinate points and bounds are
+            unchanged and read-only, as they are for a
+            :class:`~iris.coords.DimCoord`.
+
+        """
+        points = np.asarray(points)
+        return self._nearest_neighbour_indices(points).reshape(points.shape)
+
+    def _nearest_neighbour_indices(self, point):
+        # Return a 1-d array of nearest neighbour indices of the point(s).
+        # A scalar point is kept as such, so that its dtype promotion with
+        # the coordinate values is the same as for any numpy scalar operation.
         if self.ndim != 1:
             raise ValueError(
                 "Nearest-neighbour is currently limited"
                 " to one-dimensional coordinates."
             )
-        do_circular = getattr(self, "circular", False)
-        if do_circular:
+        target = point
+        points = self.points
+        bounds = self.bounds if self.has_bounds() else np.array([])
+        if getattr(self, "circular", False):
             wrap_modulus = self.units.modulus
             # wrap 'point' to a range based on lowest points or bounds value.
             wrap_origin = np.min(np.hstack((points, bounds.flatten())))
             point = wrap_origin + (point - wrap_origin) % wrap_modulus
+        if np.ndim(point) or isinstance(point, (str, bytes)):
+            point = np.asarray(point)
+
+        def checked(dtype):
+            # Only numbers have distances between them.
+            if dtype.kind not in "biufcO":
+                emsg = "Cannot find the nearest neighbour to {!r} in {!r} values."
+                raise TypeError(emsg.format(target, self.name()))
+            return dtype
 
-        # Calculate the nearest neighbour.
-        # The algorithm:  given a single value (V),
-        #   if coord has bounds,
-        #     make bounds cells complete and non-overlapping
-        #     return first cell containing V
-        #   else (no bounds),
-        #     find the point which is closest to V
-        #     or if two are equally close, return the lowest index
         if self.has_bounds():
-            # make bounds ranges complete+separate, so point is in at least one
-            increasing = self.bounds[0, 1] > self.bounds[0, 0]
             # identify data type that bounds and point can safely cast to
-            dtype = np.result_type(bounds, point)
-            bounds = bounds.astype(dtype)
-            # sort the bounds cells by their centre values
-            sort_inds = np.argsort(np.mean(bounds, axis=1))
-            bounds = bounds[sort_inds]
-            # replace all adjacent bounds with their averages
-            if increasing:
-                mid_bounds = 0.5 * (bounds[:-1, 1] + bounds[1:, 0])
-                bounds[:-1, 1] = mid_bounds
-                bounds[1:, 0] = mid_bounds
-            else:
-                mid_bounds = 0.5 * (bounds[:-1, 0] + bounds[1:, 1])
-                bounds[:-1, 0] = mid_bounds
-                bounds[1:, 1] = mid_bounds
-
-            # if point lies beyond either end, fix the end cell to include it
-            bounds[0, 0] = min(point, bounds[0, 0])
-            bounds[-1, 1] = max(point, bounds[-1, 1])
-            # get index of first-occurring cell that contains the point
-            inside_cells = np.logical_and(
-                point >= np.min(bounds, axis=1),
-                point <= np.max(bounds, axis=1),
-            )
-            result_index = np.where(inside_cells)[0][0]
-            # return the original index of the cell (before the bounds sort)
-            result_index = sort_inds[result_index]
-
-        # Or, if no bounds, we always have points ...
+            dtype = checked(np.result_type(bounds, point))
+            plan = self._nearest_neighbour_plan(dtype)
+            result = plan.cell_indices(np.asarray(point, dtype=dtype).reshape(-1))
         else:
-            if do_circular:
-                # add an extra, wrapped max point (simpler than bounds case)
-                # NOTE: circular implies a DimCoord, so *must* be monotonic
-                if points[-1] >= points[0]:
-                    # ascending value order : add wrapped lowest value to end
-                    index_offset = 0
-                    points = np.hstack((points, points[0] + wrap_modulus))
-                else:
-                    # descending order : add wrapped lowest value at start
-                    index_offset = 1
-                    points = np.hstack((points[-1] + wrap_modulus, points))
-            # return index of first-occurring nearest point
-            distances = np.abs(points - point)
-            result_index = np.where(distances == np.min(distances))[0][0]
-            if do_circular:
-                # convert index back from circular-adjusted points
-                result_index = (result_index - index_offset) % self.shape[0]
-
-        return result_index
+            plan = self._nearest_neighbour_plan()
+            dtype = checked(np.result_type(plan.points, point))
+            result = plan.point_indices(np.asarray(point, dtype=dtype).reshape(-1))
+        return result
+
+    def _nearest_neighbour_plan(self, dtype=None):
+        # Return the coordinate values prepared for nearest-neighbour searches
+        # of points of the given dtype.
+        # The plans are cached, for as long as the coordinate values are the
+        # same, read-only, arrays.
+        do_circular = getattr(self, "circular", False)
+        wrap_modulus = self.units.modulus if do_circular else None
+        arrays = [self._values_dm.core_data()]
+        if self.has_bounds():
+            arrays.append(self._bounds_dm.core_data())
+
+        cacheable = all(_is_read_only(array) for array in arrays)
+
+        key = (dtype, do_circular, wrap_modulus)
+        cache = getattr(self, "_nearest_neighbour_cache", None)
+        if (
+            cache is None
+            or len(cache[0]) != len(arrays)
+            or any(cached is not array for cached, array in zip(cache[0], arrays))
+        ):
+            cache = (arrays, {})
+        plan = cache[1].get(key)
+        if plan is None:
+            plan = _NearestNeighbourPlan(self, dtype, wrap_modulus)
+            if cacheable:
+                cache[1][key] = plan
+                self._nearest_neighbour_cache = cache
+        return plan
 
     def xml_element(self, doc):
         """Create the :class:`xml.dom.minidom.Element` that describes this :class:`Coord`.
@@ -2552,6 +2747,27 @@ _regular_points = lru_cache(iris.util.regular_points)
 """Caching version of iris.util.regular_points"""
 
 
+def _set_read_only(array):
+    # Make a real array read-only, along with the arrays it is a view of.
+    # N.B. only for the arrays of a DimCoord, which are views of its own
+    # copy of the values.
+    while isinstance(array, np.ndarray):
+        array.flags.writeable = False
+        array = array.base
+
+
+def _is_read_only(array):
+    # Whether a real array cannot change, i.e. neither it, nor any array it
+    # is a view of, is writeable.
+    # N.B. a read-only view, e.g. from Cube.view, can still change through a
+    # writeable base array.
+    while isinstance(array, np.ndarray):
+        if array.flags.writeable:
+            return False
+        array = array.base
+    return array is None
+
+
 class DimCoord(Coord):
     """A coordinate that is 1D, and numeric.
 
@@ -2708,9 +2924,9 @@ class DimCoord(Coord):
         """
         new_coord = copy.deepcopy(super(), memo)
         # Ensure points and bounds arrays are read-only.
-        new_coord._values_dm.data.flags.writeable = False
+        _set_read_only(new_coord._values_dm.data)
         if new_coord._bounds_dm is not None:
-            new_coord._bounds_dm.data.flags.writeable = False
+            _set_read_only(new_coord._bounds_dm.data)
         return new_coord
 
     @property
@@ -2724,9 +2940,9 @@ class DimCoord(Coord):
     def copy(self, points=None, bounds=None):
         new_coord = super().copy(points=points, bounds=bounds)
         # Make the arrays read-only.
-        new_coord._values_dm.data.flags.writeable = False
+        _set_read_only(new_coord._values_dm.data)
         if bounds is not None:
-            new_coord._bounds_dm.data.flags.writeable = False
+            _set_read_only(new_coord._bounds_dm.data)
         return new_coord
 
     def __eq__(self, other):
@@ -2754,6 +2970,20 @@ class DimCoord(Coord):
         coord.circular = self.circular and coord.shape == self.shape
         return coord
 
+    def _view(self, keys=None):
+        coord = super()._view(keys)
+        if keys is not None:
+            # Check that the indexed arrays are still valid, as the setters
+            # would for __getitem__.
+            coord._new_points_requirements(coord._values_dm.core_data())
+            if coord.has_bounds():
+                bounds = coord._bounds_dm.core_data()
+                new_bounds = coord._new_bounds_requirements(bounds)
+                if new_bounds is not bounds:
+                    coord._bounds_dm = DataManager(new_bounds)
+            coord.circular = self.circular and coord.shape == self.shape
+        return coord
+
     def collapsed(self, dims_to_collapse=None):
         coord = Coord.collapsed(self, dims_to_collapse=dims_to_collapse)
         if self.circular and self.units.modulus is not None:
@@ -2817,7 +3047,7 @@ class DimCoord(Coord):
             # N.B. always a *real* array, as we realised 'points' at the start.
 
             # Make the array read-only.
-            points.flags.writeable = False
+            _set_read_only(points)
 
     def _new_bounds_requirements(self, bounds):
         """Confirm that a new set of coord bounds adheres to the requirements.
@@ -2915,7 +3145,7 @@ class DimCoord(Coord):
             # N.B. always a *real* array, as we realised 'bounds' at the start.
 
             # Ensure the array is read-only.
-            bounds.flags.writeable = False
+            _set_read_only(bounds)
 
     def is_monotonic(self):
         return True
@@ -706,13 +706,23 @@ class CubeList(list):
             check_derived_coords=check_derived_coords,
         )
 
-    def realise_data(self):
+    def realise_data(self, metadata=False, max_bytes=None):
         """Fetch 'real' data for all cubes, in a shared calculation.
 
         This computes any lazy data, equivalent to accessing each `cube.data`.
         However, lazy calculations and data fetches can be shared between the
         computations, improving performance.
 
+        Parameters
+        ----------
+        metadata : bool, default=False
+            If True, also realise any lazy coordinate points and bounds, cell
+            measures and ancillary variables of the cubes, in the same
+            calculation.
+        max_bytes : int, optional
+            If set, compute the lazy arrays in batches, each with results of
+            at most this many bytes (or a single larger array).
+
         For example::
 
             # Form stats.
@@ -730,7 +740,7 @@ class CubeList(list):
             Cubes with non-lazy data are not affected.
 
         """
-        _lazy.co_realise_cubes(*self)
+        _lazy.co_realise_cubes(*self, metadata=metadata, max_bytes=max_bytes)
 
     def copy(self):
         """Return a CubeList when CubeList.copy() is called."""
@@ -2252,7 +2262,7 @@ class Cube(CFVariableMixin):
         # coords so they can be returned
         def extract_coord(coord_or_factory):
             if isinstance(coord_or_factory, iris.aux_factory.AuxCoordFactory):
-                coord = coord_or_factory.make_coord(self.coord_dims)
+                coord = self._make_derived_coord(coord_or_factory)
             elif isinstance(coord_or_factory, iris.coords.Coord):
                 coord = coord_or_factory
             else:
@@ -2913,12 +2923,18 @@ class Cube(CFVariableMixin):
     def derived_coords(self) -> tuple[AuxCoord, ...]:
         """Return a tuple of all the coordinates generated by the coordinate factories."""
         return tuple(
-            factory.make_coord(self.coord_dims)
+            self._make_derived_coord(factory)
             for factory in sorted(
                 self.aux_factories, key=lambda factory: factory.name()
             )
         )
 
+    def _make_derived_coord(self, factory: AuxCoordFactory) -> AuxCoord:
+        # Make the coord of an aux factory.  For lazy cube data, the derived
+        # values are chunked to match, so they can be calculated blockwise.
+        chunks = self.lazy_data().chunks if self.has_lazy_data() else None
+        return factory._make_coord_chunked(self.coord_dims, chunks)
+
     @property
     def aux_factories(self) -> tuple[AuxCoordFactory, ...]:
         """Return a tuple of all the coordinate factories."""
@@ -2973,6 +2989,11 @@ class Cube(CFVariableMixin):
         metadata will be subsequently indexed appropriately.
 
         """
+        return self._getitem(keys)
+
+    def _getitem(self, keys, share=False):
+        # Index the cube, as for __getitem__, but with read-only views of the
+        # data and the dimensional metadata arrays if 'share' is set.
         # turn the keys into a full slice spec (all dims)
         full_slice = iris.util._build_full_slice_given_keys(keys, self.ndim)
 
@@ -3003,8 +3024,9 @@ class Cube(CFVariableMixin):
         # Index with the keys, using orthogonal slicing.
         dimension_mapping, data = iris.util._slice_data_with_keys(cube_data, keys)
 
-        # We don't want a view of the data, so take a copy of it.
-        data = deepcopy(data)
+        if not share:
+            # We don't want a view of the data, so take a copy of it.
+            data = deepcopy(data)
 
         # XXX: Slicing a single item from a masked array that is masked,
         #      results in numpy (v1.11.1) *always* returning a MaskedConstant
@@ -3013,6 +3035,17 @@ class Cube(CFVariableMixin):
         if isinstance(data, ma.core.MaskedConstant) and data.dtype != cube_data.dtype:
             data = ma.array(data.data, mask=data.mask, dtype=cube_data.dtype)
 
+        if share:
+            data = iris.util._read_only_view(data)
+
+        def index(dim_meta, keys):
+            # Index any dimensional metadata.
+            if share:
+                result = dim_meta._view(keys)
+            else:
+                result = dim_meta[keys]
+            return result
+
         # Make the new cube slice
         cube = self.__class__(data)
         cube.metadata = deepcopy(self.metadata)
@@ -3025,11 +3058,11 @@ class Cube(CFVariableMixin):
         for coord in self.aux_coords:
             coord_keys = tuple([full_slice[dim] for dim in self.coord_dims(coord)])
             try:
-                new_coord = coord[coord_keys]
+                new_coord = index(coord, coord_keys)
             except ValueError:
                 # TODO make this except more specific to catch monotonic error
                 # Attempt to slice it by converting to AuxCoord first
-                new_coord = iris.coords.AuxCoord.from_coord(coord)[coord_keys]
+                new_coord = index(iris.coords.AuxCoord.from_coord(coord), coord_keys)
             cube.add_aux_coord(new_coord, new_coord_dims(coord))
             coord_mapping[id(coord)] = new_coord
 
@@ -3039,7 +3072,7 @@ class Cube(CFVariableMixin):
             # Try/Catch to handle slicing that makes the points/bounds
             # non-monotonic
             try:
-                new_coord = coord[coord_keys]
+                new_coord = index(coord, coord_keys)
                 if not new_dims:
                     # If the associated dimension has been sliced so the coord
                     # is a scalar move the coord to the aux_coords container
@@ -3049,7 +3082,7 @@ class Cube(CFVariableMixin):
             except ValueError:
                 # TODO make this except more specific to catch monotonic error
                 # Attempt to slice it by converting to AuxCoord first
-                new_coord = iris.coords.AuxCoord.from_coord(coord)[coord_keys]
+                new_coord = index(iris.coords.AuxCoord.from_coord(coord), coord_keys)
                 cube.add_aux_coord(new_coord, new_dims)
             coord_mapping[id(coord)] = new_coord
 
@@ -3060,14 +3093,14 @@ class Cube(CFVariableMixin):
         for cellmeasure in self.cell_measures():
             dims = self.cell_measure_dims(cellmeasure)
             cm_keys = tuple([full_slice[dim] for dim in dims])
-            new_cm = cellmeasure[cm_keys]
+            new_cm = index(cellmeasure, cm_keys)
             cube.add_cell_measure(new_cm, new_cell_measure_dims(cellmeasure))
 
         # slice the ancillary variables and add them to the cube
         for ancvar in self.ancillary_variables():
             dims = self.ancillary_variable_dims(ancvar)
             av_keys = tuple([full_slice[dim] for dim in dims])
-            new_av = ancvar[av_keys]
+            new_av = index(ancvar, av_keys)
             cube.add_ancillary_variable(new_av, new_ancillary_variable_dims(ancvar))
 
         return cube
@@ -3556,6 +3589,7 @@ class Cube(CFVariableMixin):
         | DimCoord
         | int
         | Iterable[str | AuxCoord | DimCoord | int],
+        copy: bool = True,
     ) -> Iterable[Cube]:
         """Return an iterator of all subcubes.
 
@@ -3568,6 +3602,9 @@ class Cube(CFVariableMixin):
             Determines which dimensions will be iterated along (i.e. the
             dimensions that are not returned in the subcubes).
             A mix of input types can also be provided.
+        copy :
+            If False, the subcubes are views, which share read-only arrays
+            with this cube, as for :meth:`view`, instead of copies.
 
         Returns
         -------
@@ -3646,7 +3683,7 @@ class Cube(CFVariableMixin):
 
         all_dims = set(range(self.ndim))
         opposite_dims = list(all_dims - slice_dims)
-        return self.slices(opposite_dims, ordered=False)
+        return self.slices(opposite_dims, ordered=False, copy=copy)
 
     def slices(
         self,
@@ -3656,6 +3693,7 @@ class Cube(CFVariableMixin):
         | int
         | Iterable[str | AuxCoord | DimCoord | int],
         ordered: bool = True,
+        copy: bool = True,
     ) -> Iterator[Cube]:
         """Return an iterator of all subcubes given the coordinates or dimension indices.
 
@@ -3673,6 +3711,9 @@ class Cube(CFVariableMixin):
             If True, subcube dimensions are ordered to match the dimension order
             in `ref_to_slice`. If False, the order will follow that of
             the source cube.
+        copy :
+            If False, the subcubes are views, which share read-only arrays
+            with this cube, as for :meth:`view`, instead of copies.
 
         Returns
         -------
@@ -3774,7 +3815,7 @@ class Cube(CFVariableMixin):
         for d in dim_to_slice:
             dims_index[d] = 1
 
-        return _SliceIterator(self, dims_index, dim_to_slice, ordered)
+        return _SliceIterator(self, dims_index, dim_to_slice, ordered, copy=copy)
 
     def transpose(self, new_order: list[int] | None = None) -> None:
         """Re-order the data dimensions of the cube in-place.
@@ -4035,6 +4076,48 @@ class Cube(CFVariableMixin):
         cube = self._deepcopy(memo, data=data)
         return cube
 
+    def view(self, keys=None) -> Cube:
+        """Return a view of this cube, which shares its data and metadata arrays.
+
+        The result is equivalent to ``cube.copy()``, or ``cube[keys]`` if
+        ``keys`` are given, except that no arrays are copied : the data, and the
+        points, bounds and values of the coordinates, cell measures and
+        ancillary variables are all read-only views of those of this cube.
+        This avoids the memory and time cost of copying them, e.g. when
+        processing the slices of a large cube with real data.
+
+        Parameters
+        ----------
+        keys : optional
+            Indices of the cube data, as for cube indexing.
+
+        Returns
+        -------
+        :class:`Cube`
+
+        Notes
+        -----
+        Modifying the arrays of the view in place raises an error, and in-place
+        changes to the arrays of this cube are seen by the view.  But new
+        arrays can be assigned to the view, e.g. ``view.data = view.data * 2``,
+        or the view can be copied with :meth:`copy`, without affecting this
+        cube.
+
+        This operation does not realise lazy data.
+
+        See Also
+        --------
+        iris.cube.Cube.slices :
+            Return an iterator of all subcubes, optionally as views.
+
+        """
+        if keys is None:
+            memo: dict[int, Any] = {}
+            result = self._deepcopy(memo, share=True)
+        else:
+            result = self._getitem(keys, share=True)
+        return result
+
     def __copy__(self):
         """Shallow copying is disallowed for Cubes."""
         raise copy.Error("Cube shallow-copy not allowed. Use deepcopy() or Cube.copy()")
@@ -4042,15 +4125,31 @@ class Cube(CFVariableMixin):
     def __deepcopy__(self, memo):
         return self._deepcopy(memo)
 
-    def _deepcopy(self, memo, data=None):
-        dm = self._data_manager.copy(data=data)
+    def _deepcopy(self, memo, data=None, share=False):
+        if share:
+            # Share read-only views of all the arrays.
+            dm = DataManager(iris.util._read_only_view(self.core_data()))
 
-        new_dim_coords_and_dims = deepcopy(self._dim_coords_and_dims, memo)
-        new_aux_coords_and_dims = deepcopy(self._aux_coords_and_dims, memo)
-        new_cell_measures_and_dims = deepcopy(self._cell_measures_and_dims, memo)
-        new_ancillary_variables_and_dims = deepcopy(
-            self._ancillary_variables_and_dims, memo
-        )
+            def share_all(dim_metas_and_dims):
+                return [
+                    (dim_meta._view(), dims) for dim_meta, dims in dim_metas_and_dims
+                ]
+
+            new_dim_coords_and_dims = share_all(self._dim_coords_and_dims)
+            new_aux_coords_and_dims = share_all(self._aux_coords_and_dims)
+            new_cell_measures_and_dims = share_all(self._cell_measures_and_dims)
+            new_ancillary_variables_and_dims = share_all(
+                self._ancillary_variables_and_dims
+            )
+        else:
+            dm = self._data_manager.copy(data=data)
+
+            new_dim_coords_and_dims = deepcopy(self._dim_coords_and_dims, memo)
+            new_aux_coords_and_dims = deepcopy(self._aux_coords_and_dims, memo)
+            new_cell_measures_and_dims = deepcopy(self._cell_measures_and_dims, memo)
+            new_ancillary_variables_and_dims = deepcopy(
+                self._ancillary_variables_and_dims, memo
+            )
 
         # Record a mapping from old coordinate IDs to new coordinates,
         # for subsequent use in creating updated aux_factories.
@@ -4857,13 +4956,6 @@ x            -               -
         key[dimension] = slice(None, self.shape[dimension] - window + 1)
         new_cube = new_cube[tuple(key)]
 
-        # take a view of the original data using the rolling_window function
-        # this will add an extra dimension to the data at dimension + 1 which
-        # represents the rolled window (i.e. will have a length of window)
-        rolling_window_data = iris.util.rolling_window(
-            self.core_data(), window=window, axis=dimension
-        )
-
         # now update all of the coordinates to reflect the aggregation
         for coord_ in self.coords(dimensions=dimension):
             if coord_.has_bounds():
@@ -4909,11 +5001,26 @@ x            -               -
             _weights_units=getattr(weights_info, "units", None),
             **kwargs,
         )
+        weighted = isinstance(
+            aggregator, iris.analysis.WeightedAggregator
+        ) and aggregator.uses_weighting(**kwargs)
+        if getattr(aggregator, "rolling_func", None) is not None and not weighted:
+            # Aggregate the windows directly, without a view of them.
+            data_result = aggregator.rolling_aggregate(
+                self.core_data(), window, axis=dimension, **kwargs
+            )
+            return aggregator.post_process(new_cube, data_result, [coord], **kwargs)
+
+        # take a view of the original data using the rolling_window function
+        # this will add an extra dimension to the data at dimension + 1 which
+        # represents the rolled window (i.e. will have a length of window)
+        rolling_window_data = iris.util.rolling_window(
+            self.core_data(), window=window, axis=dimension
+        )
+
         # and perform the data transformation, generating weights first if
         # needed
-        if isinstance(
-            aggregator, iris.analysis.WeightedAggregator
-        ) and aggregator.uses_weighting(**kwargs):
+        if weighted:
             if "weights" in kwargs:
                 weights = kwargs["weights"]
                 if weights.ndim > 1 or weights.shape[0] != window:
@@ -5071,6 +5178,43 @@ x            -               -
         regridder = scheme.regridder(self, grid)
         return regridder(self)
 
+    def extract_points(
+        self,
+        sample_points: Iterable[tuple[AuxCoord | DimCoord | str, np.typing.ArrayLike]],
+    ) -> Cube:
+        """Extract the nearest neighbour data to each of many sample points.
+
+        For example, to extract the time series at many observation sites.
+        The cube dimensions spanned by the sample coordinates are replaced
+        with a single, last, dimension over the sample points.
+
+        See :func:`iris.analysis.trajectory.extract_points` for details.
+
+        Parameters
+        ----------
+        sample_points :
+            A sequence of (coordinate, values) pairs, each giving the values of
+            a coordinate at every sample point.
+
+        Returns
+        -------
+        :class:`~iris.cube.Cube`
+            A cube of the nearest neighbour data to the sample points.
+            The returned cube has lazy data if this cube has lazy data.
+
+        Examples
+        --------
+        ::
+
+            sample_points = [("latitude", [50.7, 51.5, 55.9]),
+                             ("longitude", [356.5, 359.9, 356.8])]
+            sites_cube = cube.extract_points(sample_points)
+
+        """
+        from iris.analysis.trajectory import extract_points
+
+        return extract_points(self, sample_points)
+
 
 class ClassDict(MutableMapping):
     """A mapping that stores objects keyed on their superclasses and their names.
@@ -5162,8 +5306,9 @@ def sorted_axes(axes):
 
 # See Cube.slice() for the definition/context.
 class _SliceIterator(Iterator):
-    def __init__(self, cube, dims_index, requested_dims, ordered):
+    def __init__(self, cube, dims_index, requested_dims, ordered, copy=True):
         self._cube = cube
+        self._copy = copy
 
         # Let Numpy do some work in providing all of the permutations of our
         # data shape. This functionality is something like:
@@ -5172,32 +5317,131 @@ class _SliceIterator(Iterator):
         self._ndindex = np.ndindex(*dims_index)
 
         self._requested_dims = requested_dims
-        # indexing relating to sliced cube
-        self._mod_requested_dims = np.argsort(requested_dims)
         self._ordered = ordered
 
-    def __next__(self):
-        # NB. When self._ndindex runs out it will raise StopIteration for us.
-        index_tuple = next(self._ndindex)
+        # The slicing plan, which is common to every slice.  This is only
+        # made when the first slice is requested.
+        self._plan = None
+        # AuxCoord versions of any coords which can't be sliced themselves.
+        self._auxcoords = {}
+
+    def _make_plan(self):
+        # Work out, once only, where each of the cube's dimensional metadata
+        # goes in every slice, and which of them vary between slices, so that
+        # making each slice only needs to index the data and those that vary.
+        cube = self._cube
+        sliced_dims = sorted(self._requested_dims)
+        if self._ordered:
+            new_dims = list(self._requested_dims)
+        else:
+            new_dims = sliced_dims
+        dimension_mapping = {dim: i_dim for i_dim, dim in enumerate(new_dims)}
+
+        # Indexing leaves the requested dimensions in the order of the cube,
+        # so the data may need transposing to the order they were requested.
+        transpose = [sliced_dims.index(dim) for dim in new_dims]
+        if transpose == sorted(transpose):
+            transpose = None
+
+        # Each entry is (dim_meta, dims, new_dims, varying, category), with
+        # the dimensional metadata in the order that indexing adds them.
+        plan = []
+
+        def add(dim_metas, dims_func, category):
+            for dim_meta in dim_metas:
+                dims = dims_func(dim_meta)
+                varying = any(dim not in dimension_mapping for dim in dims)
+                dim_meta_new_dims = tuple(
+                    dimension_mapping[dim] for dim in dims if dim in dimension_mapping
+                )
+                dim_meta_category = category
+                if category == "dim" and not dim_meta_new_dims:
+                    # Scalar coords move to the aux_coords container.
+                    dim_meta_category = "aux"
+                plan.append(
+                    (dim_meta, dims, dim_meta_new_dims, varying, dim_meta_category)
+                )
 
-        # Turn the given tuple into a list so that we can do something with it
-        index_list = list(index_tuple)
+        add(cube.aux_coords, cube.coord_dims, "aux")
+        add(cube.dim_coords, cube.coord_dims, "dim")
+        add(cube.cell_measures(), cube.cell_measure_dims, "cm")
+        add(cube.ancillary_variables(), cube.ancillary_variable_dims, "av")
+        self._plan = plan, transpose
 
-        # For each of the spanning dimensions requested, replace the 0 with a
-        # spanning slice
-        for d in self._requested_dims:
-            index_list[d] = slice(None, None)
+    def _make_slice(self, index_tuple):
+        cube = self._cube
+        plan, transpose = self._plan
 
-        # Request the slice
-        cube = self._cube[tuple(index_list)]
+        # Index with a slice spanning each of the requested dimensions.
+        keys = list(index_tuple)
+        for d in self._requested_dims:
+            keys[d] = slice(None)
+
+        cube_data = cube._data_manager.core_data()
+        data = cube_data[tuple(keys)]
+        if self._copy:
+            # We don't want a view of the data, so take a copy of it.
+            data = deepcopy(data)
+        # Slicing a single masked point returns a MaskedConstant, with a dtype
+        # of float64 : see Cube._getitem.
+        if isinstance(data, ma.core.MaskedConstant) and data.dtype != cube_data.dtype:
+            data = ma.array(data.data, mask=data.mask, dtype=cube_data.dtype)
+        if not self._copy:
+            data = iris.util._read_only_view(data)
+        if transpose is not None:
+            data = data.transpose(transpose)
+
+        def index(dim_meta, keys):
+            # Index any dimensional metadata.
+            if self._copy:
+                result = dim_meta[keys]
+            else:
+                result = dim_meta._view(keys)
+            return result
 
-        if self._ordered:
-            if any(self._mod_requested_dims != list(range(len(cube.shape)))):
-                n = len(self._mod_requested_dims)
-                sliced_dims = np.empty(n, dtype=int)
-                sliced_dims[self._mod_requested_dims] = np.arange(n)
-                cube.transpose(sliced_dims)
+        dim_metas_and_dims = {"aux": [], "dim": [], "cm": [], "av": []}
+        coord_mapping = {}
+        for dim_meta, dims, new_dims, varying, category in plan:
+            if varying:
+                dim_meta_keys = tuple(keys[dim] for dim in dims)
+                auxcoord = self._auxcoords.get(id(dim_meta))
+                try:
+                    new_dim_meta = index(auxcoord or dim_meta, dim_meta_keys)
+                except ValueError:
+                    # As for Cube._getitem, slice a coord which can't be sliced
+                    # (e.g. a MeshCoord) by converting it to an AuxCoord first.
+                    if auxcoord is not None:
+                        raise
+                    auxcoord = iris.coords.AuxCoord.from_coord(dim_meta)
+                    self._auxcoords[id(dim_meta)] = auxcoord
+                    new_dim_meta = index(auxcoord, dim_meta_keys)
+            elif self._copy:
+                new_dim_meta = dim_meta.copy()
+            else:
+                new_dim_meta = dim_meta._view()
+            if category == "dim":
+                new_dims = new_dims[0]
+            dim_metas_and_dims[category].append((new_dim_meta, new_dims))
+            coord_mapping[id(dim_meta)] = new_dim_meta
+
+        result = cube.__class__(
+            data,
+            dim_coords_and_dims=dim_metas_and_dims["dim"],
+            aux_coords_and_dims=dim_metas_and_dims["aux"],
+            aux_factories=[
+                factory.updated(coord_mapping) for factory in cube.aux_factories
+            ],
+            cell_measures_and_dims=dim_metas_and_dims["cm"],
+            ancillary_variables_and_dims=dim_metas_and_dims["av"],
+        )
+        result.metadata = deepcopy(cube.metadata)
+        return result
 
-        return cube
+    def __next__(self):
+        # NB. When self._ndindex runs out it will raise StopIteration for us.
+        index_tuple = next(self._ndindex)
+        if self._plan is None:
+            self._make_plan()
+        return self._make_slice(index_tuple)
 
     next = __next__
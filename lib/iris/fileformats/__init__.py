@@ -4,6 +4,9 @@
 # See LICENSE in the root of the repository for full licensing details.
 """A package for converting cubes to and from specific file formats."""
 
+import importlib
+import threading
+
 from iris.io.format_picker import (
     DataSourceObjectProtocol,
     FileExtension,
@@ -14,44 +17,43 @@ from iris.io.format_picker import (
     UriProtocol,
 )
 
-from . import name, netcdf, nimrod, pp, um
+__all__ = ["FORMAT_AGENT", "prefetch"]
 
-__all__ = ["FORMAT_AGENT"]
 
+# The format submodules which are available as attributes of this package,
+# but only imported when first accessed, as they have heavy dependencies.
+_LAZY_SUBMODULES = ("name", "netcdf", "nimrod", "pp", "um")
 
-FORMAT_AGENT = FormatAgent()
-FORMAT_AGENT.__doc__ = (
-    "The FORMAT_AGENT is responsible for identifying the "
-    "format of a given URI. New formats can be added "
-    "with the **add_spec** method."
-)
+# Guards the construction of the FORMAT_AGENT, on first access.
+_FORMAT_AGENT_LOCK = threading.Lock()
 
 
-#
-# PP files.
-#
-FORMAT_AGENT.add_spec(
-    FormatSpecification(
-        "UM Post Processing file (PP)",
-        MagicNumber(4),
-        0x00000100,
-        pp.load_cubes,
-        priority=5,
-        constraint_aware_handler=True,
-    )
-)
+def __getattr__(name):
+    """Lazily create the FORMAT_AGENT, and import prefetch and the format modules.
 
+    See :pep:`562`.  Constructing the FORMAT_AGENT imports all the format
+    submodules, so this is deferred until it is first needed, i.e. usually
+    when a file is first loaded.  Likewise, :func:`prefetch` needs dask.
 
-FORMAT_AGENT.add_spec(
-    FormatSpecification(
-        "UM Post Processing file (PP) little-endian",
-        MagicNumber(4),
-        0x00010000,
-        pp.load_cubes_little_endian,
-        priority=3,
-        constraint_aware_handler=True,
-    )
-)
+    """
+    if name == "FORMAT_AGENT":
+        with _FORMAT_AGENT_LOCK:
+            if name not in globals():
+                globals()[name] = _build_format_agent()
+        result = globals()[name]
+    elif name == "prefetch":
+        result = importlib.import_module(f"{__name__}._prefetch").prefetch
+        globals()[name] = result
+    elif name in _LAZY_SUBMODULES:
+        # N.B. importing a submodule also sets it as an attribute of the package.
+        result = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return result
+
+
+def __dir__():
+    return sorted(set(globals()) | {"FORMAT_AGENT", "prefetch"} | set(_LAZY_SUBMODULES))
 
 
 #
@@ -68,188 +70,226 @@ def _load_grib(*args, **kwargs):
     return load_cubes(*args, **kwargs)
 
 
-# NB. Because this is such a "fuzzy" check, we give this a very low
-# priority to avoid collateral damage from false positives.
-FORMAT_AGENT.add_spec(
-    FormatSpecification(
-        "GRIB",
-        MagicNumber(100),
-        lambda header_bytes: b"GRIB" in header_bytes,
-        _load_grib,
-        priority=1,
-    )
-)
-
-
 #
-# netCDF files.
+# ABF/ABL
+# TODO: now deprecated, remove later
 #
-FORMAT_AGENT.add_spec(
-    FormatSpecification(
-        "NetCDF",
-        MagicNumber(4),
-        0x43444601,
-        netcdf.load_cubes,
-        priority=5,
-        constraint_aware_handler=True,
-    )
-)
+def load_cubes_abf_abl(*args, **kwargs):
+    from . import abf
 
+    return abf.load_cubes(*args, **kwargs)
 
-FORMAT_AGENT.add_spec(
-    FormatSpecification(
-        "NetCDF 64 bit offset format",
-        MagicNumber(4),
-        0x43444602,
-        netcdf.load_cubes,
-        priority=5,
-        constraint_aware_handler=True,
-    )
-)
 
+def _build_format_agent():
+    """Construct the FORMAT_AGENT, with all the standard format specifications."""
+    from . import name, netcdf, nimrod, pp, um
 
-# This covers both v4 and v4 classic model.
-FORMAT_AGENT.add_spec(
-    FormatSpecification(
-        "NetCDF_v4",
-        MagicNumber(8),
-        0x894844460D0A1A0A,
-        netcdf.load_cubes,
-        priority=5,
-        constraint_aware_handler=True,
+    format_agent = FormatAgent()
+    format_agent.__doc__ = (
+        "The FORMAT_AGENT is responsible for identifying the "
+        "format of a given URI. New formats can be added "
+        "with the **add_spec** method."
     )
-)
-
 
-FORMAT_AGENT.add_spec(
-    FormatSpecification(
-        "NetCDF OPeNDAP",
-        UriProtocol(),
-        lambda protocol: protocol in ["http", "https"],
-        netcdf.load_cubes,
-        priority=6,
-        constraint_aware_handler=True,
+    #
+    # PP files.
+    #
+    format_agent.add_spec(
+        FormatSpecification(
+            "UM Post Processing file (PP)",
+            MagicNumber(4),
+            0x00000100,
+            pp.load_cubes,
+            priority=5,
+            constraint_aware_handler=True,
+        )
     )
-)
 
-# NetCDF file presented as an open, readable netCDF4 dataset (or mimic).
-FORMAT_AGENT.add_spec(
-    FormatSpecification(
-        "NetCDF dataset",
-        DataSourceObjectProtocol(),
-        lambda object: all(
-            hasattr(object, x) for x in ("variables", "dimensions", "groups", "ncattrs")
-        ),
-        # Note: this uses the same call as the above "NetCDF_v4" (and "NetCDF OPeNDAP")
-        # The handler itself needs to detect what is passed + handle it appropriately.
-        netcdf.load_cubes,
-        priority=4,
-        constraint_aware_handler=True,
+    format_agent.add_spec(
+        FormatSpecification(
+            "UM Post Processing file (PP) little-endian",
+            MagicNumber(4),
+            0x00010000,
+            pp.load_cubes_little_endian,
+            priority=3,
+            constraint_aware_handler=True,
+        )
     )
-)
-
 
-#
-# UM Fieldsfiles.
-#
-FORMAT_AGENT.add_spec(
-    FormatSpecification(
-        "UM Fieldsfile (FF) pre v3.1",
-        MagicNumber(8),
-        0x000000000000000F,
-        um.load_cubes,
-        priority=3,
-        constraint_aware_handler=True,
+    #
+    # GRIB files.
+    #
+    # NB. Because this is such a "fuzzy" check, we give this a very low
+    # priority to avoid collateral damage from false positives.
+    format_agent.add_spec(
+        FormatSpecification(
+            "GRIB",
+            MagicNumber(100),
+            lambda header_bytes: b"GRIB" in header_bytes,
+            _load_grib,
+            priority=1,
+        )
     )
-)
-
 
-FORMAT_AGENT.add_spec(
-    FormatSpecification(
-        "UM Fieldsfile (FF) post v5.2",
-        MagicNumber(8),
-        0x0000000000000014,
-        um.load_cubes,
-        priority=4,
-        constraint_aware_handler=True,
+    #
+    # netCDF files.
+    #
+    format_agent.add_spec(
+        FormatSpecification(
+            "NetCDF",
+            MagicNumber(4),
+            0x43444601,
+            netcdf.load_cubes,
+            priority=5,
+            constraint_aware_handler=True,
+        )
     )
-)
 
-
-FORMAT_AGENT.add_spec(
-    FormatSpecification(
-        "UM Fieldsfile (FF) ancillary",
-        MagicNumber(8),
-        0xFFFFFFFFFFFF8000,
-        um.load_cubes,
-        priority=3,
-        constraint_aware_handler=True,
+    format_agent.add_spec(
+        FormatSpecification(
+            "NetCDF 64 bit offset format",
+            MagicNumber(4),
+            0x43444602,
+            netcdf.load_cubes,
+            priority=5,
+            constraint_aware_handler=True,
+        )
     )
-)
-
 
-FORMAT_AGENT.add_spec(
-    FormatSpecification(
-        "UM Fieldsfile (FF) converted with ieee to 32 bit",
-        MagicNumber(4),
-        0x00000014,
-        um.load_cubes_32bit_ieee,
-        priority=3,
-        constraint_aware_handler=True,
+    # This covers both v4 and v4 classic model.
+    format_agent.add_spec(
+        FormatSpecification(
+            "NetCDF_v4",
+            MagicNumber(8),
+            0x894844460D0A1A0A,
+            netcdf.load_cubes,
+            priority=5,
+            constraint_aware_handler=True,
+        )
     )
-)
 
+    format_agent.add_spec(
+        FormatSpecification(
+            "NetCDF OPeNDAP",
+            UriProtocol(),
+            lambda protocol: protocol in ["http", "https"],
+            netcdf.load_cubes,
+            priority=6,
+            constraint_aware_handler=True,
+        )
+    )
 
-FORMAT_AGENT.add_spec(
-    FormatSpecification(
-        "UM Fieldsfile (FF) ancillary converted with ieee to 32 bit",
-        MagicNumber(4),
-        0xFFFF8000,
-        um.load_cubes_32bit_ieee,
-        priority=3,
-        constraint_aware_handler=True,
+    # NetCDF file presented as an open, readable netCDF4 dataset (or mimic).
+    format_agent.add_spec(
+        FormatSpecification(
+            "NetCDF dataset",
+            DataSourceObjectProtocol(),
+            lambda object: all(
+                hasattr(object, x)
+                for x in ("variables", "dimensions", "groups", "ncattrs")
+            ),
+            # Note: this uses the same call as the above "NetCDF_v4" (and "NetCDF OPeNDAP")
+            # The handler itself needs to detect what is passed + handle it appropriately.
+            netcdf.load_cubes,
+            priority=4,
+            constraint_aware_handler=True,
+        )
     )
-)
 
+    #
+    # UM Fieldsfiles.
+    #
+    format_agent.add_spec(
+        FormatSpecification(
+            "UM Fieldsfile (FF) pre v3.1",
+            MagicNumber(8),
+            0x000000000000000F,
+            um.load_cubes,
+            priority=3,
+            constraint_aware_handler=True,
+        )
+    )
 
-#
-# NIMROD files.
-#
-FORMAT_AGENT.add_spec(
-    FormatSpecification(
-        "NIMROD", MagicNumber(4), 0x00000200, nimrod.load_cubes, priority=3
+    format_agent.add_spec(
+        FormatSpecification(
+            "UM Fieldsfile (FF) post v5.2",
+            MagicNumber(8),
+            0x0000000000000014,
+            um.load_cubes,
+            priority=4,
+            constraint_aware_handler=True,
+        )
     )
-)
 
-#
-# NAME files.
-#
-FORMAT_AGENT.add_spec(
-    FormatSpecification(
-        "NAME III",
-        LeadingLine(),
-        lambda line: line.lstrip().startswith(b"NAME III"),
-        name.load_cubes,
-        priority=5,
+    format_agent.add_spec(
+        FormatSpecification(
+            "UM Fieldsfile (FF) ancillary",
+            MagicNumber(8),
+            0xFFFFFFFFFFFF8000,
+            um.load_cubes,
+            priority=3,
+            constraint_aware_handler=True,
+        )
     )
-)
 
+    format_agent.add_spec(
+        FormatSpecification(
+            "UM Fieldsfile (FF) converted with ieee to 32 bit",
+            MagicNumber(4),
+            0x00000014,
+            um.load_cubes_32bit_ieee,
+            priority=3,
+            constraint_aware_handler=True,
+        )
+    )
 
-#
-# ABF/ABL
-# TODO: now deprecated, remove later
-#
-def load_cubes_abf_abl(*args, **kwargs):
-    from . import abf
+    format_agent.add_spec(
+        FormatSpecification(
+            "UM Fieldsfile (FF) ancillary converted with ieee to 32 bit",
+            MagicNumber(4),
+            0xFFFF8000,
+            um.load_cubes_32bit_ieee,
+            priority=3,
+            constraint_aware_handler=True,
+        )
+    )
 
-    return abf.load_cubes(*args, **kwargs)
+    #
+    # NIMROD files.
+    #
+    format_agent.add_spec(
+        FormatSpecification(
+            "NIMROD", MagicNumber(4), 0x00000200, nimrod.load_cubes, priority=3
+        )
+    )
 
+    #
+    # NAME files.
+    #
+    format_agent.add_spec(
+        FormatSpecification(
+            "NAME III",
+            LeadingLine(),
+            lambda line: line.lstrip().startswith(b"NAME III"),
+            name.load_cubes,
+            priority=5,
+        )
+    )
 
-FORMAT_AGENT.add_spec(
-    FormatSpecification("ABF", FileExtension(), ".abf", load_cubes_abf_abl, priority=3)
-)
+    #
+    # ABF/ABL
+    # TODO: now deprecated, remove later
+    #
+    format_agent.add_spec(
+        FormatSpecification(
+            "ABF", FileExtension(), ".abf", load_cubes_abf_abl, priority=3
+        )
+    )
 
+    format_agent.add_spec(
+        FormatSpecification(
+            "ABL", FileExtension(), ".abl", load_cubes_abf_abl, priority=3
+        )
+    )
 
-FORMAT_AGENT.add_spec(
-    FormatSpecification("ABL", FileExtension(), ".abl", load_cubes_abf_abl, priority=3)
-)
+    return format_agent
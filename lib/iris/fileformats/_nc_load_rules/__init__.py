@@ -8,3 +8,7 @@ Interprets CF concepts identified by :mod:`iris.fileformats.cf` to add
 components into loaded cubes.
 
 """
+
+# N.B. the rules modules are imported by the netcdf loader, and themselves
+# import it, which only works if the import starts with the netcdf package.
+import iris.fileformats.netcdf  # noqa: F401
@@ -536,6 +536,20 @@ def action_formula_term(engine, formula_term_fact):
     return rule_name
 
 
+def run_variable_actions(engine):
+    """Run only the actions which depend on the data variable itself.
+
+    These set the cube metadata, and do not build any other cube elements.
+    Used, with a stored build plan for the other cube elements, when the
+    engine reuses the outcome of :func:`run_actions` for a previous data
+    variable with the same structure.
+
+    """
+    action_default(engine)
+    action_ukmo_stash(engine)
+    action_ukmo_processflags(engine)
+
+
 def run_actions(engine):
     """Run all actions for a cube.
 
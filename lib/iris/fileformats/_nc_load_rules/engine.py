@@ -19,7 +19,9 @@ used in :meth:`iris.fileformats.netcdf._actions_activation_stats`.
 
 """
 
-from .actions import run_actions
+from copy import deepcopy
+
+from .actions import run_actions, run_variable_actions
 
 
 class FactEntity:
@@ -61,6 +63,63 @@ class FactEntity:
         return facts
 
 
+class _BuildPlan:
+    """The cube elements built by the rules actions for one data variable.
+
+    Records the coordinates, cell measures and ancillary variables added to
+    the cube, with the matching engine state, so that they can be copied onto
+    the cube of another data variable with the same structure.
+
+    """
+
+    def __init__(self, engine):
+        cube = engine.cube
+        items = [
+            ("add_dim_coord", coord, cube.coord_dims(coord))
+            for coord in cube.dim_coords
+        ]
+        items += [
+            ("add_aux_coord", coord, cube.coord_dims(coord))
+            for coord in cube.aux_coords
+        ]
+        items += [
+            ("add_cell_measure", measure, cube.cell_measure_dims(measure))
+            for measure in cube.cell_measures()
+        ]
+        items += [
+            ("add_ancillary_variable", ancil, cube.ancillary_variable_dims(ancil))
+            for ancil in cube.ancillary_variables()
+        ]
+        # Record the cube parts by position, as we store copies of the
+        # elements : the originals belong to the returned cube.
+        i_items = {id(element): i_item for i_item, (_, element, _) in enumerate(items)}
+        self.cube_parts = {
+            role: [(i_items[id(element)], cf_name) for element, cf_name in parts]
+            for role, parts in engine.cube_parts.items()
+            if role != "coordinate_system"
+        }
+        self.coordinate_system = deepcopy(engine.cube_parts.get("coordinate_system"))
+        self.items = [(adder, element.copy(), dims) for adder, element, dims in items]
+        self.requires = deepcopy(engine.requires)
+        self.facts = deepcopy(engine.facts)
+        self.cf_name = engine.cf_var.cf_name
+
+    def apply(self, engine):
+        """Add copies of the recorded cube elements to the engine cube."""
+        elements = [element.copy() for _, element, _ in self.items]
+        for (adder, _, dims), element in zip(self.items, elements):
+            getattr(engine.cube, adder)(element, dims)
+        for role, parts in self.cube_parts.items():
+            engine.cube_parts[role] = [
+                (elements[i_item], cf_name) for i_item, cf_name in parts
+            ]
+        if self.coordinate_system is not None:
+            engine.cube_parts["coordinate_system"] = deepcopy(self.coordinate_system)
+        engine.requires = deepcopy(self.requires)
+        engine.facts = deepcopy(self.facts)
+        engine.rules_triggered.add(f"fc_reuse_build_plan({self.cf_name})")
+
+
 class Engine:
     """A minimal mimic of a Pyke.engine.
 
@@ -77,6 +136,10 @@ class Engine:
     def __init__(self):
         """Init new engine."""
         self.reset()
+        # Outcomes of 'activate', reusable for data variables of the same
+        # structure, in the current file.
+        self._build_plans = {}
+        self._build_plans_filename = None
 
     def reset(self):
         """Reset the engine = remove all facts."""
@@ -91,8 +154,45 @@ class Engine:
         The rules operation itself is coded elsewhere,
         in :mod:`iris.fileformats.netcdf._nc_load_rules.actions`.
 
+        When a previous data variable of the same file had the same structure,
+        i.e. the same facts, dimensions and chunking controls, the coordinates
+        and other cube elements built for it are copied instead, and only the
+        actions which depend on the data variable itself are run.
+
         """
-        run_actions(self)
+        key = self._build_plan_key()
+        plan = self._build_plans.get(key)
+        if plan is None:
+            run_actions(self)
+            if key is not None:
+                self._build_plans[key] = _BuildPlan(self)
+        else:
+            run_variable_actions(self)
+            plan.apply(self)
+
+    def _build_plan_key(self):
+        # Return a key identifying the structure of the current data variable,
+        # or None if this engine has no data variable to translate.
+        # Deferred import to avoid circular imports.
+        from iris.fileformats.netcdf.loader import CHUNK_CONTROL
+
+        cf_var = getattr(self, "cf_var", None)
+        if cf_var is None:
+            return None
+        filename = self.filename
+        if filename != self._build_plans_filename:
+            self._build_plans = {}
+            self._build_plans_filename = filename
+        facts = tuple(
+            (fact_name, tuple(fact_list.case_specific_facts))
+            for fact_name, fact_list in self.facts.entity_lists.items()
+        )
+        chunking = (
+            CHUNK_CONTROL.mode,
+            CHUNK_CONTROL.access_pattern,
+            repr(CHUNK_CONTROL.var_dim_chunksizes),
+        )
+        return (tuple(cf_var.dimensions), facts, chunking)
 
     def get_kb(self):
         """Get a FactEntity, which mimic (bits of) a knowledge-base.
@@ -34,7 +34,7 @@ import iris.coords
 import iris.exceptions
 import iris.fileformats.cf as cf
 import iris.fileformats.netcdf
-from iris.fileformats.netcdf.loader import _get_cf_var_data
+from iris.fileformats.netcdf.loader import _get_cf_var_data, _profiled_rule
 import iris.std_names
 import iris.util
 import iris.warnings
@@ -1095,6 +1095,7 @@ def _normalise_bounds_units(
 
 
 ################################################################################
+@_profiled_rule("coordinates")
 def build_dimension_coordinate(
     engine, cf_coord_var, coord_name=None, coord_system=None
 ):
@@ -1228,6 +1229,7 @@ def build_dimension_coordinate(
 
 
 ################################################################################
+@_profiled_rule("coordinates")
 def build_auxiliary_coordinate(
     engine, cf_coord_var, coord_name=None, coord_system=None
 ):
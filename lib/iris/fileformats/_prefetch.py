@@ -0,0 +1,226 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Background read-ahead of the data chunks of lazy file data proxies.
+
+A data proxy using this passes its chunk reads through :func:`read`.  When
+prefetching is enabled by :func:`prefetch`, each chunk read also starts
+background reads of the chunks which follow it, so that file access overlaps
+with the computation on the chunks already read.
+
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import threading
+
+import dask.config
+import dask.utils
+import numpy as np
+
+# The active prefetcher, if any.
+# N.B. this is process-wide, not thread-local, as chunks are read by the
+# threads of the dask scheduler.
+_PREFETCHER = None
+_PREFETCHER_LOCK = threading.Lock()
+
+# The number of requested chunks remembered, to avoid prefetching chunks
+# which are already being read, e.g. by parallel dask tasks.
+_MAX_REQUESTED = 1024
+
+
+def _chunk_bounds(keys, shape):
+    # Convert the keys of a chunk read into a hashable tuple of (start, stop)
+    # pairs, plus the index selecting the requested result from a read of
+    # those bounds, which is not None only if some keys were integers.
+    # Return (None, None) if the keys are not all simple slices or integers.
+    if not isinstance(keys, tuple):
+        keys = (keys,)
+    if len(keys) != len(shape):
+        return None, None
+    bounds = []
+    squeeze = []
+    for key, size in zip(keys, shape):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(size)
+            if step != 1 or stop <= start:
+                return None, None
+            squeeze.append(slice(None))
+        elif isinstance(key, (int, np.integer)) and -size <= key < size:
+            start = int(key) % size
+            stop = start + 1
+            squeeze.append(0)
+        else:
+            return None, None
+        bounds.append((start, stop))
+    squeeze = tuple(squeeze) if 0 in squeeze else None
+    return tuple(bounds), squeeze
+
+
+def _following_bounds(bounds, shape, n_chunks):
+    # Return the bounds of up to 'n_chunks' chunks following the given one,
+    # stepping along the leading dimension which is not read whole.
+    # For data chunked by time-step, this follows the order of the dask graph.
+    for dim, (start, stop) in enumerate(bounds):
+        if stop - start < shape[dim]:
+            break
+    else:
+        return []
+    result = []
+    size = stop - start
+    while stop < shape[dim] and len(result) < n_chunks:
+        start, stop = stop, min(stop + size, shape[dim])
+        result.append(bounds[:dim] + ((start, stop),) + bounds[dim + 1 :])
+    return result
+
+
+class _Prefetcher:
+    """A bounded buffer of chunks being read in advance by a thread pool."""
+
+    def __init__(self, n_chunks, max_bytes, max_workers):
+        self.n_chunks = n_chunks
+        self.max_bytes = max_bytes
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="iris-prefetch"
+        )
+        # Entries of (future, nbytes, proxy), by (id(proxy), bounds).
+        # N.B. keeping the proxy also stops its id being re-used.
+        self._buffer = OrderedDict()
+        self._nbytes = 0
+        # The most recently requested chunks, which need no prefetching.
+        self._requested = OrderedDict()
+        self._lock = threading.Lock()
+
+    def read(self, proxy, keys):
+        """Read a chunk of a proxy, and start reading the chunks following it."""
+        bounds, squeeze = _chunk_bounds(keys, proxy.shape)
+        if bounds is None:
+            return proxy._read(keys)
+        key = (id(proxy), bounds)
+        with self._lock:
+            entry = self._buffer.pop(key, None)
+            if entry is not None:
+                self._nbytes -= entry[1]
+            self._requested[key] = None
+            if len(self._requested) > _MAX_REQUESTED:
+                self._requested.popitem(last=False)
+        result = None
+        if entry is not None and entry[2] is proxy:
+            try:
+                result = entry[0].result()
+            except Exception:
+                # Retry in the usual way, to raise any error in this thread.
+                result = None
+            else:
+                if squeeze is not None:
+                    result = result[squeeze]
+        if result is None:
+            result = proxy._read(keys)
+        # N.B. start reading ahead only now, so as not to delay this chunk.
+        with self._lock:
+            self._schedule(proxy, bounds)
+        return result
+
+    def _schedule(self, proxy, bounds):
+        # Start reading the chunks following a chunk, within the buffer limits.
+        # N.B. called with the lock held.
+        itemsize = np.dtype(proxy.dtype).itemsize
+        for next_bounds in _following_bounds(bounds, proxy.shape, self.n_chunks):
+            key = (id(proxy), next_bounds)
+            if key in self._buffer or key in self._requested:
+                continue
+            nbytes = itemsize * int(
+                np.prod([stop - start for start, stop in next_bounds])
+            )
+            if nbytes > self.max_bytes:
+                break
+            # Drop the oldest chunks, which are the least likely to be wanted.
+            while self._buffer and self._nbytes + nbytes > self.max_bytes:
+                future, old_nbytes, _ = self._buffer.popitem(last=False)[1]
+                future.cancel()
+                self._nbytes -= old_nbytes
+            keys = tuple(slice(start, stop) for start, stop in next_bounds)
+            future = self._executor.submit(proxy._read, keys)
+            self._buffer[key] = (future, nbytes, proxy)
+            self._nbytes += nbytes
+
+    def close(self):
+        with self._lock:
+            for future, _, _ in self._buffer.values():
+                future.cancel()
+            self._buffer.clear()
+            self._requested.clear()
+            self._nbytes = 0
+        self._executor.shutdown(wait=False)
+
+
+def read(proxy, keys):
+    """Read a chunk of a data proxy, prefetching the following chunks if enabled.
+
+    The proxy must have ``shape`` and ``dtype`` properties, and a ``_read``
+    method taking the keys of a chunk, which does the actual read.
+
+    """
+    prefetcher = _PREFETCHER
+    if prefetcher is None:
+        result = proxy._read(keys)
+    else:
+        result = prefetcher.read(proxy, keys)
+    return result
+
+
+@contextmanager
+def prefetch(n_chunks=4, max_bytes=None, max_workers=2):
+    """Read ahead the data chunks of lazy file data, while computing.
+
+    Within this context, each chunk of NetCDF file data, or of structured
+    UM (PP or FieldsFile) data, read by computing lazy data also starts
+    background reads of the chunks which follow it.  These are held in a
+    bounded buffer until requested.  This lets file reads overlap with
+    computation, which helps when processing data chunk-by-chunk, e.g. one
+    time-step at a time, from a slow filesystem.
+
+    Parameters
+    ----------
+    n_chunks : int, default=4
+        The number of chunks to read ahead of each chunk read.
+    max_bytes : int, optional
+        The maximum total size of the buffered chunks.  Defaults to
+        `n_chunks` times the Dask default chunk size, i.e. the setting
+        configured by ``dask.config.set({'array.chunk-size': '250MiB'})``.
+    max_workers : int, default=2
+        The number of background threads reading chunks.
+
+    Notes
+    -----
+    This function acts as a context manager, for use in a ``with`` block.
+    It applies to all threads of the current process, but not to the
+    workers of a distributed scheduler.
+
+    >>> import iris
+    >>> from iris.fileformats import prefetch
+    >>> cube = iris.load_cube(iris.sample_data_path("E1_north_america.nc"))
+    >>> with prefetch(n_chunks=2):
+    ...     means = [
+    ...         time_slice.data.mean() for time_slice in cube.slices_over("time")
+    ...     ]
+
+    """
+    global _PREFETCHER
+    if n_chunks < 1:
+        raise ValueError(f"'n_chunks' should be at least 1, not {n_chunks!r}.")
+    if max_bytes is None:
+        chunk_size = dask.utils.parse_bytes(dask.config.get("array.chunk-size"))
+        max_bytes = n_chunks * chunk_size
+    prefetcher = _Prefetcher(n_chunks, max_bytes, max_workers)
+    with _PREFETCHER_LOCK:
+        old_prefetcher = _PREFETCHER
+        _PREFETCHER = prefetcher
+    try:
+        yield
+    finally:
+        with _PREFETCHER_LOCK:
+            _PREFETCHER = old_prefetcher
+        prefetcher.close()
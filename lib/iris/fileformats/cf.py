@@ -94,6 +94,9 @@ class CFVariable(metaclass=ABCMeta):
         #: CF-netCDF formula terms that his variable participates in.
         self.cf_terms_by_root = {}
 
+        # The whole variable data, when read in advance by the loader.
+        self._prefetched_data = None
+
         self.cf_attrs_reset()
 
     @staticmethod
@@ -181,6 +184,13 @@ class CFVariable(metaclass=ABCMeta):
         return value
 
     def __getitem__(self, key):
+        if (
+            self._prefetched_data is not None
+            and isinstance(key, slice)
+            and key == slice(None)
+        ):
+            # Return a copy, as each caller may own the result.
+            return self._prefetched_data.copy()
         return self.cf_data.__getitem__(key)
 
     def __len__(self):
@@ -1336,8 +1346,12 @@ class CFReader:
             self._trim_ugrid_variable_types()
             self._with_ugrid = False
 
-        self._translate()
-        self._build_cf_groups()
+        # Deferred import to avoid circular imports.
+        from iris.fileformats.netcdf.loader import _profiled
+
+        with _profiled("classify", self._filename):
+            self._translate()
+            self._build_cf_groups()
         self._reset()
 
     def __enter__(self):
@@ -15,6 +15,8 @@ import typing
 import netCDF4
 import numpy as np
 
+from iris.fileformats import _prefetch
+
 _GLOBAL_NETCDF4_LOCK = Lock()
 
 # Doesn't need thread protection, but this allows all netCDF4 refs to be
@@ -306,6 +308,31 @@ class DatasetWrapper(GroupWrapper):
         return cls.from_existing(instance)
 
 
+def read_variables(variables):
+    """Read the whole data of several variables, within one _GLOBAL_NETCDF4_LOCK.
+
+    Accepts VariableWrappers or netCDF4.Variables, which are read in the order
+    given.  Returns a list of arrays, with ``None`` for any variable which
+    could not be read, so that the caller can fall back to a normal read.
+    """
+    # Unwrap first : the lock is not re-entrant.
+    variables = [
+        variable._contained_instance
+        if hasattr(variable, "THREAD_SAFE_FLAG")
+        else variable
+        for variable in variables
+    ]
+    result = []
+    with _GLOBAL_NETCDF4_LOCK:
+        for variable in variables:
+            try:
+                data = variable[:]
+            except Exception:
+                data = None
+            result.append(data)
+    return result
+
+
 class NetCDFDataProxy:
     """A reference to the data payload of a single NetCDF file variable."""
 
@@ -328,6 +355,9 @@ class NetCDFDataProxy:
         return np.ma.array(np.empty((0,) * self.ndim, dtype=self.dtype), mask=True)
 
     def __getitem__(self, keys):
+        return _prefetch.read(self, keys)
+
+    def _read(self, keys):
         # Using a DatasetWrapper causes problems with invalid ID's and the
         # netCDF4 library, presumably because __getitem__ gets called so many
         # times by Dask. Use _GLOBAL_NETCDF4_LOCK directly instead.
@@ -15,12 +15,14 @@ from collections.abc import Iterable, Iterator, Mapping
 from contextlib import contextmanager
 from copy import deepcopy
 from enum import Enum, auto
+from functools import wraps
 import threading
+import time
 import warnings
 
 import numpy as np
 
-from iris._lazy_data import as_lazy_data
+from iris._lazy_data import _CHUNK_ACCESS_PATTERNS, as_lazy_data
 from iris.aux_factory import (
     AtmosphereSigmaFactory,
     HybridHeightFactory,
@@ -146,6 +148,146 @@ def _actions_activation_stats(engine, cf_name):
             print("\t%s%s" % (key, arg))
 
 
+#: The load stages timed by :func:`profile_load`.
+_PROFILE_STAGES = ("classify", "actions", "coordinates", "attributes", "callback")
+
+
+class LoadProfile:
+    """A record of where time was spent while loading NetCDF files.
+
+    Returned by :func:`profile_load`.
+
+    """
+
+    def __init__(self):
+        #: Seconds spent in each load stage, keyed by
+        #: ``(filename, var_name, stage)``.  The ``var_name`` is that of the
+        #: data variable being loaded, or ``None`` for per-file stages.
+        self.timings = {}
+        #: The number of calls timed, with the same keys as :attr:`timings`.
+        self.counts = {}
+        #: The number of small variables read eagerly, by filename.
+        self.eager_reads = {}
+        #: The number of bytes read by eager reads, by filename.
+        self.eager_read_bytes = {}
+
+    def __repr__(self):
+        totals = ", ".join(
+            f"{stage}={seconds:.3f}s" for stage, seconds in self.totals().items()
+        )
+        n_reads = sum(self.eager_reads.values())
+        return f"<{self.__class__.__name__}: {totals}, eager_reads={n_reads}>"
+
+    def _add_timing(self, filename, var_name, stage, seconds):
+        key = (filename, var_name, stage)
+        self.timings[key] = self.timings.get(key, 0.0) + seconds
+        self.counts[key] = self.counts.get(key, 0) + 1
+
+    def _add_eager_read(self, filename, nbytes):
+        self.eager_reads[filename] = self.eager_reads.get(filename, 0) + 1
+        self.eager_read_bytes[filename] = (
+            self.eager_read_bytes.get(filename, 0) + nbytes
+        )
+
+    def totals(self):
+        """Return the total seconds spent in each load stage.
+
+        Note that the "coordinates" stage runs within the "actions" stage, so
+        its time is also included there.
+
+        """
+        result = dict.fromkeys(_PROFILE_STAGES, 0.0)
+        for (_, _, stage), seconds in self.timings.items():
+            result[stage] += seconds
+        return result
+
+    def records(self):
+        """Return the timings as a list of flat dictionaries.
+
+        Each has the keys "filename", "var_name", "stage", "seconds" and
+        "count", which suits passing on to monitoring or to a
+        :class:`pandas.DataFrame`.
+
+        """
+        return [
+            {
+                "filename": filename,
+                "var_name": var_name,
+                "stage": stage,
+                "seconds": seconds,
+                "count": self.counts[(filename, var_name, stage)],
+            }
+            for (filename, var_name, stage), seconds in self.timings.items()
+        ]
+
+
+class _ProfileState(threading.local):
+    def __init__(self):
+        self.profile = None
+
+
+_PROFILE_STATE = _ProfileState()
+
+
+@contextmanager
+def profile_load() -> Iterator[LoadProfile]:
+    """Record where time is spent while loading NetCDF files.
+
+    Times CF classification of each file, and the rules actions, coordinate
+    construction, attribute handling and load callback of each data variable,
+    and counts the small variables read eagerly rather than lazily.
+
+    Notes
+    -----
+    This function acts as a context manager, for use in a ``with`` block.
+    It only records loads made in the same thread.
+
+    >>> import iris
+    >>> from iris.fileformats.netcdf.loader import profile_load
+    >>> with profile_load() as profile:
+    ...     cube = iris.load(iris.sample_data_path("E1_north_america.nc"))[0]
+    >>> stage_seconds = profile.totals()
+
+    """
+    old_profile = _PROFILE_STATE.profile
+    profile = LoadProfile()
+    try:
+        _PROFILE_STATE.profile = profile
+        yield profile
+    finally:
+        _PROFILE_STATE.profile = old_profile
+
+
+@contextmanager
+def _profiled(stage, filename, var_name=None):
+    # Time the enclosed code as a load stage, when profiling is enabled.
+    profile = _PROFILE_STATE.profile
+    if profile is None:
+        yield
+    else:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            profile._add_timing(filename, var_name, stage, time.perf_counter() - start)
+
+
+def _profiled_rule(stage):
+    # Decorate an actions helper, taking the engine as its first argument, to
+    # time it as a load stage of the current data variable.
+    def decorator(func):
+        @wraps(func)
+        def inner(engine, *args, **kwargs):
+            if _PROFILE_STATE.profile is None:
+                return func(engine, *args, **kwargs)
+            with _profiled(stage, engine.filename, engine.cf_var.cf_name):
+                return func(engine, *args, **kwargs)
+
+        return inner
+
+    return decorator
+
+
 def _set_attributes(attributes, key, value):
     """Set attributes dictionary, converting unicode strings appropriately."""
     if isinstance(value, str):
@@ -220,6 +362,8 @@ def _get_cf_var_data(cf_var, filename):
             # Don't make a lazy array, as it will cost more memory AND more time to access.
             # Instead fetch the data immediately, as a real array, and return that.
             result = cf_var[:]
+            if _PROFILE_STATE.profile is not None:
+                _PROFILE_STATE.profile._add_eager_read(filename, total_bytes)
 
         else:
             # Get lazy chunked data out of a cf variable.
@@ -288,10 +432,52 @@ def _get_cf_var_data(cf_var, filename):
                     meta=proxy.dask_meta,
                     chunks=chunks,
                     dims_fixed=tuple(dims_fixed),
+                    access=CHUNK_CONTROL.access_pattern,
                 )
     return result
 
 
+def _prefetch_small_variables(cf, data_variables):
+    """Read all the small variables needed to load some CF data variables.
+
+    Fetches, in a single batched read, every variable used by the given data
+    variables which :func:`_get_cf_var_data` would read eagerly, i.e. those
+    smaller than ``_LAZYVAR_MIN_BYTES``.  The results are cached on the CF
+    variables, so each is read only once for all the data variables in a file.
+
+    """
+    # Collect the data variables, and all the variables they refer to.
+    needed = {}
+    todo = list(data_variables)
+    while todo:
+        cf_var = todo.pop()
+        if cf_var.cf_name not in needed:
+            needed[cf_var.cf_name] = cf_var
+            if cf_var.cf_group is not None:
+                todo.extend(cf_var.cf_group.values())
+
+    small_vars = []
+    for cf_var in needed.values():
+        if cf_var._prefetched_data is not None or hasattr(cf_var, "_data_array"):
+            continue
+        dtype = cf_var.dtype
+        if (
+            isinstance(dtype, np.dtype)
+            and cf_var.size * dtype.itemsize < _LAZYVAR_MIN_BYTES
+        ):
+            small_vars.append(cf_var)
+
+    if len(small_vars) > 1:
+        # Read in file order, which is the order variables were defined in.
+        order = {name: i_var for i_var, name in enumerate(cf._dataset.variables)}
+        small_vars.sort(key=lambda cf_var: order.get(cf_var.cf_name, -1))
+        arrays = _thread_safe_nc.read_variables(
+            [cf_var.cf_data for cf_var in small_vars]
+        )
+        for cf_var, array in zip(small_vars, arrays):
+            cf_var._prefetched_data = array
+
+
 class _OrderedAddableList(list):
     """A custom container object for actions recording.
 
@@ -354,7 +540,8 @@ def _load_cube_inner(engine, cf, cf_var, filename):
     # Run the actions engine.
     # This creates various cube elements and attaches them to the cube.
     # It also records various other info on the engine, to be processed later.
-    engine.activate()
+    with _profiled("actions", filename, cf_var.cf_name):
+        engine.activate()
 
     # Having run the rules, now add the "unused" attributes to each cf element.
     def fix_attributes_all_elements(role_name):
@@ -363,13 +550,14 @@ def _load_cube_inner(engine, cf, cf_var, filename):
         for iris_object, cf_var_name in elements_and_names:
             _add_unused_attributes(iris_object, cf.cf_group[cf_var_name])
 
-    # Populate the attributes of all coordinates, cell-measures and ancillary-vars.
-    fix_attributes_all_elements("coordinates")
-    fix_attributes_all_elements("ancillary_variables")
-    fix_attributes_all_elements("cell_measures")
+    with _profiled("attributes", filename, cf_var.cf_name):
+        # Populate the attributes of all coordinates, cell-measures and ancillary-vars.
+        fix_attributes_all_elements("coordinates")
+        fix_attributes_all_elements("ancillary_variables")
+        fix_attributes_all_elements("cell_measures")
 
-    # Also populate attributes of the top-level cube itself.
-    _add_unused_attributes(cube, cf_var)
+        # Also populate attributes of the top-level cube itself.
+        _add_unused_attributes(cube, cf_var)
 
     # Work out reference names for all the coords.
     names = {
@@ -605,11 +793,16 @@ def load_cubes(file_sources, callback=None, constraints=None):
             data_variables = list(cf.cf_group.data_variables.values()) + list(
                 cf.cf_group.promoted.values()
             )
-            for cf_var in data_variables:
-                if var_callback and not var_callback(cf_var):
-                    # Deliver only selected results.
-                    continue
+            if var_callback:
+                # Deliver only selected results.
+                data_variables = [
+                    cf_var for cf_var in data_variables if var_callback(cf_var)
+                ]
+
+            # Fetch all the small variables needed, in one go.
+            _prefetch_small_variables(cf, data_variables)
 
+            for cf_var in data_variables:
                 # cf_var-specific mesh handling, if a mesh is present.
                 # Build the mesh_coords *before* loading the cube - avoids
                 # mesh-related attributes being picked up by
@@ -647,7 +840,8 @@ def load_cubes(file_sources, callback=None, constraints=None):
                     )
 
                 # Perform any user registered callback function.
-                cube = run_callback(callback, cube, cf_var, file_source)
+                with _profiled("callback", cf.filename, cf_var.cf_name):
+                    cube = run_callback(callback, cube, cf_var, file_source)
 
                 # Callback mechanism may return None, which must not be yielded
                 if cube is None:
@@ -690,6 +884,7 @@ class ChunkControl(threading.local):
         """
         self.var_dim_chunksizes = var_dim_chunksizes or {}
         self.mode = self.Modes.DEFAULT
+        self.access_pattern = None
 
     @contextmanager
     def set(
@@ -789,6 +984,50 @@ class ChunkControl(threading.local):
             self.mode = old_mode
             self.var_dim_chunksizes = old_var_dim_chunksizes
 
+    @contextmanager
+    def access(self, pattern: str) -> Iterator[None]:
+        r"""Choose chunk sizes to suit an expected pattern of data access.
+
+        Parameters
+        ----------
+        pattern : str
+            One of:
+
+            * ``"timeseries"`` : favour chunks that are long in the outer
+              dimensions, e.g. for extracting time series at points.
+            * ``"spatial"`` : favour chunks that are whole in the inner
+              dimensions, e.g. for processing horizontal fields.  This
+              matches the default behaviour.
+            * ``"balanced"`` : scale all dimensions together.
+
+        Notes
+        -----
+        This function acts as a context manager, for use in a ``with`` block.
+
+        The resulting chunks are always multiples of the file variable
+        chunking, if any.  Dimensions controlled by :meth:`set` keep the
+        chunk sizes given there.  The chunk size is still limited by the
+        Dask default chunk size, as described for :meth:`set`.
+
+        >>> import iris
+        >>> from iris.fileformats.netcdf.loader import CHUNK_CONTROL
+        >>> with CHUNK_CONTROL.access("timeseries"):
+        ...     cube = iris.load(iris.sample_data_path("E1_north_america.nc"))[0]
+
+        """
+        if pattern not in _CHUNK_ACCESS_PATTERNS:
+            msg = (
+                f"'pattern' should be one of {_CHUNK_ACCESS_PATTERNS}, "
+                f"not {pattern!r}."
+            )
+            raise ValueError(msg)
+        old_access_pattern = self.access_pattern
+        try:
+            self.access_pattern = pattern
+            yield
+        finally:
+            self.access_pattern = old_access_pattern
+
     @contextmanager
     def as_dask(self) -> Iterator[None]:
         """Rely on Dask :external+dask:doc:`array` to control chunk sizes.
@@ -6,11 +6,14 @@
 
 from abc import ABCMeta, abstractmethod
 import collections
+import concurrent.futures
 from copy import deepcopy
+import itertools
 import operator
 import os
 import re
 import struct
+import threading
 import warnings
 
 import cf_units
@@ -611,21 +614,22 @@ class PPDataProxy:
         return np.empty((0,) * self.ndim, dtype=self.dtype)
 
     def __getitem__(self, keys):
-        with open(self.path, "rb") as pp_file:
-            pp_file.seek(self.offset, os.SEEK_SET)
-            data_bytes = pp_file.read(self.data_len)
-            data = _data_bytes_to_shaped_array(
-                data_bytes,
-                self.lbpack,
-                self.boundary_packing,
-                self.shape,
-                self.src_dtype,
-                self.mdi,
-            )
+        (data,) = _read_data_arrays([self])
         result = data.__getitem__(keys)
 
         return np.asanyarray(result, dtype=self.dtype)
 
+    def _data_from_bytes(self, data_bytes):
+        # Unpack the payload bytes read from the file.
+        return _data_bytes_to_shaped_array(
+            data_bytes,
+            self.lbpack,
+            self.boundary_packing,
+            self.shape,
+            self.src_dtype,
+            self.mdi,
+        )
+
     def __repr__(self):
         fmt = (
             "<{self.__class__.__name__} shape={self.shape}"
@@ -661,6 +665,165 @@ class PPDataProxy:
         return result
 
 
+#: The largest gap, in bytes, between field payloads that are read together.
+_READ_MAX_GAP = 64 * 1024
+
+#: The largest size, in bytes, of a single read of several field payloads.
+_READ_MAX_SIZE = 64 * 1024 * 1024
+
+
+#: The number of threads used to unpack WGDOS or RLE packed field payloads,
+#: when several are read together.  A value of 1 unpacks them in turn, in the
+#: calling thread.
+_UNPACK_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+# A thread pool, shared by all unpacking calls, as (max_workers, executor).
+_UNPACK_EXECUTOR = None
+_UNPACK_EXECUTOR_LOCK = threading.Lock()
+
+
+def _unpack_executor():
+    """Return the shared unpacking thread pool, of size ``_UNPACK_MAX_WORKERS``."""
+    global _UNPACK_EXECUTOR
+    with _UNPACK_EXECUTOR_LOCK:
+        if _UNPACK_EXECUTOR is None or _UNPACK_EXECUTOR[0] != _UNPACK_MAX_WORKERS:
+            if _UNPACK_EXECUTOR is not None:
+                _UNPACK_EXECUTOR[1].shutdown(wait=False)
+            executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=_UNPACK_MAX_WORKERS, thread_name_prefix="iris-unpack"
+            )
+            _UNPACK_EXECUTOR = (_UNPACK_MAX_WORKERS, executor)
+        return _UNPACK_EXECUTOR[1]
+
+
+def _iter_data_bytes(proxies, max_gap=None, max_size=None):
+    """Read the payload bytes of multiple :class:`PPDataProxy` objects.
+
+    The payloads are grouped by file and read in order of position, where
+    neighbouring payloads are read in a single sequential read, including any
+    bytes between them.
+
+    Parameters
+    ----------
+    proxies : list of :class:`PPDataProxy`
+        The data proxies to read.
+    max_gap : int, optional
+        The largest gap, in bytes, between two payloads that are read
+        together.  Defaults to ``_READ_MAX_GAP``.
+    max_size : int, optional
+        The largest total size, in bytes, of a read that combines several
+        payloads.  Defaults to ``_READ_MAX_SIZE``.
+
+    Yields
+    ------
+    (int, bytes)
+        The index of a proxy in `proxies`, and its payload, in the order that
+        they are read.
+
+    """
+    if max_gap is None:
+        max_gap = _READ_MAX_GAP
+    if max_size is None:
+        max_size = _READ_MAX_SIZE
+
+    # Sort the payloads by file and position, and form them into runs, each
+    # of which is a list of (index, start, stop) for a single file read.
+    order = sorted(
+        range(len(proxies)),
+        key=lambda index: (proxies[index].path, proxies[index].offset),
+    )
+    runs = []
+    run_path = run_start = run_stop = None
+    for index in order:
+        proxy = proxies[index]
+        start = proxy.offset
+        stop = start + proxy.data_len
+        if (
+            runs
+            and proxy.path == run_path
+            and start - run_stop <= max_gap
+            and max(stop, run_stop) - run_start <= max_size
+        ):
+            runs[-1][1].append((index, start, stop))
+            run_stop = max(stop, run_stop)
+        else:
+            run_path, run_start, run_stop = proxy.path, start, stop
+            runs.append((run_path, [(index, start, stop)]))
+
+    # Read each run, and split it into the individual payloads.
+    for path, run in itertools.groupby(runs, key=operator.itemgetter(0)):
+        with open(path, "rb") as pp_file:
+            for _, payloads in run:
+                run_start = payloads[0][1]
+                run_stop = max(stop for _, _, stop in payloads)
+                pp_file.seek(run_start, os.SEEK_SET)
+                data_bytes = pp_file.read(run_stop - run_start)
+                if len(payloads) == 1:
+                    yield payloads[0][0], data_bytes
+                else:
+                    for index, start, stop in payloads:
+                        yield index, data_bytes[start - run_start : stop - run_start]
+
+
+def _read_data_bytes(proxies, max_gap=None, max_size=None):
+    """Read the payload bytes of multiple :class:`PPDataProxy` objects.
+
+    See :func:`_iter_data_bytes`.
+
+    Returns
+    -------
+    list of bytes
+        The payload of each proxy, in the order given.
+
+    """
+    proxies = list(proxies)
+    results = [None] * len(proxies)
+    for index, data_bytes in _iter_data_bytes(
+        proxies, max_gap=max_gap, max_size=max_size
+    ):
+        results[index] = data_bytes
+    return results
+
+
+def _read_data_arrays(proxies, max_gap=None, max_size=None):
+    """Read and unpack the data of multiple :class:`PPDataProxy` objects.
+
+    The payloads are read with :func:`_iter_data_bytes`, so that fields which
+    are stored together in a file are read together.  When there are several
+    WGDOS or RLE packed payloads, these are unpacked concurrently in a thread
+    pool (see ``_UNPACK_MAX_WORKERS``), starting as soon as each is read.
+
+    Returns
+    -------
+    list of :class:`numpy.ndarray`
+        The (unindexed) data array of each proxy, in the order given.
+
+    """
+    proxies = list(proxies)
+    n_packed = sum(proxy.lbpack.n1 in (1, 4) for proxy in proxies)
+    executor = None
+    if n_packed > 1 and _UNPACK_MAX_WORKERS > 1:
+        executor = _unpack_executor()
+
+    results = [None] * len(proxies)
+    futures = {}
+    try:
+        for index, data_bytes in _iter_data_bytes(
+            proxies, max_gap=max_gap, max_size=max_size
+        ):
+            proxy = proxies[index]
+            if executor is not None and proxy.lbpack.n1 in (1, 4):
+                futures[index] = executor.submit(proxy._data_from_bytes, data_bytes)
+            else:
+                results[index] = proxy._data_from_bytes(data_bytes)
+        for index, future in futures.items():
+            results[index] = future.result()
+    finally:
+        for future in futures.values():
+            future.cancel()
+    return results
+
+
 def _data_bytes_to_shaped_array(
     data_bytes, lbpack, boundary_packing, data_shape, data_type, mdi, mask=None
 ):
@@ -846,6 +1009,7 @@ def _pp_attribute_names(header_defn):
         "raw_lbpack",
         "boundary_packing",
         "_index_in_structured_load_file",
+        "_data_proxy",
     ]
     return normal_headers + special_headers + extra_data + special_attributes
 
@@ -881,6 +1045,7 @@ class PPField(metaclass=ABCMeta):
         self.raw_lbpack = None
         self.boundary_packing = None
         self._index_in_structured_load_file = None
+        self._data_proxy = None
         if header is not None:
             self.raw_lbtim = header[self.HEADER_DICT["lbtim"][0]]
             self.raw_lbpack = header[self.HEADER_DICT["lbpack"][0]]
@@ -1070,6 +1235,8 @@ class PPField(metaclass=ABCMeta):
     @data.setter
     def data(self, value):
         self._data = value
+        # Any data proxy no longer describes the field payload.
+        self._data_proxy = None
 
     def core_data(self):
         return self._data
@@ -1761,6 +1928,9 @@ def _create_field_data(field, data_shape, land_mask_field=None):
             # For a "normal" (non-landsea-masked) field, the proxy can be
             # wrapped directly as a deferred array.
             field.data = as_lazy_data(proxy, meta=proxy.dask_meta, chunks=block_shape)
+            # Also record the proxy itself, so that structured loading can
+            # read many fields as a single lazy array.
+            field._data_proxy = proxy
         else:
             # This is a landsea-masked field, and its data must be handled in
             # a different way :  Because data shape/size is not known in
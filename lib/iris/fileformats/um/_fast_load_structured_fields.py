@@ -14,11 +14,89 @@ import itertools
 
 import cftime
 import numpy as np
+import numpy.ma as ma
 
 from iris._lazy_data import as_lazy_data, multidim_lazy_stack
+from iris.fileformats import _prefetch
 from iris.fileformats.um._optimal_array_structuring import optimal_array_structure
 
 
+class _FieldsDataProxy:
+    """A reference to the data payloads of an array of PP fields.
+
+    Indexing reads only the fields selected by the leading (vector) keys, so
+    a dask array wrapping this has a task per chunk of fields, rather than a
+    task per field.
+
+    """
+
+    __slots__ = ("proxies", "shape", "dtype")
+
+    def __init__(self, proxies):
+        """Create a proxy for the payloads of a structured group of fields.
+
+        Parameters
+        ----------
+        proxies : :class:`numpy.ndarray` of :class:`iris.fileformats.pp.PPDataProxy`
+            An object array of the data proxies of the individual fields,
+            arranged with the shape of the collation structure.
+            All the fields must have the same shape.
+
+        """
+        self.proxies = proxies
+        self.shape = proxies.shape + tuple(proxies.flat[0].shape)
+        self.dtype = np.result_type(*[proxy.dtype for proxy in proxies.flat])
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def dask_meta(self):
+        return np.empty((0,) * self.ndim, dtype=self.dtype)
+
+    def __getitem__(self, keys):
+        return _prefetch.read(self, keys)
+
+    def _read(self, keys):
+        # N.B. deferred import, to avoid a circular import.
+        from iris.fileformats.pp import _read_data_arrays
+
+        if not isinstance(keys, tuple):
+            keys = (keys,)
+        n_vector_dims = self.proxies.ndim
+        # N.B. the trailing Ellipsis keeps a (possibly 0-d) array of proxies.
+        proxies = self.proxies[keys[:n_vector_dims] + (Ellipsis,)]
+        field_keys = keys[n_vector_dims:]
+        # Read the selected fields together, so that neighbouring payloads are
+        # fetched in single reads.
+        arrays = [array[field_keys] for array in _read_data_arrays(proxies.flat)]
+        if arrays:
+            if any(ma.isMaskedArray(array) for array in arrays):
+                result = ma.stack(arrays)
+            else:
+                result = np.stack(arrays)
+            result = result.reshape(proxies.shape + arrays[0].shape)
+        else:
+            field_shape = self.shape[n_vector_dims:]
+            field_shape = np.broadcast_to(self.dask_meta, field_shape)[field_keys].shape
+            result = np.empty(proxies.shape + field_shape, dtype=self.dtype)
+        return np.asanyarray(result, dtype=self.dtype)
+
+    def __repr__(self):
+        fmt = "<{self.__class__.__name__} shape={self.shape} dtype={self.dtype!r}>"
+        return fmt.format(self=self)
+
+    def __getstate__(self):
+        # Because we have __slots__, this is needed to support Pickle.dump()
+        return [(name, getattr(self, name)) for name in self.__slots__]
+
+    def __setstate__(self, state):
+        # Because we have __slots__, this is needed to support Pickle.load()
+        for key, value in state:
+            setattr(self, key, value)
+
+
 class BasicFieldCollation:
     """An object representing a group of UM fields with array structure.
 
@@ -72,10 +150,35 @@ class BasicFieldCollation:
         if not self._structure_calculated:
             self._calculate_structure()
         if self._data_cache is None:
-            stack = np.empty(self.vector_dims_shape, "object")
-            for nd_index, field in zip(np.ndindex(self.vector_dims_shape), self.fields):
-                stack[nd_index] = as_lazy_data(field._data)
-            self._data_cache = multidim_lazy_stack(stack)
+            proxies = [getattr(field, "_data_proxy", None) for field in self.fields]
+            if (
+                all(proxy is not None for proxy in proxies)
+                and len(set(tuple(proxy.shape) for proxy in proxies)) == 1
+                and 0 not in proxies[0].shape
+            ):
+                # Read all the fields through a single proxy, so that each dask
+                # chunk loads a contiguous run of fields.
+                stack = np.empty(self.vector_dims_shape, "object")
+                for nd_index, proxy in zip(np.ndindex(stack.shape), proxies):
+                    stack[nd_index] = proxy
+                proxy = _FieldsDataProxy(stack)
+                # Fields are never split, so the chunking can only combine
+                # fields, which it does for the inner (fastest-varying) dims
+                # first, i.e. each chunk is a contiguous run of fields.
+                n_field_dims = proxy.ndim - stack.ndim
+                self._data_cache = as_lazy_data(
+                    proxy,
+                    chunks=(1,) * stack.ndim + proxy.shape[stack.ndim :],
+                    meta=proxy.dask_meta,
+                    dims_fixed=(False,) * stack.ndim + (True,) * n_field_dims,
+                )
+            else:
+                stack = np.empty(self.vector_dims_shape, "object")
+                for nd_index, field in zip(
+                    np.ndindex(self.vector_dims_shape), self.fields
+                ):
+                    stack[nd_index] = as_lazy_data(field._data)
+                self._data_cache = multidim_lazy_stack(stack)
         return self._data_cache
 
     def core_data(self):
@@ -13,12 +13,13 @@ from iris.fileformats.netcdf.saver import save_mesh
 from iris.fileformats.netcdf.ugrid_load import load_mesh, load_meshes
 
 from .components import Connectivity, MeshCoord, MeshXY
-from .utils import recombine_submeshes
+from .utils import extract_mesh_region, recombine_submeshes
 
 __all__ = [
     "Connectivity",
     "MeshCoord",
     "MeshXY",
+    "extract_mesh_region",
     "load_mesh",
     "load_meshes",
     "recombine_submeshes",
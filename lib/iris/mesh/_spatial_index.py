@@ -0,0 +1,230 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+
+"""A spatial index of the elements of a mesh location.
+
+Supports :meth:`iris.mesh.MeshXY.locate_points` and
+:meth:`iris.mesh.MeshXY.locate_region`.
+
+"""
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+#: Number of nearest element centres tested for containing each point.
+N_CANDIDATES = 8
+
+#: Maximum number of points located in a single vectorised operation, which
+#: limits the size of the temporary (points, candidates, vertices) arrays.
+POINTS_BATCH_SIZE = 100_000
+
+
+class SpatialIndex:
+    """A spatial index of the elements of a mesh location.
+
+    Each element is described by the x and y values of its vertices, i.e. the
+    node points, for a node location, or the bounds of a face or edge location.
+    The element extents are calculated on creation, but the KD-tree of the
+    element centres is only built when it is first needed.
+
+    """
+
+    def __init__(self, x_vertices, y_vertices, modulus=None, spherical=False):
+        """Create a spatial index from the element vertices.
+
+        Parameters
+        ----------
+        x_vertices, y_vertices : array
+            The (real, possibly masked) vertex values of each element, of
+            shape (n_elements, n_vertices).  Masked vertices are ignored.
+        modulus : float, optional
+            The modulus of the x values, if they are cyclic, e.g. 360 for
+            longitudes in degrees.
+        spherical : bool, default=False
+            Whether x and y are longitudes and latitudes, in the same angular
+            units, in which case the KD-tree is built from 3-D cartesian
+            positions.  Requires a ``modulus``.
+
+        """
+        x_vertices = np.ma.masked_invalid(np.ma.asanyarray(x_vertices, dtype=float))
+        y_vertices = np.ma.masked_invalid(np.ma.asanyarray(y_vertices, dtype=float))
+        missing = np.ma.getmaskarray(x_vertices) | np.ma.getmaskarray(y_vertices)
+
+        # Replace missing vertices with the first vertex of the element, which
+        # does not change the element extent, or the enclosed polygon.
+        # N.B. elements with no valid vertices are never located.
+        self.valid = ~np.all(missing, axis=-1)
+        i_first = np.argmin(missing, axis=-1)[:, None]
+        x = np.ma.getdata(x_vertices)
+        y = np.ma.getdata(y_vertices)
+        x = np.where(missing, np.take_along_axis(x, i_first, axis=-1), x)
+        y = np.where(missing, np.take_along_axis(y, i_first, axis=-1), y)
+
+        if modulus is not None:
+            # Unwrap cyclic values, so that each element is contiguous.
+            x = _wrap(x, x[:, :1], modulus)
+
+        self.x_vertices = x
+        self.y_vertices = y
+        self.modulus = modulus
+        self.spherical = spherical
+        self.x_min = np.min(x, axis=-1)
+        self.x_max = np.max(x, axis=-1)
+        self.y_min = np.min(y, axis=-1)
+        self.y_max = np.max(y, axis=-1)
+        self._tree = None
+        self._max_radius = None
+
+    def __len__(self):
+        return self.x_vertices.shape[0]
+
+    def _positions(self, x, y):
+        # The KD-tree positions of the given x and y values.
+        if self.spherical:
+            to_radians = 2 * np.pi / self.modulus
+            x = x * to_radians
+            y = y * to_radians
+            cos_y = np.cos(y)
+            result = np.stack([cos_y * np.cos(x), cos_y * np.sin(x), np.sin(y)], -1)
+        else:
+            result = np.stack([x, y], -1)
+        return result
+
+    def _build_tree(self):
+        # Index the element centres, and record the greatest distance of any
+        # vertex from its element centre.
+        x_centres = np.mean(self.x_vertices, axis=-1)
+        y_centres = np.mean(self.y_vertices, axis=-1)
+        centres = self._positions(x_centres, y_centres)
+        vertices = self._positions(self.x_vertices, self.y_vertices)
+        radii = np.linalg.norm(vertices - centres[:, None, :], axis=-1)
+        # N.B. elements with no valid vertices are not indexed.
+        self._tree_elements = np.nonzero(self.valid)[0]
+        self._tree = cKDTree(centres[self._tree_elements])
+        self._max_radius = float(np.max(radii[self._tree_elements], initial=0.0))
+
+    def _contains(self, i_elements, x, y):
+        # Whether each of the elements contains the matching point, by
+        # counting the crossings of a ray from the point in the +x direction.
+        # N.B. the elements may have any shape, with the points broadcast
+        # against them.
+        x_vertices = self.x_vertices[i_elements]
+        y_vertices = self.y_vertices[i_elements]
+        x = np.broadcast_to(x, i_elements.shape)[..., None]
+        y = np.broadcast_to(y, i_elements.shape)[..., None]
+        if self.modulus is not None:
+            x = _wrap(x, x_vertices[..., :1], self.modulus)
+        x_next = np.roll(x_vertices, -1, axis=-1)
+        y_next = np.roll(y_vertices, -1, axis=-1)
+        straddles = (y_vertices > y) != (y_next > y)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_cross = x_vertices + (x_next - x_vertices) * (y - y_vertices) / (
+                y_next - y_vertices
+            )
+        crossings = np.count_nonzero(straddles & (x < x_cross), axis=-1)
+        return (crossings % 2 == 1) & self.valid[i_elements]
+
+    def locate_points(self, x, y):
+        """Find the elements which contain each of the given points.
+
+        Parameters
+        ----------
+        x, y : array
+            The point values, of matching shape.
+
+        Returns
+        -------
+        array of int
+            The index of an element containing each point, or -1 where none
+            does, of the same shape as the points.
+
+        """
+        if self._tree is None:
+            self._build_tree()
+        x, y = np.broadcast_arrays(
+            np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        )
+        shape = x.shape
+        x = x.ravel()
+        y = y.ravel()
+        result = np.full(x.shape, -1, dtype=int)
+        n_candidates = min(N_CANDIDATES, self._tree_elements.size)
+        if n_candidates == 0:
+            return result.reshape(shape)
+
+        for start in range(0, x.size, POINTS_BATCH_SIZE):
+            batch = slice(start, start + POINTS_BATCH_SIZE)
+            x_batch = x[batch]
+            y_batch = y[batch]
+            positions = self._positions(x_batch, y_batch)
+            # First, test the elements with the nearest centres.
+            distances, candidates = self._tree.query(positions, k=n_candidates)
+            distances = distances.reshape(x_batch.shape + (n_candidates,))
+            candidates = candidates.reshape(x_batch.shape + (n_candidates,))
+            candidates = self._tree_elements[candidates]
+            contained = self._contains(candidates, x_batch[:, None], y_batch[:, None])
+            found = np.any(contained, axis=-1)
+            batch_result = np.where(
+                found,
+                np.take_along_axis(
+                    candidates, np.argmax(contained, axis=-1)[:, None], axis=-1
+                )[:, 0],
+                -1,
+            )
+
+            # Then test all the other elements in range of any points not yet
+            # found, unless all of those were already candidates.
+            # N.B. this is only needed where the elements vary greatly in size.
+            retest = ~found & (distances[:, -1] <= self._max_radius)
+            for i_point in np.nonzero(retest)[0]:
+                in_range = self._tree.query_ball_point(
+                    positions[i_point], r=self._max_radius
+                )
+                in_range = self._tree_elements[np.sort(in_range).astype(int)]
+                contained = self._contains(in_range, x_batch[i_point], y_batch[i_point])
+                if np.any(contained):
+                    batch_result[i_point] = in_range[np.argmax(contained)]
+
+            result[batch] = batch_result
+
+        return result.reshape(shape)
+
+    def locate_region(self, x_range, y_range):
+        """Find the elements which intersect a bounding box.
+
+        Parameters
+        ----------
+        x_range, y_range : pair of float
+            The (minimum, maximum) extent of the box in each axis.  For cyclic
+            x values, a minimum greater than the maximum denotes a region which
+            crosses the cyclic boundary.
+
+        Returns
+        -------
+        array of int
+            The indices of the elements whose extents overlap the box, in
+            increasing order.
+
+        """
+        x0, x1 = (float(value) for value in x_range)
+        y0, y1 = (float(value) for value in y_range)
+        select = self.valid & (self.y_max >= y0) & (self.y_min <= y1)
+        if self.modulus is None:
+            select &= (self.x_max >= x0) & (self.x_min <= x1)
+        else:
+            modulus = self.modulus
+            if x1 < x0:
+                x1 += modulus
+            if x1 - x0 < modulus:
+                # Shift each element to start within one cycle above 'x0'.
+                x_min = _wrap(self.x_min, x0 + 0.5 * modulus, modulus)
+                x_max = x_min + (self.x_max - self.x_min)
+                select &= (x_min <= x1) | (x_max >= x0 + modulus)
+        return np.nonzero(select)[0]
+
+
+def _wrap(values, base, modulus):
+    # Wrap cyclic values into the cycle centred on 'base'.
+    return base + (values - base + 0.5 * modulus) % modulus - 0.5 * modulus
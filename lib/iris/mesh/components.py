@@ -24,12 +24,13 @@ from iris.common.metadata import ConnectivityMetadata, MeshCoordMetadata, MeshMe
 
 from .. import _lazy_data as _lazy
 from ..common import CFVariableMixin, metadata_filter, metadata_manager_factory
-from ..common.metadata import BaseMetadata
+from ..common.metadata import BaseMetadata, hexdigest
 from ..config import get_logger
 from ..coords import AuxCoord, _DimensionalMetadata
 from ..exceptions import ConnectivityNotFoundError, CoordinateNotFoundError
 from ..util import array_equal, clip_string, guess_coord_axis
 from ..warnings import IrisVagueMetadataWarning
+from ._spatial_index import SpatialIndex
 
 # Configure the logger.
 logger = get_logger(__name__, propagate=True, handler=False)
@@ -87,6 +88,25 @@ Mesh2DConnectivities = namedtuple(
     ],
 )
 
+#: Namedtuple identifying the content of an array, for derivation caching.
+_ArrayToken = namedtuple("_ArrayToken", ["shape", "dtype", "digest"])
+
+
+def _array_token(array):
+    """Return an :data:`_ArrayToken` identifying the content of an array.
+
+    Real arrays are identified by a hash of their values and mask, and lazy
+    arrays by their name, which is derived from their content.
+
+    """
+    if _lazy.is_lazy_data(array):
+        digest = array.name
+    else:
+        digest = hexdigest(np.ascontiguousarray(np.ma.getdata(array)))
+        if np.ma.is_masked(array):
+            digest += hexdigest(np.ascontiguousarray(np.ma.getmaskarray(array)))
+    return _ArrayToken(array.shape, array.dtype, digest)
+
 
 class Connectivity(_DimensionalMetadata):
     """CF-UGRID topology.
@@ -677,6 +697,10 @@ class MeshXY(Mesh):
 
         self._metadata_manager = metadata_manager_factory(MeshMetadata)
 
+        # Arrays and indexes derived from the mesh components, by key.
+        # See :meth:`_cached_derivation`.
+        self._derived_cache = {}
+
         # topology_dimension is read-only, so assign directly to the metadata manager
         if topology_dimension not in self.TOPOLOGY_DIMENSIONS:
             emsg = f"Expected 'topology_dimension' in range {self.TOPOLOGY_DIMENSIONS!r}, got {topology_dimension!r}."
@@ -1103,6 +1127,7 @@ class MeshXY(Mesh):
         self._metadata_manager = metadata_manager
         self._coord_manager = coord_manager
         self._connectivity_manager = connectivity_manager
+        self._derived_cache = {}
 
     def _set_dimension_names(self, node, edge, face, reset=False):
         args = (node, edge, face)
@@ -1289,6 +1314,7 @@ class MeshXY(Mesh):
 
         """
         self._connectivity_manager.add(*connectivities)
+        self._derived_cache.clear()
 
     def add_coords(
         self,
@@ -1330,6 +1356,7 @@ class MeshXY(Mesh):
         kwargs = {k: v for k, v in kwargs.items() if v}
 
         self._coord_manager.add(**kwargs)
+        self._derived_cache.clear()
 
     def connectivities(
         self,
@@ -1740,7 +1767,7 @@ class MeshXY(Mesh):
             criteria.
 
         """
-        return self._connectivity_manager.remove(
+        result = self._connectivity_manager.remove(
             item=item,
             standard_name=standard_name,
             long_name=long_name,
@@ -1751,6 +1778,9 @@ class MeshXY(Mesh):
             contains_edge=contains_edge,
             contains_face=contains_face,
         )
+        self._derived_cache.clear()
+
+        return result
 
     def remove_coords(
         self,
@@ -1818,6 +1848,7 @@ class MeshXY(Mesh):
             axis=axis,
             location=location,
         )
+        self._derived_cache.clear()
 
         return result
 
@@ -1852,6 +1883,223 @@ class MeshXY(Mesh):
     #     # factory method
     #     # return the lazy AuxCoord(...), AuxCoord(...)
 
+    def _cached_derivation(self, key, sources, calculate):
+        """Return a result derived from the mesh components, with caching.
+
+        Parameters
+        ----------
+        key : hashable
+            Identifies the derived result.
+        sources : tuple
+            The objects from which the result is derived.  A cached result is
+            only re-used while all of these are unchanged : arrays are
+            compared by content, and any other objects by identity.
+        calculate : callable
+            Calculates the result, when no valid cached result exists.
+
+        """
+        # N.B. real arrays can be modified in-place, so are identified by a
+        # hash of their content.  Lazy arrays are identified by their name,
+        # which is a token of their content.
+        # The cache also holds references to its other sources, so the
+        # identity checks cannot be fooled by re-use of the ids of deleted
+        # objects.
+        sources = tuple(
+            _array_token(source)
+            if isinstance(source, (np.ndarray, da.Array))
+            else source
+            for source in sources
+        )
+        cached = self._derived_cache.get(key)
+        if cached is not None:
+            cached_sources, result = cached
+            if len(sources) == len(cached_sources) and all(
+                source is cached_source
+                or (isinstance(source, _ArrayToken) and source == cached_source)
+                for source, cached_source in zip(sources, cached_sources)
+            ):
+                return result
+
+        result = calculate()
+        self._derived_cache[key] = (sources, result)
+        return result
+
+    def _location_bounds(self, location, axis):
+        """Return the bounds of a face or edge location, derived from the nodes.
+
+        The result is cached, so that it can be re-used by all the
+        :class:`~iris.mesh.MeshCoord` s referencing this mesh, which are
+        re-created by many cube operations, e.g. copying and indexing.
+
+        The cached result is discarded if the node coordinate or the
+        connectivity, or the content of their arrays, changes, or when any
+        coords or connectivities are added to or removed from the mesh.
+
+        Parameters
+        ----------
+        location : str
+            Either ``"face"`` or ``"edge"``.
+        axis : str
+            Either ``"x"`` or ``"y"``.
+
+        Returns
+        -------
+        array
+            The (real or lazy) bounds array, of shape (n_locations, n_bounds),
+            masked where the connectivity indices are missing or invalid.
+            A real result is a new copy, which the caller may modify.
+
+        """
+        node_coord = self.coord(location="node", axis=axis)
+        connectivity = getattr(self, f"{location}_node_connectivity")
+
+        # N.B. the arrays are fetched from the data managers, since
+        # 'core_points' and 'core_indices' return a new view of real arrays.
+        sources = (
+            node_coord,
+            node_coord._values_dm.core_data(),
+            connectivity,
+            connectivity._values_dm.core_data(),
+        )
+        bounds = self._cached_derivation(
+            ("bounds", location, axis),
+            sources,
+            lambda: self._calculate_location_bounds(node_coord, connectivity),
+        )
+        if not _lazy.is_lazy_data(bounds):
+            bounds = bounds.copy()
+        return bounds
+
+    @staticmethod
+    def _calculate_location_bounds(node_coord, connectivity):
+        # Bounds are calculated from a connectivity and the node points.
+        # Data can be real or lazy, so operations must work in Dask, too.
+        node_points = node_coord.core_points()
+        indices = connectivity.core_indices()
+        # Normalise indices dimension order to [faces/edges, bounds]
+        indices = connectivity.indices_by_location(indices)
+        # Normalise the start index
+        indices = indices - connectivity.start_index
+
+        n_nodes = node_points.shape[0]
+        # Choose real/lazy array library, to suit array types.
+        lazy = _lazy.is_lazy_data(indices) or _lazy.is_lazy_data(node_points)
+        al = da if lazy else np
+        # NOTE: Dask cannot index with a multidimensional array, so we
+        # must flatten it and restore the shape later.
+        flat_inds = indices.flatten()
+        # NOTE: the connectivity array can have masked points, but we can't
+        # effectively index with those.  So use a non-masked index array
+        # with "safe" index values, and post-mask the results.
+        flat_inds_nomask = al.ma.filled(flat_inds, -1)
+        # Note: *also* mask any places where the index is out of range.
+        missing_inds = (flat_inds_nomask < 0) | (flat_inds_nomask >= n_nodes)
+        flat_inds_safe = al.where(missing_inds, 0, flat_inds_nomask)
+        # Here's the core indexing operation.
+        # The comma applies all inds-array values to the *first* dimension.
+        bounds = node_points[flat_inds_safe,]
+        # Fix 'missing' locations, and restore the proper shape.
+        bounds = al.ma.masked_array(bounds, missing_inds)
+        bounds = bounds.reshape(indices.shape)
+        return bounds
+
+    def _spatial_index(self, location):
+        """Return a spatial index of the elements of a mesh location.
+
+        The index is built when first needed, and cached in the same way as
+        the results of :meth:`_location_bounds`.
+
+        """
+        if location not in self.ELEMENTS:
+            emsg = (
+                f"Expected 'location' to be one of {self.ELEMENTS!r}, "
+                f"got {location!r}."
+            )
+            raise ValueError(emsg)
+        node_coords = [self.coord(location="node", axis=axis) for axis in self.AXES]
+        # N.B. the units determine whether the x values are cyclic.
+        x_units = node_coords[0].units
+        # N.B. as for :meth:`_location_bounds`, the arrays are fetched from
+        # the data managers.
+        sources = tuple(node_coords) + tuple(
+            coord._values_dm.core_data() for coord in node_coords
+        )
+        if location != "node":
+            if not self.connectivities(cf_role=f"{location}_node_connectivity"):
+                emsg = f"The mesh has no {location}_node_connectivity."
+                raise ValueError(emsg)
+            connectivity = getattr(self, f"{location}_node_connectivity")
+            sources += (connectivity, connectivity._values_dm.core_data())
+        sources += (x_units,)
+
+        def calculate():
+            if location == "node":
+                vertices = [coord.core_points()[:, None] for coord in node_coords]
+            else:
+                vertices = [self._location_bounds(location, axis) for axis in self.AXES]
+            x_vertices, y_vertices = (
+                _lazy.as_concrete_data(array) for array in vertices
+            )
+            modulus = x_units.modulus
+            return SpatialIndex(
+                x_vertices,
+                y_vertices,
+                modulus=modulus,
+                spherical=modulus is not None and x_units.is_convertible("degrees"),
+            )
+
+        return self._cached_derivation(("spatial_index", location), sources, calculate)
+
+    def locate_points(self, x, y):
+        """Find the faces of the mesh which contain the given points.
+
+        Uses a spatial index of the faces, which is built from the
+        :attr:`face_node_connectivity` and node coordinates when first needed,
+        and re-used until they change.  Faces are treated as polygons with
+        straight sides, in the coordinates of the nodes, but for longitude
+        and latitude nodes the index accounts for the cyclic longitudes.
+
+        Parameters
+        ----------
+        x, y : array-like
+            The point coordinate values, in the units of the node
+            coordinates.  Must be broadcastable to a common shape.
+
+        Returns
+        -------
+        array of int
+            The index of the face containing each point, of the common shape
+            of ``x`` and ``y``.  Points outside all the faces have a value of
+            -1.  Where faces overlap, one containing face is chosen.
+
+        """
+        return self._spatial_index("face").locate_points(x, y)
+
+    def locate_region(self, x_range, y_range, location="face"):
+        """Find the elements of a mesh location which intersect a region.
+
+        Uses a spatial index of the location elements, as for
+        :meth:`locate_points`.  The element extents are compared with the
+        region, so this includes all elements which intersect it, but also any
+        elements which lie outside it, but whose extents overlap it.
+
+        Parameters
+        ----------
+        x_range, y_range : pair of float
+            The (minimum, maximum) extent of the region in each axis, in the
+            units of the node coordinates.  For longitudes, a minimum greater
+            than the maximum denotes a region which crosses the dateline.
+        location : str, default="face"
+            The mesh location : one of ``"node"``, ``"edge"`` or ``"face"``.
+
+        Returns
+        -------
+        array of int
+            The indices of the intersecting elements, in increasing order.
+
+        """
+        return self._spatial_index(location).locate_region(x_range, y_range)
+
     def to_MeshCoord(self, location, axis):
         """Generate a :class:`~iris.mesh.MeshCoord`.
 
@@ -2867,6 +3115,10 @@ class MeshCoord(AuxCoord):
         # Translate "self[:,]" as "self.copy()".
         return self.copy()
 
+    def _view(self, keys=None):
+        # A MeshCoord shares the arrays of its mesh anyway.
+        return self.copy() if keys is None else self[keys]
+
     def collapsed(self, dims_to_collapse=None):
         """Return a copy of this coordinate, which has been collapsed along the specified dimensions.
 
@@ -3038,48 +3290,16 @@ class MeshCoord(AuxCoord):
 
         """
         mesh, location, axis = self.mesh, self.location, self.axis
-        node_coord = mesh.coord(location="node", axis=axis)
 
         if location == "node":
-            points_coord = node_coord
-            bounds_connectivity = None
+            points_coord = mesh.coord(location="node", axis=axis)
+            bounds = None
         else:
             points_coord = mesh.coord(location=location, axis=axis)
-            bounds_connectivity = getattr(mesh, f"{location}_node_connectivity")
+            # Bounds are derived from the nodes, and cached by the mesh.
+            bounds = mesh._location_bounds(location, axis)
 
         # The points output is the points of the relevant element-type coord.
         points = points_coord.core_points()
-        if bounds_connectivity is None:
-            bounds = None
-        else:
-            # Bounds are calculated from a connectivity and the node points.
-            # Data can be real or lazy, so operations must work in Dask, too.
-            indices = bounds_connectivity.core_indices()
-            # Normalise indices dimension order to [faces/edges, bounds]
-            indices = bounds_connectivity.indices_by_location(indices)
-            # Normalise the start index
-            indices = indices - bounds_connectivity.start_index
-
-            node_points = node_coord.core_points()
-            n_nodes = node_points.shape[0]
-            # Choose real/lazy array library, to suit array types.
-            lazy = _lazy.is_lazy_data(indices) or _lazy.is_lazy_data(node_points)
-            al = da if lazy else np
-            # NOTE: Dask cannot index with a multidimensional array, so we
-            # must flatten it and restore the shape later.
-            flat_inds = indices.flatten()
-            # NOTE: the connectivity array can have masked points, but we can't
-            # effectively index with those.  So use a non-masked index array
-            # with "safe" index values, and post-mask the results.
-            flat_inds_nomask = al.ma.filled(flat_inds, -1)
-            # Note: *also* mask any places where the index is out of range.
-            missing_inds = (flat_inds_nomask < 0) | (flat_inds_nomask >= n_nodes)
-            flat_inds_safe = al.where(missing_inds, 0, flat_inds_nomask)
-            # Here's the core indexing operation.
-            # The comma applies all inds-array values to the *first* dimension.
-            bounds = node_points[flat_inds_safe,]
-            # Fix 'missing' locations, and restore the proper shape.
-            bounds = al.ma.masked_array(bounds, missing_inds)
-            bounds = bounds.reshape(indices.shape)
 
         return points, bounds
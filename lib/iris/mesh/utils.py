@@ -6,12 +6,16 @@
 """Utility operations specific to unstructured data."""
 
 from collections.abc import Sequence
+import itertools
 from typing import Union
 
 import dask.array as da
+from dask.base import tokenize
+from dask.highlevelgraph import HighLevelGraph
 import numpy as np
 
 from iris.common.metadata import CoordMetadata
+from iris.coords import AuxCoord
 from iris.cube import Cube
 
 
@@ -213,103 +217,200 @@ def recombine_submeshes(
 
     # Use the mesh_dim to transpose inputs + outputs, if required, as it is
     # simpler for all the array operations to always have the mesh dim *last*.
-    if mesh_dim == mesh_cube.ndim - 1:
-        # Mesh dim is already the last one : no transpose required
-        untranspose_dims = None
-    else:
-        dim_range = np.arange(mesh_cube.ndim, dtype=int)
-        # Transpose all inputs to mesh-last order
-        tranpose_dims = [i_dim for i_dim in dim_range if i_dim != mesh_dim] + [
-            mesh_dim
-        ]  # chop out mesh_dim + put it at the end
-
-        def transposed_copy(cube, dim_order):
-            cube = cube.copy()
-            cube.transpose(dim_order)
-            return cube
-
-        mesh_cube = transposed_copy(mesh_cube, tranpose_dims)
-        submesh_cubes = [
-            transposed_copy(region_cube, tranpose_dims) for region_cube in submesh_cubes
-        ]
-
-        # Also prepare for transforming the output back to the original order
-        untranspose_dims = dim_range.copy()
-        # Neat trick to produce the reverse operation
-        untranspose_dims[tranpose_dims] = dim_range
+    # N.B. only the data arrays are transposed, not the cubes themselves.
+    dim_range = np.arange(mesh_cube.ndim, dtype=int)
+    # Chop out mesh_dim + put it at the end
+    transpose_dims = tuple(int(i_dim) for i_dim in dim_range if i_dim != mesh_dim) + (
+        mesh_dim,
+    )
+    # Also prepare for transforming the output back to the original order
+    untranspose_dims = dim_range.copy()
+    # Neat trick to produce the reverse operation
+    untranspose_dims[list(transpose_dims)] = dim_range
+    untranspose_dims = tuple(int(i_dim) for i_dim in untranspose_dims)
+
+    # N.B. this does not use the mesh_cube data values, but only its shape and
+    # chunking, since the data itself is not used in the calculation.
+    # N.B. chunking matches the input cube, allowing performance control.
+    input_data = mesh_cube.lazy_data().transpose(transpose_dims)
+    n_mesh = input_data.shape[-1]
+    outer_chunks = input_data.chunks[:-1]
+
+    #
+    # Build a global "scatter index", which records for each point of the
+    # result the region which it comes from (or -1 for none), and its index
+    # within that region.
+    #
+    n_regions = len(submesh_cubes)
+    region_numbers = np.full(n_mesh, -1, dtype=int)
+    region_indices = np.zeros(n_mesh, dtype=int)
+    for i_region, cube in enumerate(submesh_cubes):
+        # Mesh location indices from the mesh-dim coord.
+        mesh_dimcoord = cube.coord(name_or_coord=index_coord_name, dimensions=mesh_dim)
+        inds = mesh_dimcoord.points
+        # N.B. later regions override earlier ones, as do later points within
+        # a region, where the same location occurs more than once.
+        unique_inds, i_reversed = np.unique(inds[::-1], return_index=True)
+        region_numbers[unique_inds] = i_region
+        region_indices[unique_inds] = len(inds) - 1 - i_reversed
+
+    #
+    # Work out which points of which region chunks each block of the result
+    # needs, so that each block only reads the regions which it uses.
+    # N.B. a stable sort by region number gives the result points of each
+    # region in order, and so also grouped by the result blocks.
+    #
+    mesh_chunks = input_data.chunks[-1]
+    n_blocks = len(mesh_chunks)
+    i_blocks = np.repeat(np.arange(n_blocks), mesh_chunks)
+    block_starts = np.cumsum((0,) + mesh_chunks[:-1])
+    i_points = np.argsort(region_numbers, kind="stable")
+    region_counts = np.bincount(region_numbers + 1, minlength=n_regions + 1)
+    region_points = np.split(i_points, np.cumsum(region_counts[:-1]))[1:]
+    region_arrays = []
+    # For each result block, a list of (region, chunk, indices, positions).
+    block_pieces = [[] for _ in range(n_blocks)]
+    for cube, points in zip(submesh_cubes, region_points):
+        if not points.size:
+            continue
+        # Lazy data array from the region cube, with outer chunks matching
+        # the result, and its own chunks in the mesh dim.
+        sub_data = cube.lazy_data().transpose(transpose_dims)
+        sub_data = sub_data.rechunk(outer_chunks + (sub_data.chunks[-1],))
+        i_array = len(region_arrays)
+        region_arrays.append(sub_data)
+        # The chunk of the region, and the index within it, of each point.
+        chunk_starts = np.cumsum((0,) + sub_data.chunks[-1][:-1])
+        inds = region_indices[points]
+        i_chunks = np.searchsorted(chunk_starts, inds, side="right") - 1
+        # Group the points by result block and region chunk.
+        n_chunks = len(chunk_starts)
+        groups = i_blocks[points] * n_chunks + i_chunks
+        i_sorted = np.argsort(groups, kind="stable")
+        group_counts = np.bincount(groups, minlength=n_blocks * n_chunks)
+        group_ends = np.cumsum(group_counts)
+        for group in np.flatnonzero(group_counts):
+            select = i_sorted[
+                group_ends[group] - group_counts[group] : group_ends[group]
+            ]
+            i_block, i_chunk = divmod(group, n_chunks)
+            block_pieces[i_block].append(
+                (
+                    i_array,
+                    i_chunk,
+                    inds[select] - chunk_starts[i_chunk],
+                    points[select] - block_starts[i_block],
+                )
+            )
 
     #
     # Here's the core operation..
     #
-    def fill_region(target, regiondata, regioninds):
-        if not target.flags.writeable:
-            # The initial input can be a section of a da.zeros(), which has no
-            # real array "behind" it.  This means that real arrays created in
-            # memory are only chunk-sized, but it also means that 'target' may
-            # not be writeable.  So take a copy to fix that, where needed.
-            target = target.copy()
-        # N.B. Indices are basically 1D, but may have leading *1 dims for
-        # alignment, to satisfy da.map_blocks
-        assert all(size == 1 for size in regioninds.shape[:-1])
-        inds = regioninds.flatten()
-        # Assign blocks with indexing on the last dim only
-        target[..., inds] = regiondata
-        return target
-
-    # Create an initially 'empty' (all-masked) dask array matching the input.
-    # N.B. this does not use the mesh_cube.lazy_data() array, but only its
-    # shape and dtype, since the data itself is not used in the calculation.
-    # N.B. chunking matches the input cube, allowing performance control.
-    input_data = mesh_cube.lazy_data()
-    result_array = da.ma.masked_array(
-        da.zeros(
-            input_data.shape,
-            dtype=result_dtype,
-            chunks=input_data.chunksize,
-        ),
-        True,
+    def combine_regions(shape, pieces):
+        # N.B. called for each block of the result, with the chunks of the
+        # regions which it uses, and the points to take from each.
+        result = np.ma.masked_all(shape, dtype=result_dtype)
+        for region_data, indices, positions in pieces:
+            result[..., positions] = region_data[..., indices]
+        return result
+
+    # Compose all the regions in a single graph layer.
+    # N.B. the result blocks are given by the mesh_cube chunks, but the
+    # regions have their own chunks in the mesh dim, and each block of the
+    # result depends on only those region chunks which it uses.
+    name = "combine_regions-" + tokenize(
+        [region_array.name for region_array in region_arrays],
+        region_numbers,
+        region_indices,
+        input_data.chunks,
     )
-
-    # Wrap this repeatedly with a lazy operation to assign each region.
-    # It is done this way because we couldn't get map_blocks to correctly wrap
-    # a function which does all regions in a single operation.
-    # TODO: replace with a single-stage solution: Probably better, if possible.
-    # Notes on resultant calculation properties:
-    # 1. map_blocks is chunk-mapped, so it is parallelisable and space-saving
-    # 2. However, fetching less than a whole chunk is not efficient
-    for cube in submesh_cubes:
-        # Lazy data array from the region cube
-        sub_data = cube.lazy_data()
-
-        # Lazy indices from the mesh-dim coord
-        mesh_dimcoord = cube.coord(
-            name_or_coord=index_coord_name, dimensions=cube.ndim - 1
-        )
-        indarr = mesh_dimcoord.lazy_points()
-
-        # Extend indarr dimensions to align it with the 'target' array dims
-        assert indarr.ndim == 1
-        shape = (1,) * (cube.ndim - 1) + indarr.shape
-        indarr = indarr.reshape(shape)
-
-        # Apply the operation to paste from one region into the target
-        # N.B. replacing 'result_array' each time around the loop
-        result_array = da.map_blocks(
-            fill_region,
-            result_array,
-            sub_data,
-            indarr,
-            dtype=result_array.dtype,
-            meta=np.ndarray,
+    dsk = {}
+    for i_outer in itertools.product(*[range(len(chunks)) for chunks in outer_chunks]):
+        outer_shape = tuple(
+            chunks[i_chunk] for chunks, i_chunk in zip(outer_chunks, i_outer)
         )
+        for i_block, pieces in enumerate(block_pieces):
+            dsk[(name,) + i_outer + (i_block,)] = (
+                combine_regions,
+                outer_shape + (mesh_chunks[i_block],),
+                [
+                    [
+                        (region_arrays[i_array].name,) + i_outer + (i_chunk,),
+                        indices,
+                        positions,
+                    ]
+                    for i_array, i_chunk, indices, positions in pieces
+                ],
+            )
+    graph = HighLevelGraph.from_collections(name, dsk, dependencies=region_arrays)
+    result_array = da.Array(
+        graph,
+        name,
+        chunks=input_data.chunks,
+        meta=np.ma.masked_array(np.zeros((0,) * mesh_cube.ndim, dtype=result_dtype)),
+    )
 
-    # Construct the result cube
-    result_cube = mesh_cube.copy()
-    result_cube.data = result_array
+    # Construct the result cube, re-ordering dims as in the original input.
+    result_cube = mesh_cube.copy(data=result_array.transpose(untranspose_dims))
     # Copy names, units + attributes from region data (N.B. but not var_name)
     result_cube.metadata = result_metadata
-    if untranspose_dims is not None:
-        # Re-order dims as in the original input
-        result_cube.transpose(untranspose_dims)
 
     return result_cube
+
+
+def extract_mesh_region(
+    mesh_cube: Cube,
+    x_range: Sequence[float],
+    y_range: Sequence[float],
+    index_coord_name: str = "i_mesh_index",
+) -> Cube | None:
+    """Extract the part of a mesh cube which intersects a region.
+
+    The mesh elements are selected with :meth:`iris.mesh.MeshXY.locate_region`,
+    which uses a spatial index of the mesh, so this is fast even for very
+    large meshes.
+
+    Parameters
+    ----------
+    mesh_cube : Cube
+        The cube to extract from.
+        Must have a :class:`~iris.mesh.MeshXY`.
+
+    x_range, y_range : pair of float
+        The (minimum, maximum) extent of the region in each axis, in the units
+        of the mesh node coordinates.  For longitudes, a minimum greater than
+        the maximum denotes a region which crosses the dateline.
+
+    index_coord_name : str
+        Coord name of an index coord, added to the result on the mesh
+        dimension, which records the mesh location index of each datapoint.
+        This allows the result to be put back onto the original mesh with
+        :func:`recombine_submeshes`.
+
+    Returns
+    -------
+    Cube or None
+        A cube containing the mesh elements whose extents overlap the region,
+        in their original order, or None if there are none.
+        As for any indexing of the mesh dimension, the result has no mesh,
+        and its :class:`~iris.mesh.MeshCoord` s become
+        :class:`~iris.coords.AuxCoord` s.
+
+    """
+    mesh_dim = mesh_cube.mesh_dim()
+    if mesh_dim is None:
+        raise ValueError("'mesh_cube' has no \".mesh\".")
+
+    indices = mesh_cube.mesh.locate_region(
+        x_range, y_range, location=mesh_cube.location
+    )
+    if indices.size == 0:
+        return None
+
+    keys = [slice(None)] * mesh_cube.ndim
+    keys[mesh_dim] = indices
+    result = mesh_cube[tuple(keys)]
+    if not result.coords(index_coord_name, dimensions=(mesh_dim,)):
+        index_coord = AuxCoord(indices, long_name=index_coord_name)
+        result.add_aux_coord(index_coord, mesh_dim)
+    return result
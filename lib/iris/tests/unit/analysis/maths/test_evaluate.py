@@ -0,0 +1,110 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the :func:`iris.analysis.maths.evaluate` function."""
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests  # isort:skip
+
+from unittest import mock
+
+import dask.array as da
+import numpy as np
+import numpy.ma as ma
+
+from iris._lazy_data import as_lazy_data
+from iris.analysis.maths import evaluate, exp
+import iris.common.resolve
+from iris.common.resolve import Resolve
+import iris.tests.stock as stock
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.a = stock.simple_3d()
+        self.a.data = self.a.data + 1.0
+        self.a.units = "K"
+        self.b = self.a.copy(data=ma.masked_less(self.a.data * 2, 10))
+        self.c = self.a[0]
+        self.c.transpose()
+        self.c.units = "m"
+
+    def _check(self, result, expected):
+        self.assertEqual(result.metadata, expected.metadata)
+        self.assertEqual(result.coords(), expected.coords())
+        self.assertEqual(result.dtype, expected.dtype)
+        self.assertMaskedArrayEqual(result.data, expected.data)
+
+    def test_expression(self):
+        a, b, c = self.a, self.b, self.c
+        result = evaluate("-(a - b) * c / a ** 2 + 1", a=a, b=b, c=c)
+        self._check(result, -(a - b) * c / a**2 + 1)
+
+    def test_function(self):
+        a, b = self.a, self.b
+        result = evaluate("a * exp(a / b)", a=a, b=b)
+        self._check(result, a * exp(a / b))
+
+    def test_array(self):
+        array = np.arange(4.0)
+        result = evaluate("2 / (a * array)", a=self.a, array=array)
+        self._check(result, 2 / (self.a * array))
+
+    @mock.patch.object(da, "compute", wraps=da.compute)
+    def test_compute_once(self, mocked_compute):
+        result = evaluate("(a - b) * c", a=self.a, b=self.b, c=self.c)
+        self.assertFalse(result.has_lazy_data())
+        mocked_compute.assert_called_once()
+
+    def test_resolve(self):
+        # The metadata is resolved for each cube operation, but only once for
+        # repeated evaluations with operands of the same structure.
+        patch = mock.patch.dict(iris.common.resolve._RESOLVE_CACHE, clear=True)
+        patch.start()
+        self.addCleanup(patch.stop)
+        m_resolve = self.patch("iris.common.resolve.Resolve", wraps=Resolve)
+        evaluate("(a - b) * c", a=self.a, b=self.b, c=self.c)
+        self.assertEqual(m_resolve.call_count, 2)
+        a = self.a.copy(data=self.a.data * 3)
+        result = evaluate("(a - b) * c", a=a, b=self.b, c=self.c)
+        self.assertEqual(m_resolve.call_count, 2)
+        self._check(result, (a - self.b) * self.c)
+
+    @mock.patch.object(da, "compute", wraps=da.compute)
+    def test_lazy(self, mocked_compute):
+        a = self.a.copy(data=as_lazy_data(self.a.data))
+        result = evaluate("(a - b) * c", a=a, b=self.b, c=self.c)
+        self.assertTrue(result.has_lazy_data())
+        mocked_compute.assert_not_called()
+        self._check(result, (self.a - self.b) * self.c)
+
+    def test_operands_unchanged(self):
+        a = self.a.copy()
+        result = evaluate("a", a=a)
+        self.assertEqual(result, self.a)
+        self.assertIsNot(result, a)
+        result.data[0, 0, 0] = 99
+        self.assertEqual(a, self.a)
+
+    def test_invalid(self):
+        with self.assertRaisesRegex(ValueError, "Invalid expression 'a \\+'"):
+            evaluate("a +", a=self.a)
+
+    def test_unsupported(self):
+        for expression in ("a[0]", "a.data", "sin(a)", "a < 2", "'a'"):
+            with self.assertRaisesRegex(ValueError, "Unsupported expression"):
+                evaluate(expression, a=self.a)
+
+    def test_missing_operand(self):
+        with self.assertRaisesRegex(ValueError, "No operand given for 'b'"):
+            evaluate("a + b", a=self.a)
+
+    def test_not_cube(self):
+        with self.assertRaisesRegex(ValueError, "is not a cube"):
+            evaluate("1 + x", x=2)
+
+
+if __name__ == "__main__":
+    tests.main()
@@ -8,6 +8,8 @@
 # importing anything else.
 import iris.tests as tests  # isort:skip
 
+from unittest import mock
+
 import dask.array as da
 import numpy as np
 import numpy.ma as ma
@@ -103,6 +105,23 @@ class Test__regrid__linear(tests.IrisTest):
         )
         self.assertArrayEqual(result.T, result2)
 
+    def test_regrid_info_wrong_order(self):
+        regrid_info = Regridder._regrid__prepare(
+            self.x, self.y, self.target_x, self.target_y, y_first=False
+        )
+        emsg = "'regrid_info' is for a different order"
+        with self.assertRaisesRegex(ValueError, emsg):
+            regrid(
+                self.data,
+                self.x_dim,
+                self.y_dim,
+                self.x,
+                self.y,
+                self.target_x,
+                self.target_y,
+                regrid_info=regrid_info,
+            )
+
     def test_single_values(self):
         # Check that the values are sensible e.g. (3 + 4**2 == 19)
         self.assert_values(
@@ -155,6 +174,41 @@ class Test__regrid__linear(tests.IrisTest):
         expected = ma.MaskedArray(self.expected, mask=expected_mask)
         self.assertMaskedArrayEqual(result, expected)
 
+    def test_masked_varying_by_slice(self):
+        # Only the first of the two slices is masked.
+        data = ma.MaskedArray(self.data, mask=True)
+        data.mask[:, 1:30, 1:30, 0] = False
+        data.mask[..., 1] = False
+        result = regrid(
+            data,
+            self.x_dim,
+            self.y_dim,
+            self.x,
+            self.y,
+            self.target_x,
+            self.target_y,
+        )
+        # N.B. extrapolated points are masked, in both slices.
+        expected_mask = np.isnan(self.expected)
+        expected_mask[..., 0] = True
+        expected_mask[0, 1, 1, 0] = False
+        expected = ma.MaskedArray(self.expected, mask=expected_mask)
+        self.assertMaskedArrayEqual(result, expected)
+
+    def test_blocks(self):
+        # Interpolate each slice separately.
+        with mock.patch("iris.analysis._regrid._INTERPOLATION_BLOCK_BYTES", 1):
+            result = regrid(
+                self.data,
+                self.x_dim,
+                self.y_dim,
+                self.x,
+                self.y,
+                self.target_x,
+                self.target_y,
+            )
+        self.assertArrayEqual(result, self.expected)
+
     def test_simple_masked_no_mask(self):
         data = ma.MaskedArray(self.data, mask=False)
         result = regrid(
@@ -483,6 +537,52 @@ class Test___call___lazy(tests.IrisTest):
         self.assertTrue(result == expected)
 
 
+class Test___call____weights_cache(tests.IrisTest):
+    def setUp(self):
+        cube = lat_lon_cube()
+        self.src = Cube(np.arange(24.0).reshape(2, 3, 4))
+        self.src.add_dim_coord(cube.coord("latitude"), 1)
+        self.src.add_dim_coord(cube.coord("longitude"), 2)
+        self.grid = cube.copy()
+        self.grid.coord("latitude").points = [-5.0, 1.0, 20.0]
+        self.grid.coord("longitude").points = [-5.0, 3.0, 5.0, 25.0]
+        self.regridder = Regridder(self.src, self.grid, "linear", "mask")
+
+    def test_reuse(self):
+        self.assertEqual(self.regridder.cache_info(), (0, 0, 0))
+        result = self.regridder(self.src)
+        self.assertEqual(self.regridder.cache_info(), (0, 1, 1))
+        with mock.patch.object(
+            Regridder, "_regrid__prepare", side_effect=AssertionError
+        ):
+            repeat = self.regridder(self.src)
+        self.assertEqual(self.regridder.cache_info(), (1, 1, 1))
+        self.assertMaskedArrayEqual(repeat.data, result.data)
+
+    def test_reuse_sample_grid(self):
+        result = self.regridder(self.src)
+        with mock.patch.object(Regridder, "_sample_grid", side_effect=AssertionError):
+            repeat = self.regridder(self.src)
+        self.assertMaskedArrayEqual(repeat.data, result.data)
+
+    def test_transposed(self):
+        self.regridder(self.src)
+        transposed = self.src.copy()
+        transposed.transpose([0, 2, 1])
+        result = self.regridder(transposed)
+        self.assertEqual(self.regridder.cache_info(), (0, 2, 2))
+        result.transpose([0, 2, 1])
+        self.assertMaskedArrayEqual(result.data, self.regridder(self.src).data)
+
+    def test_cache_clear(self):
+        expected = self.regridder(self.src)
+        self.regridder.cache_clear()
+        self.assertEqual(self.regridder.cache_info(), (0, 0, 0))
+        self.assertIsNone(self.regridder._sample_grid_cache)
+        self.assertMaskedArrayEqual(self.regridder(self.src).data, expected.data)
+        self.assertEqual(self.regridder.cache_info(), (0, 1, 1))
+
+
 class Test___call____invalid_types(tests.IrisTest):
     def setUp(self):
         self.cube = lat_lon_cube()
@@ -0,0 +1,121 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the rolling window functions of :mod:`iris.analysis._rolling`."""
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests  # isort:skip
+
+import numpy as np
+import numpy.ma as ma
+
+from iris._lazy_data import as_lazy_data, is_lazy_data
+from iris.analysis import COUNT, MAX, MEAN, MIN, SUM
+from iris.analysis._rolling import (
+    rolling_count,
+    rolling_max,
+    rolling_mean,
+    rolling_min,
+    rolling_sum,
+)
+from iris.util import rolling_window
+
+FUNCTIONS = [
+    (rolling_sum, SUM, {}),
+    (rolling_mean, MEAN, {}),
+    (rolling_max, MAX, {}),
+    (rolling_min, MIN, {}),
+    (rolling_count, COUNT, {"function": lambda values: values > 0.5}),
+]
+
+
+class Mixin_functions:
+    # Compare each rolling function with the aggregation of the windows.
+    def check(self, data, window, axis, **kwargs):
+        for rolling_func, aggregator, func_kwargs in FUNCTIONS:
+            func_kwargs = dict(func_kwargs, **kwargs)
+            result = rolling_func(self.data(data), window, axis=axis, **func_kwargs)
+            windows = rolling_window(data, window=window, axis=axis)
+            expected = aggregator.aggregate(windows, axis=axis + 1, **func_kwargs)
+            self.assertEqual(is_lazy_data(result), self.lazy)
+            if self.lazy:
+                result = result.compute()
+            else:
+                self.assertEqual(ma.isMaskedArray(result), ma.isMaskedArray(expected))
+            self.assertEqual(result.dtype, np.asarray(expected).dtype)
+            self.assertMaskedArrayAlmostEqual(result, ma.asarray(expected))
+
+    def test_windows(self):
+        data = np.random.default_rng(0).random((4, 23))
+        for window in (1, 2, 3, 5, 8, 23):
+            self.check(data, window, axis=1)
+
+    def test_axis(self):
+        data = np.random.default_rng(0).random((11, 3, 2))
+        self.check(data, 4, axis=0)
+        self.check(data, 2, axis=1)
+
+    def test_int(self):
+        data = np.arange(20, dtype=np.int32).reshape((2, 10)) % 7
+        self.check(data, 3, axis=1)
+
+    def test_masked(self):
+        rng = np.random.default_rng(0)
+        data = ma.masked_array(rng.random((3, 17)), rng.random((3, 17)) > 0.6)
+        data[0, 2:7] = ma.masked
+        self.check(data, 4, axis=1)
+
+    def test_masked_mdtol(self):
+        rng = np.random.default_rng(0)
+        data = ma.masked_array(rng.random((3, 17)), rng.random((3, 17)) > 0.6)
+        self.check(data, 4, axis=1, mdtol=0.3)
+
+    def test_nonfinite(self):
+        data = np.array([1.0, np.nan, 3.0, 4.0, np.inf, 6.0, 7.0, 8.0, 9.0])
+        result = rolling_max(self.data(data), 3)
+        self.assertArrayEqual(
+            np.asarray(result), [np.nan, np.nan, np.inf, np.inf, np.inf, 8.0, 9.0]
+        )
+        result = rolling_sum(self.data(data), 3)
+        self.assertArrayEqual(
+            np.asarray(result), [np.nan, np.nan, np.inf, np.inf, np.inf, 21.0, 24.0]
+        )
+
+    def test_masked_nonfinite(self):
+        # As numpy.ma division, the mean masks any non-finite results.
+        data = ma.masked_array(
+            [1.0, 2.0, np.nan, 4.0, 5.0, 6.0], mask=[0, 0, 0, 0, 1, 0]
+        )
+        result = rolling_mean(self.data(data), 3)
+        if self.lazy:
+            result = result.compute()
+        expected = MEAN.aggregate(rolling_window(data, window=3), axis=1)
+        self.assertMaskedArrayEqual(
+            result, ma.masked_array([0, 0, 0, 5.0], [1, 1, 1, 0])
+        )
+        self.assertMaskedArrayEqual(result, expected)
+
+    def test_window_too_long(self):
+        with self.assertRaisesRegex(ValueError, "`window` is too long."):
+            rolling_mean(self.data(np.arange(3.0)), 4)
+
+
+class Test_real(Mixin_functions, tests.IrisTest):
+    lazy = False
+
+    def data(self, data):
+        return data
+
+
+class Test_lazy(Mixin_functions, tests.IrisTest):
+    lazy = True
+
+    def data(self, data):
+        # N.B. small chunks, shorter than most of the windows.
+        return as_lazy_data(data, chunks=(2,) * data.ndim)
+
+
+if __name__ == "__main__":
+    tests.main()
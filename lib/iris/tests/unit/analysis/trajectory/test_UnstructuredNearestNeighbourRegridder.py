@@ -11,6 +11,7 @@
 # importing anything else.
 import iris.tests as tests  # isort:skip
 
+import dask.array as da
 import numpy as np
 
 from iris.analysis.trajectory import UnstructuredNearestNeigbourRegridder as unn_gridder
@@ -265,6 +266,24 @@ class Test__call__(MixinExampleSetup, tests.IrisTest):
         )
         self.assertArrayEqual(result.data, self.expected_data_zxy)
 
+    def test_lazy_source(self):
+        # Check that lazy data stays lazy, and keeps its non-grid chunking.
+        src_z_cube = self.src_z_cube
+        src_z_cube.data = da.from_array(src_z_cube.data, chunks=(1, 2))
+        gridder = unn_gridder(self.src_cube, self.grid_cube)
+        result = gridder(src_z_cube)
+        self.assertTrue(result.has_lazy_data())
+        self.assertEqual(result.lazy_data().chunks, ((1, 1, 1), (5,), (6,)))
+        self.assertArrayEqual(result.data, self.expected_data_zxy)
+
+    def test_masked_source(self):
+        # Check that masked points are gathered with their mask.
+        self.src_cube.data = np.ma.masked_array(
+            self.src_cube.data, mask=[False, True, False, False]
+        )
+        result = self._check_expected()
+        self.assertArrayEqual(result.data.mask, self.expected_data == 1.12)
+
     def test_fail_incompatible_source(self):
         # Check that a slightly modified source cube is *not* acceptable.
         modified_src_cube = self.src_cube.copy()
@@ -0,0 +1,167 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for :func:`iris.analysis.trajectory.extract_points`."""
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests  # isort:skip
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import dask.array as da
+import numpy as np
+
+from iris._lazy_data import is_lazy_data
+import iris.analysis.trajectory
+from iris.analysis.trajectory import extract_points, interpolate
+from iris.coords import AuxCoord
+import iris.tests.stock as stock
+
+
+class TestRectilinear(tests.IrisTest):
+    def setUp(self):
+        self.cube = stock.simple_4d_with_hybrid_height()
+        self.cube.coord("grid_latitude").guess_bounds()
+        self.cube.add_cell_measure(
+            iris.coords.CellMeasure(np.ones((5, 6)), long_name="area"), (2, 3)
+        )
+        self.sample_points = [
+            ("grid_latitude", [19.0, 21.2, 23.0, 21.4]),
+            ("grid_longitude", [34.7, 30.0, 32.4, 40.0]),
+        ]
+
+    def test_matches_interpolate(self):
+        result = extract_points(self.cube, self.sample_points)
+        expected = interpolate(self.cube, self.sample_points, method="nearest")
+        self.assertEqual(result.shape, (3, 4, 4))
+        self.assertArrayEqual(result.data, expected.data)
+        for coord in expected.coords():
+            result_coord = result.coord(coord.name())
+            self.assertArrayEqual(result_coord.points, coord.points)
+            self.assertEqual(
+                result.coord_dims(result_coord), expected.coord_dims(coord)
+            )
+
+    def test_indices(self):
+        result = extract_points(self.cube, self.sample_points)
+        lats = self.cube.coord("grid_latitude")
+        lons = self.cube.coord("grid_longitude")
+        i_lats = lats.nearest_neighbour_indices(self.sample_points[0][1])
+        i_lons = lons.nearest_neighbour_indices(self.sample_points[1][1])
+        self.assertArrayEqual(result.data, self.cube.data[:, :, i_lats, i_lons])
+        self.assertArrayEqual(result.coord("grid_latitude").bounds, lats.bounds[i_lats])
+        self.assertArrayEqual(
+            result.coord("surface_altitude").points,
+            self.cube.coord("surface_altitude").points[i_lats, i_lons],
+        )
+        self.assertEqual(result.coord("altitude").shape, (4, 4))
+        self.assertEqual(result.cell_measure("area").shape, (4,))
+        self.assertEqual(result.cell_measure_dims("area"), (2,))
+
+    def test_coord_types(self):
+        result = extract_points(self.cube, self.sample_points)
+        self.assertEqual(
+            [coord.name() for coord in result.dim_coords],
+            ["time", "model_level_number"],
+        )
+        self.assertIsInstance(result.coord("grid_latitude"), AuxCoord)
+        self.assertEqual(result.metadata, self.cube.metadata)
+
+    def test_one_dimension(self):
+        result = extract_points(self.cube, [("grid_longitude", [35.0, 29.0])])
+        self.assertEqual(result.shape, (3, 4, 5, 2))
+        self.assertArrayEqual(result.data, self.cube.data[..., [5, 0]])
+
+    def test_lazy(self):
+        self.cube.data = da.from_array(self.cube.data, chunks=(1, 2, 5, 6))
+        result = extract_points(self.cube, self.sample_points)
+        self.assertTrue(result.has_lazy_data())
+        self.assertEqual(result.lazy_data().chunks, ((1, 1, 1), (2, 2), (4,)))
+        self.assertTrue(is_lazy_data(result.coord("altitude").core_points()))
+
+    def test_unequal_lengths(self):
+        sample_points = [("grid_latitude", [1.0, 2.0]), ("grid_longitude", [3.0])]
+        emsg = "same number of sample points"
+        with self.assertRaisesRegex(ValueError, emsg):
+            extract_points(self.cube, sample_points)
+
+    def test_derived_coord(self):
+        emsg = "'altitude'.*derived coordinates are not allowed"
+        with self.assertRaisesRegex(ValueError, emsg):
+            extract_points(self.cube, [("altitude", [0.0])])
+
+
+class TestMultidimensional(tests.IrisTest):
+    def setUp(self):
+        self.cube = stock.simple_3d_w_multidim_coords()
+        self.sample_points = [("foo", [-5.0, 20.0, 40.0]), ("bar", [2.0, 8.0, 2.0])]
+        iris.analysis.trajectory._KDTREE_CACHE.clear()
+        self.addCleanup(iris.analysis.trajectory._KDTREE_CACHE.clear)
+
+    def test_matches_interpolate(self):
+        result = extract_points(self.cube, self.sample_points)
+        expected = interpolate(self.cube, self.sample_points, method="nearest")
+        self.assertEqual(result.shape, (2, 3))
+        self.assertArrayEqual(result.data, expected.data)
+        for name in ("foo", "bar"):
+            self.assertArrayEqual(
+                result.coord(name).points, expected.coord(name).points
+            )
+        self.assertEqual(result.coord("foo").bounds.shape, (3, 2))
+
+    def test_kdtree_cached(self):
+        extract_points(self.cube, self.sample_points)
+        with mock.patch("iris.analysis.trajectory.cKDTree") as mock_kdtree:
+            result = extract_points(self.cube, self.sample_points)
+        mock_kdtree.assert_not_called()
+        self.assertEqual(result.shape, (2, 3))
+
+    def test_kdtree_not_reused(self):
+        extract_points(self.cube, self.sample_points)
+        self.cube.coord("foo").points = self.cube.coord("foo").points + 1
+        with mock.patch(
+            "iris.analysis.trajectory.cKDTree", wraps=iris.analysis.trajectory.cKDTree
+        ) as mock_kdtree:
+            extract_points(self.cube, self.sample_points)
+        mock_kdtree.assert_called_once()
+
+    def test_kdtree_cache_size(self):
+        self.patch("iris.analysis.trajectory._KDTREE_CACHE_SIZE", 2)
+        for offset in range(4):
+            self.cube.coord("foo").points = self.cube.coord("foo").points + offset
+            extract_points(self.cube, self.sample_points)
+        self.assertEqual(len(iris.analysis.trajectory._KDTREE_CACHE), 2)
+
+    def test_kdtree_cache_recently_used(self):
+        self.patch("iris.analysis.trajectory._KDTREE_CACHE_SIZE", 2)
+        points = self.cube.coord("foo").points
+        extract_points(self.cube, self.sample_points)
+        self.cube.coord("foo").points = points + 1
+        extract_points(self.cube, self.sample_points)
+        # Re-use the first tree, so the second is the least recently used.
+        self.cube.coord("foo").points = points
+        extract_points(self.cube, self.sample_points)
+        self.cube.coord("foo").points = points + 2
+        extract_points(self.cube, self.sample_points)
+        self.cube.coord("foo").points = points
+        with mock.patch("iris.analysis.trajectory.cKDTree") as mock_kdtree:
+            extract_points(self.cube, self.sample_points)
+        mock_kdtree.assert_not_called()
+
+    def test_kdtree_cache_threads(self):
+        def extract(offset):
+            cube = self.cube.copy()
+            cube.coord("foo").points = cube.coord("foo").points + offset % 6
+            return extract_points(cube, self.sample_points)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(extract, range(24)))
+        self.assertEqual(len(results), 24)
+        self.assertEqual(len(iris.analysis.trajectory._KDTREE_CACHE), 4)
+
+
+if __name__ == "__main__":
+    tests.main()
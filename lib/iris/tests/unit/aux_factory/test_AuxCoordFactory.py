@@ -10,12 +10,14 @@ import iris.tests as tests  # isort:skip
 
 from unittest import mock
 
+import dask.array as da
 import numpy as np
 
 import iris
 from iris._lazy_data import as_lazy_data, is_lazy_data
-from iris.aux_factory import AuxCoordFactory
+from iris.aux_factory import AuxCoordFactory, HybridHeightFactory
 from iris.coords import AuxCoord
+from iris.cube import Cube
 
 
 class Test__nd_points(tests.IrisTest):
@@ -135,6 +137,68 @@ class Test__nd_bounds(tests.IrisTest):
         self.assertArrayEqual(result, expected)
 
 
+class Test__make_coord_chunked(tests.IrisTest):
+    def setUp(self):
+        nz, ny, nx = 4, 6, 8
+        delta_bounds = np.stack([np.arange(nz) - 0.5, np.arange(nz) + 0.5], axis=-1)
+        self.delta = AuxCoord(np.arange(nz) * 1.0, bounds=delta_bounds, units="m")
+        self.sigma = AuxCoord(
+            np.linspace(1, 0, nz), bounds=delta_bounds / nz, long_name="sigma"
+        )
+        self.orography = AuxCoord(
+            np.arange(ny * nx * 1.0).reshape(ny, nx), long_name="orography", units="m"
+        )
+        self.factory = HybridHeightFactory(self.delta, self.sigma, self.orography)
+        # The cube has a time dim, and its level dim is 1.
+        dims = {id(self.delta): (1,), id(self.sigma): (1,), id(self.orography): (2, 3)}
+        self.coord_dims_func = lambda coord: dims[id(coord)]
+        self.chunks = ((1, 1), (2, 2), (3, 3), (8,))
+
+    def test_chunks(self):
+        coord = self.factory._make_coord_chunked(self.coord_dims_func, self.chunks)
+        self.assertEqual(coord.lazy_points().chunks, ((2, 2), (3, 3), (8,)))
+        self.assertEqual(coord.lazy_bounds().chunks, ((2, 2), (3, 3), (8,), (2,)))
+
+    def test_values(self):
+        coord = self.factory._make_coord_chunked(self.coord_dims_func, self.chunks)
+        expected = self.factory.make_coord(self.coord_dims_func)
+        self.assertEqual(coord, expected)
+
+    def test_no_chunks(self):
+        coord = self.factory._make_coord_chunked(self.coord_dims_func, None)
+        self.assertEqual(coord.lazy_points().chunks, ((4,), (6,), (8,)))
+
+    def test_make_coord(self):
+        coord = self.factory.make_coord(self.coord_dims_func, chunks=self.chunks)
+        self.assertEqual(coord.lazy_points().chunks, ((2, 2), (3, 3), (8,)))
+        # The chunks only apply to the coord they are given for.
+        coord = self.factory.make_coord(self.coord_dims_func)
+        self.assertEqual(coord.lazy_points().chunks, ((4,), (6,), (8,)))
+
+    def test_no_chunks_argument(self):
+        # Factories without a 'chunks' argument make their coord as usual.
+        class Factory(HybridHeightFactory):
+            def make_coord(self, coord_dims_func):
+                return super().make_coord(coord_dims_func)
+
+        factory = Factory(self.delta, self.sigma, self.orography)
+        coord = factory._make_coord_chunked(self.coord_dims_func, self.chunks)
+        self.assertEqual(coord.lazy_points().chunks, ((4,), (6,), (8,)))
+
+    def test_cube(self):
+        cube = Cube(da.zeros((2, 4, 6, 8), chunks=(1, 2, 3, 8)))
+        cube.add_aux_coord(self.delta, 1)
+        cube.add_aux_coord(self.sigma, 1)
+        cube.add_aux_coord(self.orography, (2, 3))
+        cube.add_aux_factory(self.factory)
+        coord = cube.coord("altitude")
+        self.assertEqual(coord.lazy_points().chunks, ((2, 2), (3, 3), (8,)))
+        # Real cube data has no chunks to match.
+        cube.data = np.zeros(cube.shape)
+        coord = cube.coord("altitude")
+        self.assertEqual(coord.lazy_points().chunks, ((4,), (6,), (8,)))
+
+
 @tests.skip_data
 class Test_lazy_aux_coords(tests.IrisTest):
     def setUp(self):
@@ -9,6 +9,7 @@
 import iris.tests as tests  # isort:skip
 
 from collections import OrderedDict
+from copy import copy
 import unittest.mock as mock
 from unittest.mock import sentinel
 
@@ -100,16 +101,17 @@ class Test___eq__(tests.IrisTest):
 
     def test_lenient(self):
         return_value = sentinel.return_value
+        other = self.cls(**self.kwargs)
         with mock.patch("iris.common.metadata._LENIENT", return_value=True) as mlenient:
             with mock.patch.object(
                 self.cls, "_compare_lenient", return_value=return_value
             ) as mcompare:
-                result = self.metadata.__eq__(self.metadata)
+                result = self.metadata.__eq__(other)
 
         self.assertEqual(return_value, result)
         self.assertEqual(1, mcompare.call_count)
         (arg,), kwargs = mcompare.call_args
-        self.assertEqual(id(self.metadata), id(arg))
+        self.assertEqual(id(other), id(arg))
         self.assertEqual(dict(), kwargs)
 
         self.assertEqual(1, mlenient.call_count)
@@ -117,6 +119,11 @@ class Test___eq__(tests.IrisTest):
         self.assertEqual(_qualname(self.cls.__eq__), _qualname(arg))
         self.assertEqual(dict(), kwargs)
 
+    def test_same_instance(self):
+        with mock.patch("iris.common.metadata._LENIENT") as mlenient:
+            self.assertTrue(self.metadata.__eq__(self.metadata))
+        self.assertEqual(0, mlenient.call_count)
+
     def test_strict_same(self):
         self.assertTrue(self.metadata.__eq__(self.metadata))
         other = self.cls(**self.kwargs)
@@ -797,6 +804,27 @@ class Test__compare_strict_attributes(tests.IrisTest):
         self.assertFalse(self.metadata._compare_strict_attributes(left, right))
         self.assertFalse(self.metadata._compare_strict_attributes(right, left))
 
+    def test_same_values(self):
+        left = self.values.copy()
+        right = {key: copy(value) for key, value in left.items()}
+
+        self.assertTrue(self.metadata._compare_strict_attributes(left, right))
+        self.assertTrue(self.metadata._compare_strict_attributes(right, left))
+
+    def test_different_types(self):
+        left = dict(one=1, two="2")
+        right = dict(one=1.0, two="2")
+
+        self.assertFalse(self.metadata._compare_strict_attributes(left, right))
+        self.assertFalse(self.metadata._compare_strict_attributes(right, left))
+
+    def test_same_objects_not_hashed(self):
+        left = self.values.copy()
+        right = self.values.copy()
+        with mock.patch("iris.common.metadata.hexdigest") as mhexdigest:
+            self.assertTrue(self.metadata._compare_strict_attributes(left, right))
+        self.assertEqual(0, mhexdigest.call_count)
+
 
 class Test__difference(tests.IrisTest):
     def setUp(self):
@@ -1298,8 +1326,9 @@ class Test_combine(tests.IrisTest):
         with mock.patch.object(
             self.cls, "_combine", return_value=return_value
         ) as mcombine:
-            with mock.patch.object(_LENIENT, "context") as mcontext:
-                result = self.metadata.combine(self.metadata, lenient=False)
+            with mock.patch.dict(_LENIENT.__dict__, active="client"):
+                with mock.patch.object(_LENIENT, "context") as mcontext:
+                    result = self.metadata.combine(self.metadata, lenient=False)
 
         self.assertEqual(1, mcontext.call_count)
         args, kwargs = mcontext.call_args
@@ -1312,6 +1341,18 @@ class Test_combine(tests.IrisTest):
         self.assertEqual(id(self.metadata), id(arg))
         self.assertEqual(dict(), kwargs)
 
+    def test_lenient_false__no_active_client(self):
+        return_value = self.mock_kwargs.values()
+        with mock.patch.object(
+            self.cls, "_combine", return_value=return_value
+        ) as mcombine:
+            with mock.patch.object(_LENIENT, "context") as mcontext:
+                result = self.metadata.combine(self.metadata, lenient=False)
+
+        self.assertEqual(0, mcontext.call_count)
+        self.assertEqual(self.mock_kwargs, result._asdict())
+        self.assertEqual(1, mcombine.call_count)
+
 
 class Test_difference(tests.IrisTest):
     def setUp(self):
@@ -1386,8 +1427,9 @@ class Test_difference(tests.IrisTest):
         with mock.patch.object(
             self.cls, "_difference", return_value=return_value
         ) as mdifference:
-            with mock.patch.object(_LENIENT, "context") as mcontext:
-                result = self.metadata.difference(self.metadata, lenient=False)
+            with mock.patch.dict(_LENIENT.__dict__, active="client"):
+                with mock.patch.object(_LENIENT, "context") as mcontext:
+                    result = self.metadata.difference(self.metadata, lenient=False)
 
         self.assertEqual(mcontext.call_count, 1)
         args, kwargs = mcontext.call_args
@@ -1400,6 +1442,18 @@ class Test_difference(tests.IrisTest):
         self.assertEqual(id(self.metadata), id(arg))
         self.assertEqual(dict(), kwargs)
 
+    def test_lenient_false__no_active_client(self):
+        return_value = self.mock_kwargs.values()
+        with mock.patch.object(
+            self.cls, "_difference", return_value=return_value
+        ) as mdifference:
+            with mock.patch.object(_LENIENT, "context") as mcontext:
+                result = self.metadata.difference(self.metadata, lenient=False)
+
+        self.assertEqual(0, mcontext.call_count)
+        self.assertEqual(self.mock_kwargs, result._asdict())
+        self.assertEqual(1, mdifference.call_count)
+
 
 class Test_equal(tests.IrisTest):
     def setUp(self):
@@ -1465,8 +1519,9 @@ class Test_equal(tests.IrisTest):
         with mock.patch.object(
             self.cls, "__eq__", return_value=return_value
         ) as m__eq__:
-            with mock.patch.object(_LENIENT, "context") as mcontext:
-                result = self.metadata.equal(self.metadata, lenient=False)
+            with mock.patch.dict(_LENIENT.__dict__, active="client"):
+                with mock.patch.object(_LENIENT, "context") as mcontext:
+                    result = self.metadata.equal(self.metadata, lenient=False)
 
         self.assertEqual(1, mcontext.call_count)
         args, kwargs = mcontext.call_args
@@ -1479,6 +1534,18 @@ class Test_equal(tests.IrisTest):
         self.assertEqual(id(self.metadata), id(arg))
         self.assertEqual(dict(), kwargs)
 
+    def test_lenient_false__no_active_client(self):
+        return_value = sentinel.return_value
+        with mock.patch.object(
+            self.cls, "__eq__", return_value=return_value
+        ) as m__eq__:
+            with mock.patch.object(_LENIENT, "context") as mcontext:
+                result = self.metadata.equal(self.metadata, lenient=False)
+
+        self.assertEqual(0, mcontext.call_count)
+        self.assertEqual(return_value, result)
+        self.assertEqual(1, m__eq__.call_count)
+
 
 class Test_name(tests.IrisTest):
     def setUp(self):
@@ -0,0 +1,133 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the :func:`iris.common.resolve._resolve`."""
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests  # isort:skip
+
+import gc
+import unittest.mock as mock
+import weakref
+
+import numpy as np
+
+from iris._lazy_data import as_lazy_data
+import iris.common.resolve
+from iris.common.resolve import Resolve, _resolve
+from iris.coords import AuxCoord, DimCoord
+from iris.cube import Cube
+
+
+def _cube(time=None, latitude=None):
+    cube = Cube(np.arange(12.0).reshape(3, 4), standard_name="air_temperature")
+    if latitude is None:
+        latitude = [-45.0, 0, 45]
+    cube.add_dim_coord(DimCoord(latitude, standard_name="latitude"), 0)
+    longitude = DimCoord([0.0, 90, 180, 270], standard_name="longitude")
+    cube.add_dim_coord(longitude, 1)
+    if time is not None:
+        cube.add_aux_coord(
+            DimCoord(time, standard_name="time", units="days since 1970-01-01")
+        )
+        cube.add_aux_coord(AuxCoord(time, long_name="day"))
+    return cube
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        patch = mock.patch.dict(iris.common.resolve._RESOLVE_CACHE, clear=True)
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.m_resolve = self.patch("iris.common.resolve.Resolve", wraps=Resolve)
+        self.rhs = _cube()
+
+    def _check(self, lhs, rhs):
+        # Check the cached resolve matches a new one.
+        resolver = _resolve(lhs, rhs)
+        expected = Resolve(lhs, rhs)
+        self.assertIs(resolver.lhs_cube, lhs)
+        self.assertIs(resolver.rhs_cube, rhs)
+        self.assertEqual(resolver.lhs_cube_resolved, expected.lhs_cube_resolved)
+        self.assertEqual(resolver.rhs_cube_resolved, expected.rhs_cube_resolved)
+        data = np.zeros(expected.shape)
+        self.assertEqual(resolver.cube(data), expected.cube(data))
+        return resolver
+
+    def test_reuse(self):
+        self._check(_cube(time=[1]), self.rhs)
+        self.assertEqual(self.m_resolve.call_count, 1)
+        # Only the values of the local coordinates differ.
+        result = self._check(_cube(time=[2]), self.rhs)
+        self.assertEqual(self.m_resolve.call_count, 1)
+        self.assertEqual(result.cube(np.zeros((3, 4))).coord("day").points, [2])
+
+    def test_operands_released(self):
+        lhs, rhs = _cube(time=[1]), _cube()
+        _resolve(lhs, rhs)
+        refs = [weakref.ref(lhs), weakref.ref(rhs)]
+        # N.B. the mock also references the operands, through its call args.
+        self.m_resolve.reset_mock()
+        del lhs, rhs
+        gc.collect()
+        self.assertEqual(len(iris.common.resolve._RESOLVE_CACHE), 1)
+        self.assertEqual([ref() for ref in refs], [None, None])
+
+    def test_coords_released(self):
+        lhs, rhs = _cube(time=[1]), _cube()
+        coords = lhs.coords() + rhs.coords()
+        result = _resolve(lhs, rhs).cube(np.zeros((3, 4)))
+        refs = [weakref.ref(coord) for coord in coords]
+        self.m_resolve.reset_mock()
+        del lhs, rhs, coords, result
+        gc.collect()
+        self.assertEqual(len(iris.common.resolve._RESOLVE_CACHE), 1)
+        self.assertEqual([ref() for ref in refs], [None] * len(refs))
+
+    def test_own_values(self):
+        lhs = _cube(time=[1])
+        _resolve(lhs, self.rhs).cube(np.zeros((3, 4)))
+        result = _resolve(lhs, self.rhs).cube(np.zeros((3, 4)))
+        result.coord("day").points[0] = 99
+        result = _resolve(lhs, self.rhs).cube(np.zeros((3, 4)))
+        self.assertEqual(result.coord("day").points, [1])
+        self.assertEqual(lhs.coord("day").points, [1])
+
+    def test_common_values_differ(self):
+        self._check(_cube(time=[1]), self.rhs)
+        lhs = _cube(time=[1], latitude=[-40.0, 0, 45])
+        emsg = "Coordinate 'latitude' has different points"
+        with self.assertRaisesRegex(ValueError, emsg):
+            _resolve(lhs, self.rhs)
+        self.assertEqual(self.m_resolve.call_count, 2)
+
+    def test_metadata_differs(self):
+        self._check(_cube(time=[1]), self.rhs)
+        lhs = _cube(time=[1])
+        lhs.coord("longitude").circular = True
+        self._check(lhs, self.rhs)
+        self.assertEqual(self.m_resolve.call_count, 2)
+
+    def test_structure_differs(self):
+        self._check(_cube(time=[1]), self.rhs)
+        self._check(_cube(), self.rhs)
+        self.assertEqual(self.m_resolve.call_count, 2)
+
+    def test_lazy_coord(self):
+        lhs = _cube(time=[1])
+        lhs.coord("day").points = as_lazy_data(np.array([1]))
+        _resolve(lhs, self.rhs)
+        self.assertEqual(iris.common.resolve._RESOLVE_CACHE, {})
+
+    def test_size(self):
+        self.patch("iris.common.resolve._RESOLVE_CACHE_SIZE", 2)
+        for n_lons in range(2, 6):
+            lhs = _cube()[:, :n_lons]
+            _resolve(lhs, lhs)
+        self.assertEqual(len(iris.common.resolve._RESOLVE_CACHE), 2)
+
+
+if __name__ == "__main__":
+    tests.main()
@@ -44,6 +44,8 @@ class Test_nearest_neighbour_index__ascending(tests.IrisTest):
         self.coord.circular = circular
         results = [self.coord.nearest_neighbour_index(ind) for ind in ext_pnts]
         self.assertEqual(results, target)
+        results = self.coord.nearest_neighbour_indices(ext_pnts)
+        self.assertArrayEqual(results, target)
 
     def test_nobounds(self):
         target = [0, 0, 1, 3, 3]
@@ -95,6 +97,8 @@ class Test_nearest_neighbour_index__descending(tests.IrisTest):
         self.coord.circular = circular
         results = [self.coord.nearest_neighbour_index(ind) for ind in ext_pnts]
         self.assertEqual(results, target)
+        results = self.coord.nearest_neighbour_indices(ext_pnts)
+        self.assertArrayEqual(results, target)
 
     def test_nobounds(self):
         target = [3, 3, 2, 0, 0]
@@ -113,6 +117,63 @@ class Test_nearest_neighbour_index__descending(tests.IrisTest):
         self._test_nearest_neighbour_index(target, bounds=True, circular=True)
 
 
+class Test_nearest_neighbour_indices(tests.IrisTest):
+    def setUp(self):
+        self.coord = DimCoord([0.0, 90.0, 180.0, 270.0], units="degrees")
+
+    def test_shape(self):
+        result = self.coord.nearest_neighbour_indices([[-10, 100], [200, 300]])
+        self.assertArrayEqual(result, [[0, 1], [2, 3]])
+
+    def test_scalar(self):
+        result = self.coord.nearest_neighbour_indices(100)
+        self.assertEqual(result.shape, ())
+        self.assertEqual(result, 1)
+
+    def test_unsorted_repeated_points(self):
+        coord = AuxCoord([5, 1, 3, 1, 5, 3])
+        result = coord.nearest_neighbour_indices([0, 1, 2, 3.5, 4, 6])
+        self.assertArrayEqual(result, [1, 1, 1, 2, 0, 0])
+
+    def test_bounded_unsorted(self):
+        coord = AuxCoord([5, 1, 3], bounds=[[4, 6], [0, 2], [2, 4]])
+        result = coord.nearest_neighbour_indices([-1, 1, 2, 3, 4, 7])
+        self.assertArrayEqual(result, [1, 1, 1, 2, 2, 0])
+
+    def test_nan(self):
+        with self.assertRaises(IndexError):
+            self.coord.nearest_neighbour_indices([0, np.nan])
+
+    def test_not_number(self):
+        emsg = "Cannot find the nearest neighbour to 'a' in 'unknown' values."
+        with self.assertRaisesRegex(TypeError, emsg):
+            self.coord.nearest_neighbour_index("a")
+
+    def test_plan_cached(self):
+        plan = self.coord._nearest_neighbour_plan()
+        self.coord.nearest_neighbour_indices([0, 100])
+        self.assertIs(self.coord._nearest_neighbour_plan(), plan)
+        self.coord.points = [0.0, 90.0, 180.0, 280.0]
+        self.assertIsNot(self.coord._nearest_neighbour_plan(), plan)
+
+    def test_plan_not_cached_writeable(self):
+        coord = AuxCoord([0.0, 90.0, 180.0, 270.0])
+        self.assertIsNot(
+            coord._nearest_neighbour_plan(), coord._nearest_neighbour_plan()
+        )
+        coord.points[0] = 100
+        self.assertEqual(coord.nearest_neighbour_index(110), 0)
+
+    def test_plan_not_cached_writeable_base(self):
+        # The read-only coordinates of a cube view share writeable arrays.
+        cube = Cube(np.zeros(4))
+        cube.add_aux_coord(AuxCoord([0.0, 90.0, 180.0, 270.0], long_name="x"), 0)
+        coord = cube.view().coord("x")
+        self.assertEqual(coord.nearest_neighbour_index(110), 1)
+        cube.coord("x").points[0] = 100
+        self.assertEqual(coord.nearest_neighbour_index(110), 0)
+
+
 class Test_guess_bounds(tests.IrisTest):
     def setUp(self):
         self.coord = DimCoord(
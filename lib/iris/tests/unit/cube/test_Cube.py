@@ -934,6 +934,19 @@ class Test_rolling_window(tests.IrisTest):
         )
         self.assertMaskedArrayEqual(expected_result, res_cube.data)
 
+    def test_rolling_func(self):
+        # Aggregate the windows with the SUM rolling window function, in chunks
+        # shorter than the window.
+        self.cube.data = da.arange(6, chunks=2)
+        with mock.patch(
+            "iris.analysis.SUM.rolling_func",
+            wraps=iris.analysis.SUM.rolling_func,
+        ) as rolling_func:
+            res_cube = self.cube.rolling_window("val", iris.analysis.SUM, 3)
+        rolling_func.assert_called_once()
+        self.assertTrue(res_cube.has_lazy_data())
+        self.assertArrayEqual(res_cube.data, [3, 6, 9, 12])
+
     def test_ancillary_variables_and_cell_measures_kept(self):
         res_cube = self.multi_dim_cube.rolling_window("val", self.mock_agg, 3)
         self.assertEqual(res_cube.ancillary_variables(), [self.ancillary_variable])
@@ -1048,6 +1061,48 @@ class Test_slices_dim_order(tests.IrisTest):
             self.check_order(*perm)
 
 
+class Test_slices__indexing(tests.IrisTest):
+    # Check that the slices are the same as indexing the cube.
+    def _check_slices(self, cube, ref_to_slice, expected_keys, transpose=None):
+        result = list(cube.slices(ref_to_slice))
+        expected = [cube[keys] for keys in expected_keys]
+        if transpose is not None:
+            for expected_cube in expected:
+                expected_cube.transpose(transpose)
+        self.assertEqual(result, expected)
+        for result_cube, expected_cube in zip(result, expected):
+            self.assertEqual(
+                [coord.name() for coord in result_cube.coords()],
+                [coord.name() for coord in expected_cube.coords()],
+            )
+
+    def test_aux_factory(self):
+        cube = stock.simple_4d_with_hybrid_height()
+        keys = [(i, j) for i in range(3) for j in range(4)]
+        self._check_slices(cube, [2, 3], keys)
+        for result_cube in cube.slices([2, 3]):
+            self.assertIsNotNone(result_cube.aux_factory("altitude"))
+
+    def test_transposed(self):
+        cube = stock.simple_4d_with_hybrid_height()
+        keys = [(i, j) for i in range(3) for j in range(4)]
+        self._check_slices(cube, [3, 2], keys, transpose=[1, 0])
+
+    def test_mesh_dim(self):
+        # The MeshCoords become scalar AuxCoords.
+        cube = sample_mesh_cube()
+        keys = [(slice(None), i) for i in range(cube.shape[1])]
+        self._check_slices(cube, [0], keys)
+        self.assertIsNone(next(cube.slices([0])).mesh)
+
+    def test_cell_measures_and_ancillary_variables(self):
+        cube = stock.simple_3d()
+        cube.add_cell_measure(CellMeasure(np.ones((3, 4)), long_name="area"), (1, 2))
+        cube.add_ancillary_variable(AncillaryVariable([1, 2], long_name="flag"), 0)
+        keys = [(slice(None), i, j) for i in range(3) for j in range(4)]
+        self._check_slices(cube, [0], keys)
+
+
 @tests.skip_data
 class Test_slices_over(tests.IrisTest):
     def setUp(self):
@@ -1079,6 +1134,14 @@ class Test_slices_over(tests.IrisTest):
         with self.assertRaises(CoordinateNotFoundError):
             _ = self.cube.slices_over("wibble")
 
+    def test_1d_slice_no_copy(self):
+        res = self.cube.slices_over("model_level_number", copy=False)
+        for i, res_cube in zip(self.exp_iter_1d, res):
+            expected = self.cube[:, i]
+            self.assertEqual(res_cube, expected)
+            self.assertTrue(np.shares_memory(res_cube.data, self.cube.data))
+            self.assertFalse(res_cube.data.flags.writeable)
+
     def test_1d_slice_dimension_given(self):
         res = self.cube.slices_over(1)
         for i, res_cube in zip(self.exp_iter_1d, res):
@@ -1900,6 +1963,19 @@ class Test_interpolate(tests.IrisTest):
         self.assertIs(result, mock.sentinel.RESULT)
 
 
+class Test_extract_points(tests.IrisTest):
+    def test_api(self):
+        cube = stock.simple_2d()
+        sample_points = (("foo", [0.5]), ("bar", [0.6]))
+        with mock.patch(
+            "iris.analysis.trajectory.extract_points",
+            return_value=mock.sentinel.RESULT,
+        ) as mock_extract:
+            result = cube.extract_points(sample_points)
+        mock_extract.assert_called_once_with(cube, sample_points)
+        self.assertIs(result, mock.sentinel.RESULT)
+
+
 class Test_regrid(tests.IrisTest):
     def test(self):
         # Test that Cube.regrid() just defers to the regridder of the
@@ -1982,6 +2058,63 @@ class Test_copy(tests.IrisTest):
         self._check_copy(cube, cube.copy())
 
 
+class Test_view(tests.IrisTest):
+    def setUp(self):
+        self.cube = stock.simple_3d()
+
+    def _check_shared(self, view, cube):
+        self.assertTrue(np.shares_memory(view.data, cube.data))
+        self.assertFalse(view.data.flags.writeable)
+        for coord in view.coords(dim_coords=True):
+            self.assertFalse(coord.points.flags.writeable)
+
+    def test(self):
+        view = self.cube.view()
+        self.assertIsNot(view, self.cube)
+        self.assertEqual(view, self.cube)
+        self._check_shared(view, self.cube)
+
+    def test_keys(self):
+        keys = (slice(None, None, -1), 1)
+        view = self.cube.view(keys)
+        self.assertEqual(view, self.cube[keys])
+        self._check_shared(view, self.cube)
+
+    def test_read_only(self):
+        view = self.cube.view()
+        with self.assertRaisesRegex(ValueError, "read-only"):
+            view.data[0, 0, 0] = 99
+        # Replacing the data entirely does not affect the original.
+        view.data = np.zeros(view.shape)
+        self.assertArrayEqual(self.cube.data, stock.simple_3d().data)
+
+    def test_copy_writeable(self):
+        copy = self.cube.view().copy()
+        self.assertFalse(np.shares_memory(copy.data, self.cube.data))
+        copy.data[0, 0, 0] = 99
+        self.assertEqual(self.cube.data[0, 0, 0], 0)
+
+    def test_masked(self):
+        cube = Cube(ma.masked_array([0, 1, 2], mask=[True, False, False]))
+        view = cube.view(slice(1, None))
+        self.assertMaskedArrayEqual(view.data, cube.data[1:])
+        self.assertTrue(np.shares_memory(view.data.data, cube.data.data))
+        self.assertFalse(view.data.flags.writeable)
+
+    def test_lazy(self):
+        cube = Cube(as_lazy_data(np.arange(4)))
+        view = cube.view(slice(1, 3))
+        self.assertTrue(view.has_lazy_data())
+        self.assertArrayEqual(view.data, [1, 2])
+
+    def test_slices(self):
+        expected = list(self.cube.slices_over(0))
+        result = list(self.cube.slices_over(0, copy=False))
+        self.assertEqual(result, expected)
+        for view in result:
+            self._check_shared(view, self.cube)
+
+
 def _add_test_meshcube(self, nomesh=False, n_z=2, **meshcoord_kwargs):
     """Common setup action : Create a standard mesh test cube with a variety of coords, and save the cube and various of
     its components as properties of the 'self' TestCase.
@@ -672,7 +672,20 @@ class TestRealiseData(tests.IrisTest):
         call_patch = self.patch("iris._lazy_data.co_realise_cubes")
         test_cubelist.realise_data()
         # Check it was called once, passing cubes as *args.
-        self.assertEqual(call_patch.call_args_list, [mock.call(*mock_cubes_list)])
+        self.assertEqual(
+            call_patch.call_args_list,
+            [mock.call(*mock_cubes_list, metadata=False, max_bytes=None)],
+        )
+
+    def test_realise_data__options(self):
+        mock_cubes_list = [mock.Mock(ident=count) for count in range(3)]
+        test_cubelist = CubeList(mock_cubes_list)
+        call_patch = self.patch("iris._lazy_data.co_realise_cubes")
+        test_cubelist.realise_data(metadata=True, max_bytes=100)
+        self.assertEqual(
+            call_patch.call_args_list,
+            [mock.call(*mock_cubes_list, metadata=True, max_bytes=100)],
+        )
 
 
 class Test_CubeList_copy(tests.IrisTest):
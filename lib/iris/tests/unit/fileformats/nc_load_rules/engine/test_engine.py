@@ -4,9 +4,18 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Unit tests for the :mod:`iris.fileformats._nc_load_rules.engine` module."""
 
+import os
+import tempfile
 from unittest import mock
 
+import numpy as np
+
+import iris
+from iris.coords import AuxCoord, DimCoord
+from iris.cube import Cube, CubeList
+from iris.fileformats._nc_load_rules import engine as engine_module
 from iris.fileformats._nc_load_rules.engine import Engine, FactEntity
+from iris.fileformats.netcdf.loader import CHUNK_CONTROL, load_cubes
 import iris.tests as tests
 
 
@@ -89,5 +98,58 @@ class Test_Engine(tests.IrisTest):
         self.assertEqual(self.empty_engine.fact_list("odd-unknown"), [])
 
 
+class Test_activate__build_plans(tests.IrisTest):
+    def setUp(self):
+        handle, self.filename = tempfile.mkstemp(".nc")
+        os.close(handle)
+        self.addCleanup(os.remove, self.filename)
+        cubes = CubeList()
+        for name in ("a", "b", "c"):
+            cube = Cube(np.zeros((30, 40)), var_name=name, units="K")
+            cube.add_dim_coord(DimCoord(np.arange(30.0), var_name="y"), 0)
+            cube.add_dim_coord(DimCoord(np.arange(40.0), var_name="x"), 1)
+            cube.add_aux_coord(AuxCoord(np.ones((30, 40)), var_name="aux"), (0, 1))
+            cubes.append(cube)
+        # A different dimension order.
+        cubes.append(cubes[0].copy())
+        cubes[-1].var_name = "d"
+        cubes[-1].transpose()
+        with iris.FUTURE.context(save_split_attrs=True):
+            iris.save(cubes, self.filename)
+        self.run_call = self.patch(
+            "iris.fileformats._nc_load_rules.engine.run_actions",
+            wraps=engine_module.run_actions,
+        )
+
+    def _load(self):
+        return {cube.var_name: cube for cube in load_cubes(self.filename)}
+
+    def test_reuse(self):
+        cubes = self._load()
+        # Run in full once for each structure.
+        self.assertEqual(self.run_call.call_count, 2)
+        self.patch(
+            "iris.fileformats._nc_load_rules.engine.Engine._build_plan_key",
+            return_value=None,
+        )
+        self.assertEqual(cubes, self._load())
+
+    def test_copies(self):
+        cubes = self._load()
+        cube_a, cube_b = cubes["a"], cubes["b"]
+        self.assertIsNot(cube_a.coord("y"), cube_b.coord("y"))
+        cube_a.coord("y").points = np.arange(30.0) + 1
+        self.assertArrayEqual(cube_b.coord("y").points, np.arange(30.0))
+
+    def test_chunk_control(self):
+        with CHUNK_CONTROL.set("b", y=1):
+            cubes = self._load()
+        self.assertEqual(self.run_call.call_count, 3)
+        self.assertEqual(cubes["a"].coord("aux").core_points().chunks, ((30,), (40,)))
+        self.assertEqual(
+            cubes["b"].coord("aux").core_points().chunks, ((1,) * 30, (40,))
+        )
+
+
 if __name__ == "__main__":
     tests.main()
@@ -223,5 +223,41 @@ def test_pinned_optimisation(tmp_filepath, save_cubelist_with_sigma):
     assert sigma.lazy_bounds().chunksize == (2, 2)
 
 
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [
+        ("timeseries", (3, 4, 2, 1)),
+        ("spatial", (1, 1, 5, 6)),
+        ("balanced", (1, 2, 2, 3)),
+    ],
+)
+def test_access(tmp_filepath, save_cubelist_with_sigma, pattern, expected):
+    cube_varname, _ = save_cubelist_with_sigma
+    with dask.config.set({"array.chunk-size": "250B"}):
+        with CHUNK_CONTROL.access(pattern):
+            cubes = CubeList(loader.load_cubes(tmp_filepath))
+            cube = cubes.extract_cube(cube_varname)
+    assert CHUNK_CONTROL.access_pattern is None
+    assert cube.shape == (3, 4, 5, 6)
+    # uses known good output
+    assert cube.lazy_data().chunksize == expected
+
+
+def test_access_with_set(tmp_filepath, save_cubelist_with_sigma):
+    cube_varname, _ = save_cubelist_with_sigma
+    with dask.config.set({"array.chunk-size": "250B"}):
+        with CHUNK_CONTROL.access("timeseries"), CHUNK_CONTROL.set(time=2):
+            cubes = CubeList(loader.load_cubes(tmp_filepath))
+            cube = cubes.extract_cube(cube_varname)
+    assert cube.lazy_data().chunksize[0] == 2
+
+
+def test_invalid_access():
+    with pytest.raises(ValueError, match="'pattern' should be one of"):
+        with CHUNK_CONTROL.access("random"):
+            pass
+    assert CHUNK_CONTROL.access_pattern is None
+
+
 if __name__ == "__main__":
     tests.main()
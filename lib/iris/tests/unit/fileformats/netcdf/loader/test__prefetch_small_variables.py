@@ -0,0 +1,112 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the `iris.fileformats.netcdf.loader._prefetch_small_variables` function."""
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests  # isort:skip
+
+import os
+import tempfile
+
+import numpy as np
+
+import iris
+from iris.coords import AuxCoord, DimCoord
+from iris.cube import Cube, CubeList
+from iris.fileformats.cf import CFReader
+from iris.fileformats.netcdf import _thread_safe_nc
+from iris.fileformats.netcdf.loader import _prefetch_small_variables, load_cubes
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        handle, self.filename = tempfile.mkstemp(".nc")
+        os.close(handle)
+        self.addCleanup(os.remove, self.filename)
+        cubes = CubeList()
+        for name, shape in [("small", (3, 4)), ("large", (30, 40))]:
+            cube = Cube(np.ones(shape), var_name=name)
+            cube.add_dim_coord(DimCoord(np.arange(shape[0]), var_name=f"y_{name}"), 0)
+            cube.add_dim_coord(DimCoord(np.arange(shape[1]), var_name=f"x_{name}"), 1)
+            cube.add_aux_coord(
+                AuxCoord([1.0], bounds=[[0.0, 2.0]], var_name=f"scalar_{name}")
+            )
+            cubes.append(cube)
+        with iris.FUTURE.context(save_split_attrs=True):
+            iris.save(cubes, self.filename)
+        self.m_read = self.patch(
+            "iris.fileformats.netcdf._thread_safe_nc.read_variables",
+            wraps=_thread_safe_nc.read_variables,
+        )
+
+    def _prefetched(self, cf):
+        return {
+            name
+            for name, cf_var in cf.cf_group.items()
+            if cf_var._prefetched_data is not None
+        }
+
+    def test_prefetch(self):
+        with CFReader(self.filename) as cf:
+            _prefetch_small_variables(cf, cf.cf_group.data_variables.values())
+            expected = {
+                "small",
+                "y_small",
+                "x_small",
+                "scalar_small",
+                "scalar_small_bnds",
+                "y_large",
+                "x_large",
+                "scalar_large",
+                "scalar_large_bnds",
+            }
+            self.assertEqual(self._prefetched(cf), expected)
+            self.assertArrayEqual(cf.cf_group["scalar_large_bnds"][:], [0.0, 2.0])
+        self.m_read.assert_called_once()
+
+    def test_selected(self):
+        with CFReader(self.filename) as cf:
+            _prefetch_small_variables(cf, [cf.cf_group["large"]])
+            expected = {"y_large", "x_large", "scalar_large", "scalar_large_bnds"}
+            self.assertEqual(self._prefetched(cf), expected)
+
+    def test_copy(self):
+        with CFReader(self.filename) as cf:
+            _prefetch_small_variables(cf, [cf.cf_group["small"]])
+            cf_var = cf.cf_group["y_small"]
+            data = cf_var[:]
+            data[0] = 99
+            self.assertArrayEqual(cf_var[:], [0, 1, 2])
+            # Other indexing reads the variable as usual.
+            self.assertArrayEqual(cf_var[1:], [1, 2])
+
+    def test_read_fails(self):
+        self.m_read.side_effect = lambda variables: [None] * len(variables)
+        with CFReader(self.filename) as cf:
+            _prefetch_small_variables(cf, [cf.cf_group["small"]])
+            self.assertEqual(self._prefetched(cf), set())
+            self.assertArrayEqual(cf.cf_group["y_small"][:], [0, 1, 2])
+
+    def test_load_cubes(self):
+        cubes = list(load_cubes(self.filename))
+        self.m_read.assert_called_once()
+        self.patch("iris.fileformats.netcdf.loader._prefetch_small_variables")
+        self.assertEqual(cubes, list(load_cubes(self.filename)))
+
+
+class Test_read_variables(tests.IrisTest):
+    def test_unreadable(self):
+        class Unreadable:
+            def __getitem__(self, keys):
+                raise OSError
+
+        result = _thread_safe_nc.read_variables([np.arange(3), Unreadable()])
+        self.assertArrayEqual(result[0], [0, 1, 2])
+        self.assertIsNone(result[1])
+
+
+if __name__ == "__main__":
+    tests.main()
@@ -0,0 +1,114 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the `iris.fileformats.netcdf.loader.profile_load` function."""
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests  # isort:skip
+
+import os
+import tempfile
+
+import iris
+from iris.exceptions import IgnoreCubeException
+from iris.fileformats.netcdf.loader import (
+    _PROFILE_STAGES,
+    LoadProfile,
+    load_cubes,
+    profile_load,
+)
+import iris.tests.stock as stock
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        handle, self.filename = tempfile.mkstemp(".nc")
+        os.close(handle)
+        self.addCleanup(os.remove, self.filename)
+        cube = stock.simple_4d_with_hybrid_height()
+        with iris.FUTURE.context(save_split_attrs=True):
+            iris.save(cube, self.filename)
+
+    def _load(self, callback=None):
+        return list(load_cubes(self.filename, callback=callback))
+
+    def test_stages(self):
+        with profile_load() as profile:
+            self._load()
+        self.assertIsInstance(profile, LoadProfile)
+        stages = {key: profile.counts[key] for key in profile.timings}
+        expected = {
+            (self.filename, None, "classify"): 1,
+            (self.filename, "air_temperature", "actions"): 1,
+            (self.filename, "air_temperature", "coordinates"): 7,
+            (self.filename, "air_temperature", "attributes"): 1,
+            (self.filename, "air_temperature", "callback"): 1,
+            (self.filename, "surface_altitude", "actions"): 1,
+            (self.filename, "surface_altitude", "coordinates"): 2,
+            (self.filename, "surface_altitude", "attributes"): 1,
+            (self.filename, "surface_altitude", "callback"): 1,
+        }
+        self.assertEqual(stages, expected)
+        self.assertTrue(all(seconds >= 0 for seconds in profile.timings.values()))
+
+    def test_callback_discards(self):
+        def callback(cube, field, filename):
+            raise IgnoreCubeException
+
+        with profile_load() as profile:
+            result = self._load(callback=callback)
+        self.assertEqual(result, [])
+        key = (self.filename, "air_temperature", "callback")
+        self.assertEqual(profile.counts[key], 1)
+
+    def test_eager_reads(self):
+        with profile_load() as profile:
+            self._load()
+        # The small coordinate variables are read eagerly, the others lazily.
+        self.assertEqual(profile.eager_reads, {self.filename: 5})
+        self.assertGreater(profile.eager_read_bytes[self.filename], 0)
+
+    def test_totals(self):
+        with profile_load() as profile:
+            self._load()
+        totals = profile.totals()
+        self.assertEqual(tuple(totals), _PROFILE_STAGES)
+        expected = sum(
+            seconds
+            for (_, _, stage), seconds in profile.timings.items()
+            if stage == "actions"
+        )
+        self.assertEqual(totals["actions"], expected)
+
+    def test_records(self):
+        with profile_load() as profile:
+            self._load()
+        records = profile.records()
+        self.assertEqual(len(records), len(profile.timings))
+        record = records[0]
+        self.assertEqual(
+            set(record), {"filename", "var_name", "stage", "seconds", "count"}
+        )
+        key = (record["filename"], record["var_name"], record["stage"])
+        self.assertEqual(record["seconds"], profile.timings[key])
+
+    def test_nested(self):
+        with profile_load() as outer:
+            with profile_load() as inner:
+                self._load()
+            self.assertEqual(outer.timings, {})
+            self._load()
+        self.assertEqual(set(outer.timings), set(inner.timings))
+
+    def test_disabled(self):
+        with profile_load() as profile:
+            pass
+        self._load()
+        self.assertEqual(profile.timings, {})
+        self.assertEqual(profile.eager_reads, {})
+
+
+if __name__ == "__main__":
+    tests.main()
@@ -0,0 +1,84 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the `iris.fileformats.pp._read_data_arrays` function."""
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests  # isort:skip
+
+import os
+import tempfile
+import threading
+from unittest import mock
+
+import numpy as np
+
+from iris.fileformats.pp import PPDataProxy, _read_data_arrays
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(".pp")
+        self.addCleanup(os.remove, self.path)
+        with os.fdopen(handle, "wb") as pp_file:
+            np.arange(12, dtype=">f4").tofile(pp_file)
+
+        # A fake mo_pack, which records the threads that it unpacks in.
+        self.threads = threads = []
+
+        def decompress(data_bytes, rows, cols, mdi):
+            threads.append(threading.current_thread().name)
+            return np.frombuffer(data_bytes, dtype=">f4")[::-1].reshape(rows, cols)
+
+        mo_pack = mock.Mock(decompress_wgdos=decompress, decompress_rle=decompress)
+        self.patch("iris.fileformats.pp.mo_pack", mo_pack)
+
+    def _proxies(self, lbpack):
+        return [
+            PPDataProxy((2, 3), np.dtype(">f4"), self.path, 24, 24, lbpack, None, 11.0),
+            PPDataProxy((3, 2), np.dtype(">f4"), self.path, 0, 24, lbpack, None, -1.0),
+        ]
+
+    def test_unpacked(self):
+        proxies = self._proxies(0)
+        first, second = _read_data_arrays(proxies)
+        self.assertMaskedArrayEqual(
+            first, np.ma.masked_equal(np.arange(6.0, 12.0).reshape(2, 3), 11)
+        )
+        self.assertArrayEqual(second, np.arange(6.0).reshape(3, 2))
+        self.assertEqual(second.dtype, np.dtype("f4"))
+        self.assertEqual(self.threads, [])
+
+    def test_packed(self):
+        self.patch("iris.fileformats.pp._UNPACK_MAX_WORKERS", 2)
+        for lbpack in (1, 4):
+            self.threads[:] = []
+            first, second = _read_data_arrays(self._proxies(lbpack))
+            self.assertArrayEqual(first, np.arange(11.0, 5.0, -1).reshape(2, 3))
+            self.assertArrayEqual(second, np.arange(5.0, -1.0, -1).reshape(3, 2))
+            self.assertEqual(len(self.threads), 2)
+            for name in self.threads:
+                self.assertTrue(name.startswith("iris-unpack"))
+
+    def test_packed__single_worker(self):
+        self.patch("iris.fileformats.pp._UNPACK_MAX_WORKERS", 1)
+        _read_data_arrays(self._proxies(1))
+        self.assertEqual(self.threads, [threading.current_thread().name] * 2)
+
+    def test_packed__single_field(self):
+        self.patch("iris.fileformats.pp._UNPACK_MAX_WORKERS", 2)
+        _read_data_arrays(self._proxies(1)[:1])
+        self.assertEqual(self.threads, [threading.current_thread().name])
+
+    def test_packed__error(self):
+        self.patch("iris.fileformats.pp._UNPACK_MAX_WORKERS", 2)
+        proxies = self._proxies(1)
+        proxies[1].shape = (4, 2)
+        with self.assertRaisesRegex(ValueError, "reshape"):
+            _read_data_arrays(proxies)
+
+
+if __name__ == "__main__":
+    tests.main()
@@ -0,0 +1,96 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the `iris.fileformats.pp._read_data_bytes` function."""
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests  # isort:skip
+
+import io
+import os
+import tempfile
+
+import numpy as np
+
+from iris.fileformats.pp import PPDataProxy, _read_data_bytes
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        # Two files, each containing the bytes 0 to 99.
+        self.paths = []
+        for _ in range(2):
+            handle, path = tempfile.mkstemp(".pp")
+            self.addCleanup(os.remove, path)
+            with os.fdopen(handle, "wb") as pp_file:
+                pp_file.write(bytes(range(100)))
+            self.paths.append(path)
+
+        # Record the (path, position, length) of every read.
+        self.reads = reads = []
+
+        class _File(io.FileIO):
+            def read(self, size=-1):
+                reads.append((self.name, self.tell(), size))
+                return super().read(size)
+
+        self.patch(
+            "iris.fileformats.pp.open", lambda path, mode: _File(path), create=True
+        )
+
+    def _proxy(self, offset, data_len, path=None):
+        if path is None:
+            path = self.paths[0]
+        return PPDataProxy(
+            (data_len,), np.dtype("u1"), path, offset, data_len, 0, None, 255
+        )
+
+    def _check(self, proxies, **kwargs):
+        result = _read_data_bytes(proxies, **kwargs)
+        expected = [
+            bytes(range(proxy.offset, proxy.offset + proxy.data_len))
+            for proxy in proxies
+        ]
+        self.assertEqual(result, expected)
+
+    def test_single(self):
+        self._check([self._proxy(10, 5)])
+        self.assertEqual(self.reads, [(self.paths[0], 10, 5)])
+
+    def test_adjacent(self):
+        self._check([self._proxy(20, 10), self._proxy(0, 10), self._proxy(10, 10)])
+        self.assertEqual(self.reads, [(self.paths[0], 0, 30)])
+
+    def test_gap(self):
+        proxies = [self._proxy(0, 10), self._proxy(15, 10), self._proxy(40, 10)]
+        self._check(proxies, max_gap=5)
+        self.assertEqual(self.reads, [(self.paths[0], 0, 25), (self.paths[0], 40, 10)])
+
+    def test_max_size(self):
+        proxies = [self._proxy(0, 10), self._proxy(10, 10), self._proxy(20, 10)]
+        self._check(proxies, max_size=20)
+        self.assertEqual(self.reads, [(self.paths[0], 0, 20), (self.paths[0], 20, 10)])
+
+    def test_overlapping(self):
+        self._check([self._proxy(0, 20), self._proxy(5, 10), self._proxy(5, 10)])
+        self.assertEqual(self.reads, [(self.paths[0], 0, 20)])
+
+    def test_files(self):
+        proxies = [
+            self._proxy(0, 10, path=self.paths[1]),
+            self._proxy(0, 10),
+            self._proxy(10, 10, path=self.paths[1]),
+        ]
+        self._check(proxies)
+        expected = sorted([(self.paths[0], 0, 10), (self.paths[1], 0, 20)])
+        self.assertEqual(sorted(self.reads), expected)
+
+    def test_empty(self):
+        self.assertEqual(_read_data_bytes([]), [])
+        self.assertEqual(self.reads, [])
+
+
+if __name__ == "__main__":
+    tests.main()
@@ -0,0 +1,145 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the :func:`iris.fileformats._prefetch.prefetch` function."""
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests  # isort:skip
+
+from concurrent.futures import wait
+import threading
+
+import dask.array as da
+import numpy as np
+
+from iris.fileformats import _prefetch, prefetch
+
+
+class _Proxy:
+    # A data proxy recording its reads.
+    def __init__(self, shape, fail=()):
+        self.shape = shape
+        self.ndim = len(shape)
+        self.dtype = np.dtype("f8")
+        self.data = np.arange(np.prod(shape), dtype=self.dtype).reshape(shape)
+        self.reads = []
+        self.fail = list(fail)
+        self.lock = threading.Lock()
+
+    def __getitem__(self, keys):
+        return _prefetch.read(self, keys)
+
+    def _read(self, keys):
+        with self.lock:
+            self.reads.append(_prefetch._chunk_bounds(keys, self.shape)[0])
+            if keys in self.fail:
+                self.fail.remove(keys)
+                raise OSError("failed read")
+        return self.data[keys]
+
+
+def _wait():
+    # Wait for all the background reads to complete.
+    wait([entry[0] for entry in _prefetch._PREFETCHER._buffer.values()])
+
+
+def _bounds(*starts):
+    return [((start, start + 1), (0, 4)) for start in starts]
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.proxy = _Proxy((6, 4))
+
+    def test_disabled(self):
+        result = self.proxy[0:1, :]
+        self.assertArrayEqual(result, self.proxy.data[0:1])
+        self.assertEqual(self.proxy.reads, _bounds(0))
+
+    def test_read_ahead(self):
+        with prefetch(n_chunks=2):
+            result = self.proxy[0:1, :]
+            _wait()
+            self.assertArrayEqual(result, self.proxy.data[0:1])
+            self.assertEqual(self.proxy.reads, _bounds(0, 1, 2))
+            result = self.proxy[1:2, :]
+            _wait()
+            self.assertArrayEqual(result, self.proxy.data[1:2])
+            # Only the chunk after the buffered ones is read.
+            self.assertEqual(self.proxy.reads, _bounds(0, 1, 2, 3))
+
+    def test_end(self):
+        with prefetch(n_chunks=4):
+            self.proxy[4:5, :]
+            _wait()
+        self.assertEqual(self.proxy.reads, _bounds(4, 5))
+
+    def test_integer_keys(self):
+        with prefetch(n_chunks=1):
+            self.proxy[0, :]
+            _wait()
+            result = self.proxy[1, :]
+            _wait()
+        self.assertArrayEqual(result, self.proxy.data[1])
+        self.assertEqual(self.proxy.reads, _bounds(0, 1, 2))
+
+    def test_requested(self):
+        # Chunks already requested are not read again.
+        with prefetch(n_chunks=1):
+            self.proxy[1:2, :]
+            _wait()
+            self.proxy[0:1, :]
+            _wait()
+        self.assertEqual(self.proxy.reads, _bounds(1, 2, 0))
+
+    def test_max_bytes(self):
+        # Only one chunk fits in the buffer.
+        with prefetch(n_chunks=3, max_bytes=32):
+            self.proxy[0:1, :]
+            _wait()
+            self.assertEqual(len(_prefetch._PREFETCHER._buffer), 1)
+            self.assertEqual(self.proxy.reads[0], _bounds(0)[0])
+            self.assertEqual(self.proxy.reads[-1], _bounds(3)[0])
+
+    def test_failed_read(self):
+        proxy = _Proxy((6, 4), fail=[(slice(1, 2), slice(0, 4))])
+        with prefetch(n_chunks=1):
+            proxy[0:1, :]
+            _wait()
+            result = proxy[1:2, :]
+            _wait()
+        self.assertArrayEqual(result, proxy.data[1:2])
+        self.assertEqual(proxy.reads, _bounds(0, 1, 1, 2))
+
+    def test_whole_array(self):
+        with prefetch(n_chunks=2):
+            self.proxy[:, :]
+        self.assertEqual(self.proxy.reads, [((0, 6), (0, 4))])
+
+    def test_dask(self):
+        array = da.from_array(self.proxy, chunks=(1, 4), asarray=False)
+        with prefetch(n_chunks=2):
+            result = array.compute()
+        self.assertArrayEqual(result, self.proxy.data)
+        # N.B. ignore any reads of empty sections, made by dask.
+        reads = [bounds for bounds in self.proxy.reads if bounds is not None]
+        self.assertEqual(sorted(reads), _bounds(*range(6)))
+
+    def test_context(self):
+        with prefetch():
+            prefetcher = _prefetch._PREFETCHER
+            with prefetch():
+                self.assertIsNot(_prefetch._PREFETCHER, prefetcher)
+            self.assertIs(_prefetch._PREFETCHER, prefetcher)
+        self.assertIsNone(_prefetch._PREFETCHER)
+
+    def test_invalid(self):
+        with self.assertRaisesRegex(ValueError, "'n_chunks' should be at least 1"):
+            with prefetch(n_chunks=0):
+                pass
+
+
+if __name__ == "__main__":
+    tests.main()
@@ -11,11 +11,17 @@
 # before importing anything else.
 import iris.tests as tests  # isort:skip
 
+import os
+import tempfile
+
 from cftime import datetime
+import dask.config
 import numpy as np
+import numpy.ma as ma
 
 from iris._lazy_data import as_lazy_data
 import iris.fileformats.pp
+from iris.fileformats.pp import PPDataProxy, _iter_data_bytes
 from iris.fileformats.um._fast_load_structured_fields import BasicFieldCollation
 
 
@@ -93,6 +99,66 @@ class Test_data(tests.IrisTest):
         self.assertArrayEqual(result, expected)
 
 
+class Test_data__proxies(tests.IrisTest):
+    def setUp(self):
+        # Write the field payloads, each of value 0 to 5, to a file.
+        handle, path = tempfile.mkstemp(".pp")
+        self.addCleanup(os.remove, path)
+        with os.fdopen(handle, "wb") as pp_file:
+            for value in range(6):
+                np.full((10, 10), value, dtype=">f4").tofile(pp_file)
+        # The fields are in the file order, and an MDI of 0 masks field 0.
+        self.fields = []
+        dates = [(2013, 2000), (2014, 2000), (2015, 2000)]
+        dates += [(2013, 2001), (2014, 2001), (2015, 2001)]
+        for value, (lbyr, lbyrd) in enumerate(dates):
+            field = _make_field(lbyr=lbyr, lbyrd=lbyrd, data=value)
+            field._data_proxy = PPDataProxy(
+                (10, 10), np.dtype(">f4"), path, value * 400, 400, 0, None, 0.0
+            )
+            self.fields.append(field)
+        self.collation = BasicFieldCollation(self.fields)
+        self.read = self.patch(
+            "iris.fileformats.pp._iter_data_bytes", wraps=_iter_data_bytes
+        )
+
+    def test_values(self):
+        result = self.collation.data
+        self.assertEqual(result.shape, (2, 3, 10, 10))
+        self.assertEqual(result.dtype, np.dtype("f4"))
+        expected = ma.masked_equal([[0, 1, 2], [3, 4, 5]], 0)
+        self.assertMaskedArrayEqual(result[:, :, 0, 0].compute(), expected)
+
+    def test_single_chunk(self):
+        result = self.collation.data
+        self.assertEqual(result.numblocks, (1, 1, 1, 1))
+        self.assertEqual(len(result.dask), 2)
+        result.compute()
+        self.read.assert_called_once()
+
+    def test_contiguous_chunks(self):
+        # Room for a little over 2 fields per chunk.
+        with dask.config.set({"array.chunk-size": "1KiB"}):
+            result = self.collation.data
+        self.assertEqual(result.chunks, ((1, 1), (2, 1), (10,), (10,)))
+
+    def test_partial_read(self):
+        with dask.config.set({"array.chunk-size": "1KiB"}):
+            result = self.collation.data
+        result[1, 2].compute()
+        self.read.assert_called_once()
+        proxies = self.read.call_args[0][0]
+        self.assertEqual(proxies, [self.fields[5]._data_proxy])
+
+    def test_missing_proxy(self):
+        self.fields[2].data = self.fields[2].core_data()
+        self.assertIsNone(self.fields[2]._data_proxy)
+        result = BasicFieldCollation(self.fields).data
+        self.assertEqual(result.numblocks, (2, 3, 1, 1))
+        self.assertArrayEqual(result[:, :, 0, 0], [[0, 1, 2], [3, 4, 5]])
+        self.read.assert_not_called()
+
+
 class Test_element_arrays_and_dims(tests.IrisTest):
     def test_single_field(self):
         field = _make_field(2013)
@@ -155,6 +155,51 @@ class Test__optimised_chunks(tests.IrisTest):
             chunks = _optimum_chunksize((1, 8), shape=(400, 20), dtype=np.dtype("f4"))
             self.assertEqual(chunks, (1, 4))
 
+    def test_access_spatial(self):
+        # The same as the default.
+        for chunks in [(1, 1, 50, 50), (4, 10, 50, 50)]:
+            result = _optimum_chunksize(
+                chunks, shape=(4, 10, 50, 50), limit=5000, access="spatial"
+            )
+            self.assertEqual(
+                result, _optimum_chunksize(chunks, shape=(4, 10, 50, 50), limit=5000)
+            )
+            self.assertEqual(result, (1, 1, 25, 50))
+
+    def test_access_timeseries(self):
+        # Long in the outer dims, multiplying the input chunks.
+        result = _optimum_chunksize(
+            (1, 1, 50, 50), shape=(4, 10, 50, 50), limit=50000, access="timeseries"
+        )
+        self.assertEqual(result, (4, 1, 50, 50))
+        # Split the inner dims first.
+        result = _optimum_chunksize(
+            (4, 10, 50, 50), shape=(4, 10, 50, 50), limit=50000, access="timeseries"
+        )
+        self.assertEqual(result, (4, 10, 50, 6))
+
+    def test_access_balanced(self):
+        result = _optimum_chunksize(
+            (4, 10, 50, 50), shape=(4, 10, 50, 50), limit=5000, access="balanced"
+        )
+        self.assertEqual(result, (1, 3, 19, 19))
+
+    def test_access_dims_fixed(self):
+        for access in ("timeseries", "spatial", "balanced"):
+            result = _optimum_chunksize(
+                (4, 10, 50, 50),
+                shape=(4, 10, 50, 50),
+                limit=5000,
+                dims_fixed=(False, False, True, False),
+                access=access,
+            )
+            self.assertEqual(result[2], 50)
+            self.assertLessEqual(np.prod(result) * 4, 5000)
+
+    def test_access_invalid(self):
+        with self.assertRaisesRegex(ValueError, "Unknown chunk access pattern"):
+            _optimum_chunksize((4, 10), shape=(4, 10), access="columns")
+
     def test_default_chunks_limiting(self):
         # Check that chunking is still controlled when no specific 'chunks'
         # is passed.
@@ -170,6 +215,7 @@ class Test__optimised_chunks(tests.IrisTest):
                     shape=test_shape,
                     dtype=np.dtype("f4"),
                     dims_fixed=None,
+                    access=None,
                 )
             ],
         )
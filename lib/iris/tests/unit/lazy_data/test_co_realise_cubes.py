@@ -8,9 +8,11 @@
 # importing anything else.
 import iris.tests as tests  # isort:skip
 
+import dask.array as da
 import numpy as np
 
 from iris._lazy_data import as_lazy_data, co_realise_cubes
+from iris.coords import AncillaryVariable, AuxCoord, CellMeasure
 from iris.cube import Cube
 
 
@@ -76,6 +78,63 @@ class Test_co_realise_cubes(tests.IrisTest):
         # see dask.array.utils.meta_from_array).
         self.assertEqual(wrapped_array.access_count, 1)
 
+    def _cube(self, wrapped_array):
+        # A cube with a lazy coord, cell measure and ancillary variable, all
+        # derived from the same source array.
+        source = as_lazy_data(wrapped_array, meta=wrapped_array.meta)
+        cube = Cube(source + 1)
+        bounds = da.stack([source, source + 4], axis=-1)
+        coord = AuxCoord(source + 2, bounds=bounds, long_name="foo")
+        cube.add_aux_coord(coord, 0)
+        cube.add_cell_measure(
+            CellMeasure(source + 3, long_name="area", measure="area"), 0
+        )
+        cube.add_ancillary_variable(AncillaryVariable(source + 4), 0)
+        return cube
+
+    def test_metadata(self):
+        wrapped_array = ArrayAccessCounter(np.arange(3.0))
+        cube = self._cube(wrapped_array)
+        co_realise_cubes(cube, metadata=True)
+        self.assertEqual(wrapped_array.access_count, 1)
+        self.assertFalse(cube.has_lazy_data())
+        self.assertFalse(cube.coord("foo").has_lazy_points())
+        self.assertFalse(cube.coord("foo").has_lazy_bounds())
+        self.assertFalse(cube.cell_measure("area").has_lazy_data())
+        self.assertFalse(cube.ancillary_variables()[0].has_lazy_data())
+        self.assertArrayEqual(cube.coord("foo").points, [2, 3, 4])
+        self.assertArrayEqual(cube.coord("foo").bounds, [[0, 4], [1, 5], [2, 6]])
+        self.assertArrayEqual(cube.cell_measure("area").data, [3, 4, 5])
+        self.assertArrayEqual(cube.ancillary_variables()[0].data, [4, 5, 6])
+
+    def test_metadata__default(self):
+        cube = self._cube(ArrayAccessCounter(np.arange(3.0)))
+        co_realise_cubes(cube)
+        self.assertFalse(cube.has_lazy_data())
+        self.assertTrue(cube.coord("foo").has_lazy_points())
+        self.assertTrue(cube.cell_measure("area").has_lazy_data())
+
+    def test_shared(self):
+        # The same lazy array is computed once, but results are not shared.
+        wrapped_array = ArrayAccessCounter(np.arange(3.0))
+        cube_a = self._cube(wrapped_array)
+        cube_b = cube_a.copy()
+        co_realise_cubes(cube_a, cube_b, metadata=True)
+        self.assertEqual(wrapped_array.access_count, 1)
+        self.assertEqual(cube_a, cube_b)
+        self.assertIsNot(cube_a.data, cube_b.data)
+        self.assertFalse(np.shares_memory(cube_a.data, cube_b.data))
+
+    def test_max_bytes(self):
+        wrapped_array = ArrayAccessCounter(np.arange(3.0))
+        cube = self._cube(wrapped_array)
+        # Room for 2 of the 3-element arrays per calculation.
+        co_realise_cubes(cube, metadata=True, max_bytes=48)
+        # The data+points, bounds, and cell-measure+ancil are separate.
+        self.assertEqual(wrapped_array.access_count, 3)
+        self.assertFalse(cube.coord("foo").has_lazy_bounds())
+        self.assertArrayEqual(cube.ancillary_variables()[0].data, [4, 5, 6])
+
 
 if __name__ == "__main__":
     tests.main()
@@ -766,6 +766,82 @@ class Test_MeshCoord__dataviews(tests.IrisTest):
             # Note: not all are actual Coords, so can't use 'has_lazy_points'.
             self.assertTrue(is_lazy_data(coord._core_values()))
 
+    def test_bounds_cached(self):
+        # Check that the derived bounds are shared between MeshCoords.
+        calculate = self.patch(
+            "iris.mesh.MeshXY._calculate_location_bounds",
+            wraps=MeshXY._calculate_location_bounds,
+        )
+        # N.B. the bounds were already calculated for the test MeshCoord.
+        self.mesh._location_bounds("face", "x")
+        meshcoord = self.meshcoord.copy()
+        self.mesh._location_bounds("face", "x")
+        calculate.assert_not_called()
+        self._check_expected_bounds_values()
+        self.meshcoord = meshcoord
+        self._check_expected_bounds_values()
+
+    def test_bounds_cached__copy(self):
+        # Check that modifying the bounds of one MeshCoord does not affect
+        # the cached bounds.
+        self.meshcoord.bounds[0, 0] = -1
+        meshcoord = MeshCoord(mesh=self.mesh, location="face", axis="x")
+        self.assertIsNot(meshcoord.bounds, self.meshcoord.bounds)
+        self.assertNotEqual(meshcoord.bounds[0, 0], -1)
+        self.meshcoord = meshcoord
+        self._check_expected_bounds_values()
+
+    def test_bounds_cached__lazy(self):
+        self._make_test_meshcoord(lazy_sources=True)
+        meshcoord = self.meshcoord.copy()
+        self.assertEqual(
+            meshcoord.core_bounds().name, self.meshcoord.core_bounds().name
+        )
+
+    def test_bounds_cache_node_coords_replaced(self):
+        # Check that replacing the node coords invalidates the cached bounds.
+        node_x = self.mesh.coord(location="node", axis="x")
+        self.mesh.add_coords(node_x=node_x.copy(points=node_x.points + 1.0))
+        meshcoord = MeshCoord(mesh=self.mesh, location="face", axis="x")
+        expected = self.NODECOORDS_BASENUM + 1.0 + self.face_nodes_array
+        self.assertMaskedArrayAlmostEqual(meshcoord.bounds, expected)
+
+    def test_bounds_cache_node_points_replaced(self):
+        # Check that replacing the node points invalidates the cached bounds.
+        node_x = self.mesh.coord(location="node", axis="x")
+        node_x.points = node_x.points + 1.0
+        meshcoord = MeshCoord(mesh=self.mesh, location="face", axis="x")
+        expected = self.NODECOORDS_BASENUM + 1.0 + self.face_nodes_array
+        self.assertMaskedArrayAlmostEqual(meshcoord.bounds, expected)
+
+    def test_bounds_cache_node_points_modified(self):
+        # Check that modifying the node points in-place invalidates the
+        # cached bounds.
+        node_x = self.mesh.coord(location="node", axis="x")
+        self.mesh._location_bounds("face", "x")
+        node_x.points[:] = node_x.points + 1.0
+        meshcoord = MeshCoord(mesh=self.mesh, location="face", axis="x")
+        expected = self.NODECOORDS_BASENUM + 1.0 + self.face_nodes_array
+        self.assertMaskedArrayAlmostEqual(meshcoord.bounds, expected)
+
+    def test_bounds_cache_connectivity_modified(self):
+        # Check that modifying the connectivity in-place invalidates the
+        # cached bounds.
+        face_nodes = self.mesh.face_node_connectivity
+        self.mesh._location_bounds("face", "x")
+        face_nodes.indices[:] = face_nodes.indices[::-1]
+        meshcoord = MeshCoord(mesh=self.mesh, location="face", axis="x")
+        expected = self.NODECOORDS_BASENUM + self.face_nodes_array[::-1]
+        self.assertMaskedArrayAlmostEqual(meshcoord.bounds, expected)
+
+    def test_bounds_cache_connectivity_replaced(self):
+        # Check that replacing the connectivity invalidates the cached bounds.
+        face_nodes = self.mesh.face_node_connectivity
+        self.mesh.add_connectivities(face_nodes.copy(face_nodes.indices[::-1]))
+        meshcoord = MeshCoord(mesh=self.mesh, location="face", axis="x")
+        expected = self.NODECOORDS_BASENUM + self.face_nodes_array[::-1]
+        self.assertMaskedArrayAlmostEqual(meshcoord.bounds, expected)
+
     def _check_bounds_bad_index_values(self, lazy):
         facenodes_modify = {
             # nothing wrong with this one
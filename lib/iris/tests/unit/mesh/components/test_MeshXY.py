@@ -1291,5 +1291,134 @@ class InitValidation(TestMeshCommon):
         )
 
 
+class Test_spatial_index(tests.IrisTest):
+    # A global mesh of 4 x 3 quadrilateral faces, with cyclic longitudes.
+    # Face (i_x, i_y) spans longitudes [-180 + 90 * i_x, -90 + 90 * i_x] and
+    # latitudes [-90 + 60 * i_y, -30 + 60 * i_y], and has index 4 * i_y + i_x.
+    def setUp(self):
+        node_x, node_y = np.meshgrid(np.arange(-180, 180, 90), np.arange(-90, 91, 60))
+        node_inds = np.arange(16).reshape((4, 4))
+        face_node = np.stack(
+            [
+                node_inds[:-1, :],
+                np.roll(node_inds, -1, axis=1)[:-1, :],
+                np.roll(node_inds, -1, axis=1)[1:, :],
+                node_inds[1:, :],
+            ],
+            axis=-1,
+        ).reshape((12, 4))
+        self.node_lon = AuxCoord(
+            node_x.flatten(), standard_name="longitude", units="degrees"
+        )
+        self.node_lat = AuxCoord(
+            node_y.flatten(), standard_name="latitude", units="degrees"
+        )
+        self.mesh = components.MeshXY(
+            topology_dimension=2,
+            node_coords_and_axes=((self.node_lon, "x"), (self.node_lat, "y")),
+            connectivities=components.Connectivity(
+                face_node, cf_role="face_node_connectivity"
+            ),
+        )
+
+    def test_locate_points(self):
+        lons = np.array([-135, -45, 45, 135])
+        lats = np.array([-60, 0, 60])
+        result = self.mesh.locate_points(*np.meshgrid(lons, lats))
+        self.assertArrayEqual(result, np.arange(12).reshape((3, 4)))
+
+    def test_locate_points__cyclic(self):
+        result = self.mesh.locate_points([170, -190, 190, 530], [10, 10, 10, 10])
+        self.assertArrayEqual(result, [7, 7, 4, 7])
+
+    def test_locate_points__outside(self):
+        self.mesh.node_coords.node_x.rename("projection_x_coordinate")
+        self.mesh.node_coords.node_x.units = "m"
+        result = self.mesh.locate_points([-135, -200, 175], [0, 0, 0])
+        self.assertArrayEqual(result, [4, -1, -1])
+
+    def test_locate_points__missing_nodes(self):
+        # Make the first face a triangle, by removing its last node.
+        indices = self.mesh.face_node_connectivity.indices.copy()
+        indices = np.ma.masked_array(indices)
+        indices[0, 3] = np.ma.masked
+        self.mesh.add_connectivities(
+            components.Connectivity(indices, cf_role="face_node_connectivity")
+        )
+        result = self.mesh.locate_points([-100, -170], [-80, -40])
+        self.assertArrayEqual(result, [0, -1])
+
+    def test_locate_points__lazy(self):
+        self.mesh.node_coords.node_x.points = self.node_lon.lazy_points()
+        result = self.mesh.locate_points([-135], [60])
+        self.assertArrayEqual(result, [8])
+
+    def test_locate_points__no_faces(self):
+        mesh = components.MeshXY(
+            topology_dimension=1,
+            node_coords_and_axes=((self.node_lon, "x"), (self.node_lat, "y")),
+            connectivities=components.Connectivity(
+                [[0, 1], [1, 2]], cf_role="edge_node_connectivity"
+            ),
+        )
+        msg = "The mesh has no face_node_connectivity"
+        with self.assertRaisesRegex(ValueError, msg):
+            mesh.locate_points([0], [0])
+
+    def test_locate_region(self):
+        result = self.mesh.locate_region((-10, 10), (-10, 10))
+        self.assertArrayEqual(result, [5, 6])
+
+    def test_locate_region__cyclic(self):
+        result = self.mesh.locate_region((170, 190), (40, 50))
+        self.assertArrayEqual(result, [8, 11])
+        result = self.mesh.locate_region((170, -170), (40, 50))
+        self.assertArrayEqual(result, [8, 11])
+        result = self.mesh.locate_region((-180, 180), (40, 50))
+        self.assertArrayEqual(result, [8, 9, 10, 11])
+
+    def test_locate_region__nodes(self):
+        result = self.mesh.locate_region((-100, 0), (-30, 30), location="node")
+        self.assertArrayEqual(result, [5, 6, 9, 10])
+
+    def test_locate_region__bad_location(self):
+        msg = "Expected 'location' to be one of"
+        with self.assertRaisesRegex(ValueError, msg):
+            self.mesh.locate_region((0, 1), (0, 1), location="volume")
+
+    def test_cached(self):
+        index = self.mesh._spatial_index("face")
+        self.assertIs(self.mesh._spatial_index("face"), index)
+
+    def test_cache_node_points_replaced(self):
+        index = self.mesh._spatial_index("face")
+        self.mesh.node_coords.node_y.points = self.node_lat.points * 0.5
+        self.assertIsNot(self.mesh._spatial_index("face"), index)
+        result = self.mesh.locate_points([-135], [40])
+        self.assertArrayEqual(result, [8])
+
+    def test_cache_node_points_modified(self):
+        index = self.mesh._spatial_index("face")
+        self.mesh.node_coords.node_y.points[:] = self.node_lat.points * 0.5
+        self.assertIsNot(self.mesh._spatial_index("face"), index)
+        result = self.mesh.locate_points([-135], [40])
+        self.assertArrayEqual(result, [8])
+
+    def test_cache_connectivity_modified(self):
+        index = self.mesh._spatial_index("face")
+        indices = self.mesh.face_node_connectivity.indices
+        indices[:] = indices[::-1]
+        self.assertIsNot(self.mesh._spatial_index("face"), index)
+        result = self.mesh.locate_points([-135], [-60])
+        self.assertArrayEqual(result, [11])
+
+    def test_cache_node_units_replaced(self):
+        index = self.mesh._spatial_index("face")
+        self.mesh.node_coords.node_x.units = "m"
+        self.assertIsNot(self.mesh._spatial_index("face"), index)
+        result = self.mesh.locate_points([170], [10])
+        self.assertArrayEqual(result, [-1])
+
+
 if __name__ == "__main__":
     tests.main()
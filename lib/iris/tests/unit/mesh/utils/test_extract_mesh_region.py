@@ -0,0 +1,71 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for :func:`iris.mesh.utils.extract_mesh_region`."""
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests  # isort:skip
+
+import numpy as np
+
+from iris.mesh.utils import extract_mesh_region, recombine_submeshes
+from iris.tests.stock.mesh import sample_mesh_cube
+
+
+class TestExtractMeshRegion(tests.IrisTest):
+    def setUp(self):
+        # N.B. the sample mesh faces #0, #1 and #2 have nodes #0-3, #4-7 and
+        # #8-11, with x values of 1100 + i_node and y values of 1200 + i_node.
+        self.mesh_cube = sample_mesh_cube()
+        self.mesh_cube.data = np.arange(6.0).reshape((2, 3))
+
+    def test_basic(self):
+        result = extract_mesh_region(self.mesh_cube, (1104, 1107.5), (1204, 1207.5))
+        self.assertEqual(result.shape, (2, 1))
+        self.assertArrayEqual(result.data, [[1.0], [4.0]])
+        self.assertArrayEqual(result.coord("i_mesh_index").points, [1])
+
+    def test_multiple(self):
+        result = extract_mesh_region(self.mesh_cube, (1102.5, 1109), (1200, 1300))
+        self.assertArrayEqual(result.coord("i_mesh_index").points, [0, 1, 2])
+        result = extract_mesh_region(self.mesh_cube, (1106.5, 1109), (1200, 1300))
+        self.assertArrayEqual(result.coord("i_mesh_index").points, [1, 2])
+
+    def test_cyclic(self):
+        # N.B. the x values are longitudes : 1104 is equivalent to 24.
+        result = extract_mesh_region(self.mesh_cube, (24, 27.5), (1204, 1207.5))
+        self.assertArrayEqual(result.coord("i_mesh_index").points, [1])
+
+    def test_none(self):
+        result = extract_mesh_region(self.mesh_cube, (1104, 1107.5), (0, 10))
+        self.assertIsNone(result)
+
+    def test_existing_index_coord(self):
+        result = extract_mesh_region(
+            self.mesh_cube,
+            (1104, 1107.5),
+            (1204, 1207.5),
+            index_coord_name="i_mesh_face",
+        )
+        self.assertEqual(len(result.coords("i_mesh_face")), 1)
+        self.assertEqual(result.coords("i_mesh_index"), [])
+
+    def test_recombine(self):
+        region_cube = extract_mesh_region(
+            self.mesh_cube, (1104, 1107.5), (1204, 1207.5)
+        )
+        result = recombine_submeshes(self.mesh_cube, region_cube)
+        expected = np.ma.masked_array(self.mesh_cube.data, [[1, 0, 1], [1, 0, 1]])
+        self.assertMaskedArrayEqual(result.data, expected)
+
+    def test_nomesh(self):
+        cube = sample_mesh_cube(nomesh_faces=3)
+        msg = "'mesh_cube' has no \".mesh\""
+        with self.assertRaisesRegex(ValueError, msg):
+            extract_mesh_region(cube, (0, 1), (0, 1))
+
+
+if __name__ == "__main__":
+    tests.main()
@@ -9,6 +9,7 @@
 import iris.tests as tests  # isort:skip
 
 import dask.array as da
+from dask.optimization import cull
 import numpy as np
 
 from iris.coords import AuxCoord
@@ -98,6 +99,44 @@ class TestRecombine__data(tests.IrisTest):
         # Check that the result chunking matches the input.
         self.assertEqual(result.lazy_data().chunksize, (3, 2, 20))
 
+    def test_chunking_mesh_dim(self):
+        # Check operation when the mesh dimension is also chunked.
+        common_test_setup(self, data_chunks=(2, 7))
+        result = recombine_submeshes(self.mesh_cube, self.region_cubes)
+        self.assertEqual(result.lazy_data().chunks, ((2,), (7, 7, 6)))
+        self.assertMaskedArrayEqual(result.data, self.expected_result)
+
+    def test_single_operation(self):
+        # Check that all the regions are combined in a single graph layer.
+        result = recombine_submeshes(self.mesh_cube, self.region_cubes)
+        result_array = result.lazy_data()
+        combine_layers = [
+            name
+            for name in result_array.__dask_graph__().layers
+            if name.startswith("combine_regions")
+        ]
+        self.assertEqual(len(combine_layers), 1)
+
+    def test_block_dependencies(self):
+        # Check that each result block only uses the regions which it needs.
+        common_test_setup(self, data_chunks=(2, 5))
+        for cube in self.region_cubes:
+            cube.data = cube.lazy_data().rechunk((2, 1))
+        result = recombine_submeshes(self.mesh_cube, self.region_cubes)
+        result_array = result.lazy_data()
+        graph = dict(result_array.__dask_graph__())
+        region_names = [cube.lazy_data().name for cube in self.region_cubes]
+        # The regions used by each block of the result.
+        expected = [{0}, {1, 3}, {2}, {3}]
+        for i_block, i_regions in enumerate(expected):
+            block_graph, _ = cull(graph, [(result_array.name, 0, i_block)])
+            names = {key[0] for key in block_graph if isinstance(key, tuple)}
+            i_used = {
+                i_region for i_region, name in enumerate(region_names) if name in names
+            }
+            self.assertEqual(i_used, i_regions)
+        self.assertMaskedArrayEqual(result.data, self.expected_result)
+
     def test_single_region(self):
         region = self.region_cubes[1]
         result = recombine_submeshes(self.mesh_cube, [region])
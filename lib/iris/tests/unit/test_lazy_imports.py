@@ -0,0 +1,97 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the lazy imports of :mod:`iris` and :mod:`iris.fileformats`."""
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests  # isort:skip
+
+import subprocess
+import sys
+
+import iris
+import iris.fileformats
+
+
+def imported_modules(code):
+    # The modules imported by running some code in a fresh interpreter.
+    code = f"import sys; {code}; print(' '.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    )
+    return set(result.stdout.split())
+
+
+class Test_iris(tests.IrisTest):
+    def test_import(self):
+        modules = imported_modules("import iris")
+        for name in ("numpy", "dask", "cf_units", "iris.cube", "iris._constraints"):
+            self.assertNotIn(name, modules)
+
+    def test_constraint(self):
+        from iris._constraints import Constraint
+
+        self.assertIs(iris.Constraint, Constraint)
+
+    def test_submodule(self):
+        modules = imported_modules("import iris; iris.exceptions.IrisError")
+        self.assertIn("iris.exceptions", modules)
+
+    def test_submodule_not_imported(self):
+        code = (
+            "import iris; assert not (hasattr(iris, 'plot') or hasattr(iris, 'tests'))"
+        )
+        modules = imported_modules(code)
+        for name in ("iris.plot", "iris.tests", "matplotlib"):
+            self.assertNotIn(name, modules)
+
+    def test_missing(self):
+        msg = "module 'iris' has no attribute 'nonexistent'"
+        with self.assertRaisesRegex(AttributeError, msg):
+            iris.nonexistent
+
+    def test_dir(self):
+        self.assertIn("Constraint", dir(iris))
+
+
+class Test_fileformats(tests.IrisTest):
+    def test_import(self):
+        modules = imported_modules("import iris.fileformats")
+        for name in (
+            "numpy",
+            "dask",
+            "iris.fileformats._prefetch",
+            "iris.fileformats.netcdf",
+            "iris.fileformats.pp",
+            "iris.cube",
+        ):
+            self.assertNotIn(name, modules)
+
+    def test_prefetch(self):
+        from iris.fileformats._prefetch import prefetch
+
+        self.assertIs(iris.fileformats.prefetch, prefetch)
+
+    def test_format_agent(self):
+        modules = imported_modules(
+            "import iris.fileformats; iris.fileformats.FORMAT_AGENT"
+        )
+        self.assertIn("iris.fileformats.netcdf", modules)
+        self.assertIs(iris.fileformats.FORMAT_AGENT, iris.fileformats.FORMAT_AGENT)
+        self.assertIn("NetCDF", str(iris.fileformats.FORMAT_AGENT))
+
+    def test_submodule(self):
+        from iris.fileformats import pp
+
+        self.assertIs(iris.fileformats.pp, pp)
+
+    def test_missing(self):
+        msg = "module 'iris.fileformats' has no attribute 'nonexistent'"
+        with self.assertRaisesRegex(AttributeError, msg):
+            iris.fileformats.nonexistent
+
+
+if __name__ == "__main__":
+    tests.main()
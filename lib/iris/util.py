@@ -859,6 +859,45 @@ def _slice_data_with_keys(data, keys):
     return dims_mapping, data
 
 
+def _read_only_view(data, ndmin=0):
+    """Return a read-only view of a real array, or a lazy array unchanged.
+
+    Parameters
+    ----------
+    data : array-like
+        The array to view.  A masked array is viewed with a read-only view of
+        its mask.
+    ndmin : int, default=0
+        The minimum number of dimensions of the result, as for
+        :func:`numpy.array`.
+
+    Returns
+    -------
+    array-like
+        The view, which shares the memory of ``data``, and cannot be modified
+        in place.
+
+    """
+    n_missing = ndmin - data.ndim
+    if n_missing > 0:
+        data = data.reshape((1,) * n_missing + data.shape)
+    if not is_lazy_data(data):
+        if ma.isMaskedArray(data):
+            mask = ma.getmask(data)
+            if mask is not ma.nomask:
+                mask = _read_only_view(mask)
+            data = ma.MaskedArray(
+                _read_only_view(ma.getdata(data)),
+                mask=mask,
+                fill_value=data.fill_value,
+                copy=False,
+            )
+        else:
+            data = np.asarray(data).view()
+        data.flags.writeable = False
+    return data
+
+
 def _wrap_function_for_method(function, docstring=None):
     """Return a wrapper function modified to be suitable for use as a method.
 